@@ -1,211 +1,158 @@
-#!/usr/bin/env python3
-"""
-Import Parameters Generator
-依存関係のあるテンプレートにインポートパラメータを追加
-"""
-
-from pathlib import Path
-
-def generate_import_parameters():
-    """各テンプレート用のインポートパラメータを生成"""
-    
-    # EC2テンプレート用のインポートパラメータ
-    ec2_import_parameters = """
-  # Cross-Stack Import Parameters
-  ImportVPCId:
-    Type: String
-    Description: Import VPC ID from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-VPC-ID'
-
-  ImportPrivateSubnets:
-    Type: String
-    Description: Import Private Subnets from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-PrivateSubnets'
-
-  ImportPublicSubnets:
-    Type: String
-    Description: Import Public Subnets from networking-vpc stack (optional)
-    Default: ''
-
-  ImportExecutionRoleArn:
-    Type: String
-    Description: Import Execution Role ARN from foundation-iam stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-execution-role-arn'
-
-  ImportInstanceProfileArn:
-    Type: String
-    Description: Import Instance Profile ARN from foundation-iam stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-instance-profile-arn'
-
-  ImportApplicationKMSKeyArn:
-    Type: String
-    Description: Import Application KMS Key ARN from foundation-kms stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-application-kms-key-arn'
-"""
-
-    # Lambda テンプレート用のインポートパラメータ
-    lambda_import_parameters = """
-  # Cross-Stack Import Parameters
-  ImportVPCId:
-    Type: String
-    Description: Import VPC ID from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-VPC-ID'
-
-  ImportPrivateSubnets:
-    Type: String
-    Description: Import Private Subnets from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-PrivateSubnets'
-
-  ImportExecutionRoleArn:
-    Type: String
-    Description: Import Execution Role ARN from foundation-iam stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-execution-role-arn'
-
-  ImportApplicationKMSKeyArn:
-    Type: String
-    Description: Import Application KMS Key ARN from foundation-kms stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-application-kms-key-arn'
-"""
-
-    # ELB テンプレート用のインポートパラメータ
-    elb_import_parameters = """
-  # Cross-Stack Import Parameters
-  ImportVPCId:
-    Type: String
-    Description: Import VPC ID from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-VPC-ID'
-
-  ImportPublicSubnets:
-    Type: String
-    Description: Import Public Subnets from networking-vpc stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-PublicSubnets'
-
-  ImportAutoScalingGroupName:
-    Type: String
-    Description: Import Auto Scaling Group Name from compute-ec2 stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-ASG-Name'
-
-  ImportEC2SecurityGroupId:
-    Type: String
-    Description: Import EC2 Security Group ID from compute-ec2 stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-EC2-SG-Id'
-"""
-
-    # API Gateway テンプレート用のインポートパラメータ
-    api_gateway_import_parameters = """
-  # Cross-Stack Import Parameters
-  ImportLambdaFunctionArn:
-    Type: String
-    Description: Import Lambda Function ARN from compute-lambda stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-Lambda-Function-Arn'
-
-  ImportExecutionRoleArn:
-    Type: String
-    Description: Import Execution Role ARN from foundation-iam stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-execution-role-arn'
-
-  ImportApplicationLogGroupName:
-    Type: String
-    Description: Import Application Log Group Name from integration-cloudwatch stack
-    Default: !ImportValue
-      Fn::Sub: '${ProjectName}-${Environment}-application-log-group'
-"""
-
-    return {
-        'ec2': ec2_import_parameters,
-        'lambda': lambda_import_parameters,
-        'elb': elb_import_parameters,
-        'api-gateway': api_gateway_import_parameters
-    }
-
-def add_parameters_to_template(template_path: str, import_parameters: str):
-    """テンプレートファイルにパラメータを追加"""
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Parametersセクションを見つけて追加
-    if 'Parameters:' in content:
-        # Parametersセクションの後に追加
-        lines = content.split('\n')
-        new_lines = []
-        parameters_found = False
-        
-        for line in lines:
-            new_lines.append(line)
-            if line.strip() == 'Parameters:' and not parameters_found:
-                # インポートパラメータを追加
-                for param_line in import_parameters.split('\n'):
-                    new_lines.append(param_line)
-                parameters_found = True
-        
-        content = '\n'.join(new_lines)
-    else:
-        # Parametersセクションが存在しない場合は新規作成
-        # AWSTemplateFormatVersionの後に追加
-        lines = content.split('\n')
-        new_lines = []
-        
-        for i, line in enumerate(lines):
-            new_lines.append(line)
-            if line.startswith('Description:'):
-                # Descriptionの後にParametersセクションを追加
-                new_lines.append('')
-                new_lines.append('Parameters:')
-                for param_line in import_parameters.split('\n'):
-                    new_lines.append(param_line)
-                new_lines.append('')
-                break
-        
-        # 残りの行を追加
-        new_lines.extend(lines[i+1:])
-        content = '\n'.join(new_lines)
-    
-    with open(template_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Import parameters added to {template_path}")
-
-def main():
-    """メイン処理"""
-    
-    # インポートパラメータを生成
-    import_parameters = generate_import_parameters()
-    
-    # テンプレートファイルのマッピング（依存関係があるもののみ）
-    template_mappings = {
-        'cf-templates/compute/ec2/ec2-autoscaling.yaml': 'ec2',
-        'cf-templates/compute/lambda/lambda-function.yaml': 'lambda',
-        'cf-templates/networking/elb/elb-template.yaml': 'elb',
-        'cf-templates/integration/api-gateway/api-gateway-template.yaml': 'api-gateway'
-    }
-    
-    # 各テンプレートにパラメータを追加
-    for template_path, param_type in template_mappings.items():
-        template_file = Path(template_path)
-        
-        if template_file.exists() and param_type in import_parameters:
-            print(f"\nProcessing {template_path}")
-            add_parameters_to_template(str(template_file), import_parameters[param_type])
-        else:
-            print(f"Warning: Template not found or no parameters defined: {template_path}")
-    
-    print("\nAll dependent templates have been enhanced with import parameters!")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Import Parameters Generator
+依存関係のあるテンプレートにインポートパラメータを追加
+"""
+
+import re
+import types
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# トップレベルのParameters/Descriptionセクション検出用
+_PARAMS_RE = re.compile(r'^Parameters:[ \t]*$', re.M)
+_DESC_RE = re.compile(r'^Description:.*\n', re.M)
+
+# インポートパラメータ定義: パラメータ名 -> (表示名, 参照元スタック, エクスポート名)
+_PARAM_DEFS = {
+    'ImportVPCId': ('VPC ID', 'networking-vpc', '${ProjectName}-${Environment}-VPC-ID'),
+    'ImportPrivateSubnets': ('Private Subnets', 'networking-vpc', '${ProjectName}-${Environment}-PrivateSubnets'),
+    'ImportPublicSubnets': ('Public Subnets', 'networking-vpc', '${ProjectName}-${Environment}-PublicSubnets'),
+    'ImportExecutionRoleArn': ('Execution Role ARN', 'foundation-iam', '${ProjectName}-${Environment}-execution-role-arn'),
+    'ImportInstanceProfileArn': ('Instance Profile ARN', 'foundation-iam', '${ProjectName}-${Environment}-instance-profile-arn'),
+    'ImportApplicationKMSKeyArn': ('Application KMS Key ARN', 'foundation-kms', '${ProjectName}-${Environment}-application-kms-key-arn'),
+    'ImportAutoScalingGroupName': ('Auto Scaling Group Name', 'compute-ec2', '${ProjectName}-${Environment}-ASG-Name'),
+    'ImportEC2SecurityGroupId': ('EC2 Security Group ID', 'compute-ec2', '${ProjectName}-${Environment}-EC2-SG-Id'),
+    'ImportLambdaFunctionArn': ('Lambda Function ARN', 'compute-lambda', '${ProjectName}-${Environment}-Lambda-Function-Arn'),
+    'ImportApplicationLogGroupName': ('Application Log Group Name', 'integration-cloudwatch', '${ProjectName}-${Environment}-application-log-group'),
+}
+
+# テンプレート種別ごとのインポートパラメータ
+_TEMPLATE_PARAMS = {
+    'ec2': ('ImportVPCId', 'ImportPrivateSubnets', 'ImportPublicSubnets', 'ImportExecutionRoleArn',
+            'ImportInstanceProfileArn', 'ImportApplicationKMSKeyArn'),
+    'lambda': ('ImportVPCId', 'ImportPrivateSubnets', 'ImportExecutionRoleArn', 'ImportApplicationKMSKeyArn'),
+    'elb': ('ImportVPCId', 'ImportPublicSubnets', 'ImportAutoScalingGroupName', 'ImportEC2SecurityGroupId'),
+    'api-gateway': ('ImportLambdaFunctionArn', 'ImportExecutionRoleArn', 'ImportApplicationLogGroupName'),
+}
+
+# インポートせず空のデフォルト値とするオプションパラメータ
+_OPTIONAL_TEMPLATE_PARAMS = {
+    'ec2': frozenset({'ImportPublicSubnets'}),
+}
+
+def _render(param_name: str, optional: bool = False) -> str:
+    """インポートパラメータ1件分のYAMLを生成"""
+    label, source_stack, export_name = _PARAM_DEFS[param_name]
+    if optional:
+        return (f"  {param_name}:\n"
+                f"    Type: String\n"
+                f"    Description: Import {label} from {source_stack} stack (optional)\n"
+                f"    Default: ''\n")
+    return (f"  {param_name}:\n"
+            f"    Type: String\n"
+            f"    Description: Import {label} from {source_stack} stack\n"
+            f"    Default: !ImportValue\n"
+            f"      Fn::Sub: '{export_name}'\n")
+
+@functools.lru_cache(maxsize=1)
+def generate_import_parameters():
+    """各テンプレート用のインポートパラメータを生成"""
+    import_parameters = {}
+    
+    for template_type, param_names in _TEMPLATE_PARAMS.items():
+        optional_params = _OPTIONAL_TEMPLATE_PARAMS.get(template_type, frozenset())
+        import_parameters[template_type] = "\n  # Cross-Stack Import Parameters\n" + "\n".join(
+            _render(name, name in optional_params) for name in param_names
+        )
+    
+    return types.MappingProxyType(import_parameters)
+
+def _write_if_changed(template_path: str, original_content: str, new_content: str) -> bool:
+    """内容が変わった場合のみテンプレートを一時ファイル経由でアトミックに書き込む"""
+    if new_content == original_content:
+        return False
+    
+    tmp_path = template_path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+        os.replace(tmp_path, template_path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return True
+
+def add_parameters_to_template(template_path: str, import_parameters: str):
+    """テンプレートファイルにパラメータを追加"""
+    
+    with open(template_path, 'r', encoding='utf-8') as f:
+        original_content = f.read()
+    
+    content = original_content
+    
+    # Parametersセクションを見つけて追加
+    params_match = _PARAMS_RE.search(content)
+    if params_match:
+        # Parametersセクションの直後に追加
+        pos = params_match.end()
+        content = content[:pos] + '\n' + import_parameters + content[pos:]
+    else:
+        # Parametersセクションが存在しない場合は新規作成
+        # Descriptionの後に追加（Descriptionが無い場合は末尾に追加）
+        parameters_section = '\nParameters:\n' + import_parameters + '\n\n'
+        desc_match = _DESC_RE.search(content)
+        if desc_match:
+            pos = desc_match.end()
+            content = content[:pos] + parameters_section + content[pos:]
+        else:
+            content = content.rstrip('\n') + '\n' + parameters_section
+    
+    if _write_if_changed(template_path, original_content, content):
+        print(f"Import parameters added to {template_path}")
+    else:
+        print(f"No changes to {template_path}")
+
+def _process_one(template_path: str, param_type: str):
+    """テンプレート1件にインポートパラメータを追加（ワーカープロセスで実行）"""
+    print(f"\nProcessing {template_path}")
+    add_parameters_to_template(template_path, generate_import_parameters()[param_type])
+
+def main():
+    """メイン処理"""
+    
+    # インポートパラメータを生成
+    import_parameters = generate_import_parameters()
+    
+    # テンプレートファイルのマッピング（依存関係があるもののみ）
+    template_mappings = {
+        'cf-templates/compute/ec2/ec2-autoscaling.yaml': 'ec2',
+        'cf-templates/compute/lambda/lambda-function.yaml': 'lambda',
+        'cf-templates/networking/elb/elb-template.yaml': 'elb',
+        'cf-templates/integration/api-gateway/api-gateway-template.yaml': 'api-gateway'
+    }
+    
+    # 処理対象のテンプレートを抽出
+    template_paths = []
+    param_types = []
+    for template_path, param_type in template_mappings.items():
+        template_file = Path(template_path)
+        
+        if template_file.exists() and param_type in import_parameters:
+            template_paths.append(str(template_file))
+            param_types.append(param_type)
+        else:
+            print(f"Warning: Template not found or no parameters defined: {template_path}")
+    
+    # 各テンプレートは独立しているためプロセスプールで並列に処理
+    if template_paths:
+        with ProcessPoolExecutor(max_workers=min(len(template_paths), os.cpu_count() or 1)) as executor:
+            list(executor.map(_process_one, template_paths, param_types))
+    
+    print("\nAll dependent templates have been enhanced with import parameters!")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
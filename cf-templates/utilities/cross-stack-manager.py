@@ -1,315 +1,478 @@
-#!/usr/bin/env python3
-"""
-Cross-Stack Reference Manager
-Well-Architected準拠CloudFormationテンプレート用のクロススタック参照管理ユーティリティ
-"""
-
-import json
-import yaml
-import boto3
-import re
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from pathlib import Path
-
-@dataclass
-class StackOutput:
-    """スタックアウトプット情報"""
-    name: str
-    description: str
-    value: str
-    export_name: str
-    conditions: Optional[List[str]] = None
-
-@dataclass
-class StackDependency:
-    """スタック依存関係情報"""
-    stack_name: str
-    required_outputs: List[str]
-    optional_outputs: List[str] = None
-
-class CrossStackManager:
-    """クロススタック参照管理クラス"""
-    
-    def __init__(self, region: str = 'us-east-1', profile: str = 'mame-local-wani'):
-        self.region = region
-        session = boto3.Session(profile_name=profile)
-        self.cf_client = session.client('cloudformation', region_name=region)
-        self.stack_outputs = {}
-        self.dependencies = {}
-    
-    def register_stack_outputs(self, stack_name: str, outputs: List[StackOutput]):
-        """スタックのアウトプットを登録"""
-        self.stack_outputs[stack_name] = outputs
-    
-    def register_dependency(self, stack_name: str, dependency: StackDependency):
-        """スタック依存関係を登録"""
-        if stack_name not in self.dependencies:
-            self.dependencies[stack_name] = []
-        self.dependencies[stack_name].append(dependency)
-    
-    def validate_dependencies(self, stack_name: str) -> Dict[str, Any]:
-        """依存関係の検証"""
-        validation_result = {
-            'valid': True,
-            'errors': [],
-            'warnings': [],
-            'missing_outputs': []
-        }
-        
-        if stack_name not in self.dependencies:
-            return validation_result
-        
-        for dependency in self.dependencies[stack_name]:
-            # 依存スタックの存在確認
-            try:
-                response = self.cf_client.describe_stacks(StackName=dependency.stack_name)
-                stack_status = response['Stacks'][0]['StackStatus']
-                
-                if stack_status not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
-                    validation_result['errors'].append(
-                        f"依存スタック '{dependency.stack_name}' のステータスが不正: {stack_status}"
-                    )
-                    validation_result['valid'] = False
-                
-                # アウトプットの存在確認
-                stack_outputs = response['Stacks'][0].get('Outputs', [])
-                available_outputs = {output['OutputKey'] for output in stack_outputs}
-                
-                for required_output in dependency.required_outputs:
-                    if required_output not in available_outputs:
-                        validation_result['missing_outputs'].append(
-                            f"必須アウトプット '{required_output}' が依存スタック '{dependency.stack_name}' に存在しません"
-                        )
-                        validation_result['valid'] = False
-                
-                if dependency.optional_outputs:
-                    for optional_output in dependency.optional_outputs:
-                        if optional_output not in available_outputs:
-                            validation_result['warnings'].append(
-                                f"オプションアウトプット '{optional_output}' が依存スタック '{dependency.stack_name}' に存在しません"
-                            )
-            
-            except self.cf_client.exceptions.ClientError as e:
-                if e.response['Error']['Code'] == 'ValidationError':
-                    validation_result['errors'].append(
-                        f"依存スタック '{dependency.stack_name}' が存在しません"
-                    )
-                    validation_result['valid'] = False
-                else:
-                    raise
-        
-        return validation_result
-    
-    def generate_import_parameters(self, stack_name: str, project_name: str, environment: str) -> Dict[str, Any]:
-        """インポートパラメータの生成"""
-        import_params = {}
-        
-        if stack_name not in self.dependencies:
-            return import_params
-        
-        for dependency in self.dependencies[stack_name]:
-            for output_name in dependency.required_outputs:
-                export_name = f"{project_name}-{environment}-{output_name}"
-                import_params[f"Import{output_name}"] = {
-                    "Type": "String",
-                    "Description": f"Import {output_name} from {dependency.stack_name}",
-                    "Default": {"Fn::ImportValue": export_name}
-                }
-        
-        return import_params
-    
-    def generate_outputs_section(self, stack_outputs: List[StackOutput], project_name: str, environment: str) -> Dict[str, Any]:
-        """Outputsセクションの生成"""
-        outputs = {}
-        
-        for output in stack_outputs:
-            output_config = {
-                "Description": output.description,
-                "Value": output.value
-            }
-            
-            # Export設定
-            if output.export_name:
-                export_name = output.export_name.format(
-                    ProjectName=project_name,
-                    Environment=environment
-                )
-                output_config["Export"] = {"Name": export_name}
-            
-            # Condition設定
-            if output.conditions:
-                # 複数条件の場合はAndで結合
-                if len(output.conditions) > 1:
-                    output_config["Condition"] = {"Fn::And": [
-                        {"Condition": condition} for condition in output.conditions
-                    ]}
-                else:
-                    output_config["Condition"] = output.conditions[0]
-            
-            outputs[output.name] = output_config
-        
-        return outputs
-    
-    def update_template_with_cross_stack_support(self, template_path: str, stack_name: str, 
-                                                project_name: str = "${ProjectName}", 
-                                                environment: str = "${Environment}"):
-        """テンプレートにクロススタック対応を追加"""
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = yaml.safe_load(f)
-        
-        # パラメータセクションにインポートパラメータを追加
-        if stack_name in self.dependencies:
-            import_params = self.generate_import_parameters(stack_name, project_name, environment)
-            if 'Parameters' not in template:
-                template['Parameters'] = {}
-            template['Parameters'].update(import_params)
-        
-        # Outputsセクションを更新
-        if stack_name in self.stack_outputs:
-            outputs = self.generate_outputs_section(
-                self.stack_outputs[stack_name], 
-                project_name, 
-                environment
-            )
-            template['Outputs'] = outputs
-        
-        # テンプレートを保存
-        with open(template_path, 'w', encoding='utf-8') as f:
-            yaml.dump(template, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    
-    def generate_dependency_graph(self) -> Dict[str, Any]:
-        """依存関係グラフの生成"""
-        graph = {
-            'nodes': [],
-            'edges': []
-        }
-        
-        # ノードの追加
-        all_stacks = set(self.dependencies.keys())
-        for deps in self.dependencies.values():
-            for dep in deps:
-                all_stacks.add(dep.stack_name)
-        
-        for stack in all_stacks:
-            graph['nodes'].append({
-                'id': stack,
-                'label': stack,
-                'type': 'stack'
-            })
-        
-        # エッジの追加
-        for stack_name, deps in self.dependencies.items():
-            for dep in deps:
-                graph['edges'].append({
-                    'from': dep.stack_name,
-                    'to': stack_name,
-                    'label': f"exports: {', '.join(dep.required_outputs)}"
-                })
-        
-        return graph
-    
-    def export_configuration(self, output_path: str):
-        """設定をJSONファイルにエクスポート"""
-        config = {
-            'stack_outputs': {
-                stack: [
-                    {
-                        'name': output.name,
-                        'description': output.description,
-                        'value': output.value,
-                        'export_name': output.export_name,
-                        'conditions': output.conditions
-                    }
-                    for output in outputs
-                ]
-                for stack, outputs in self.stack_outputs.items()
-            },
-            'dependencies': {
-                stack: [
-                    {
-                        'stack_name': dep.stack_name,
-                        'required_outputs': dep.required_outputs,
-                        'optional_outputs': dep.optional_outputs or []
-                    }
-                    for dep in deps
-                ]
-                for stack, deps in self.dependencies.items()
-            }
-        }
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-    
-    def import_configuration(self, config_path: str):
-        """JSONファイルから設定をインポート"""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
-        
-        # スタックアウトプットの復元
-        for stack_name, outputs_data in config.get('stack_outputs', {}).items():
-            outputs = []
-            for output_data in outputs_data:
-                outputs.append(StackOutput(
-                    name=output_data['name'],
-                    description=output_data['description'],
-                    value=output_data['value'],
-                    export_name=output_data['export_name'],
-                    conditions=output_data.get('conditions')
-                ))
-            self.register_stack_outputs(stack_name, outputs)
-        
-        # 依存関係の復元
-        for stack_name, deps_data in config.get('dependencies', {}).items():
-            for dep_data in deps_data:
-                dependency = StackDependency(
-                    stack_name=dep_data['stack_name'],
-                    required_outputs=dep_data['required_outputs'],
-                    optional_outputs=dep_data.get('optional_outputs')
-                )
-                self.register_dependency(stack_name, dependency)
-
-def main():
-    """メイン関数 - 使用例"""
-    manager = CrossStackManager()
-    
-    # VPCスタックのアウトプット定義
-    vpc_outputs = [
-        StackOutput(
-            name="VPCId",
-            description="VPC ID",
-            value="!Ref VPC",
-            export_name="{ProjectName}-{Environment}-VPC-ID"
-        ),
-        StackOutput(
-            name="PublicSubnets",
-            description="List of Public Subnet IDs",
-            value="!Join [',', [!Ref PublicSubnet1, !Ref PublicSubnet2]]",
-            export_name="{ProjectName}-{Environment}-PublicSubnets"
-        ),
-        StackOutput(
-            name="PrivateSubnets",
-            description="List of Private Subnet IDs",
-            value="!Join [',', [!Ref PrivateSubnet1, !Ref PrivateSubnet2]]",
-            export_name="{ProjectName}-{Environment}-PrivateSubnets"
-        )
-    ]
-    
-    manager.register_stack_outputs("vpc-stack", vpc_outputs)
-    
-    # EC2スタックの依存関係定義
-    ec2_dependency = StackDependency(
-        stack_name="vpc-stack",
-        required_outputs=["VPCId", "PrivateSubnets"],
-        optional_outputs=["PublicSubnets"]
-    )
-    
-    manager.register_dependency("ec2-stack", ec2_dependency)
-    
-    # 設定をエクスポート
-    manager.export_configuration("cross-stack-config.json")
-    
-    print("クロススタック設定が生成されました")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Cross-Stack Reference Manager
+Well-Architected準拠CloudFormationテンプレート用のクロススタック参照管理ユーティリティ
+"""
+
+import json
+import yaml
+import re
+import time
+import functools
+from collections import deque
+from typing import Dict, Iterable, List, Any, Optional, Tuple, FrozenSet
+from dataclasses import dataclass, asdict
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# LibYAMLが利用可能な場合はCベースのローダー/ダンパーを使用
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# CloudFormation短縮形タグと組み込み関数キーの対応表
+_CFN_SHORT_TAGS = {
+    '!Ref': 'Ref',
+    '!Condition': 'Condition',
+    **{f'!{name}': f'Fn::{name}' for name in (
+        'Sub', 'GetAtt', 'Join', 'Select', 'Split', 'ImportValue', 'If', 'And', 'Or',
+        'Not', 'Equals', 'FindInMap', 'Base64', 'Cidr', 'GetAZs'
+    )}
+}
+_CFN_TAGS_BY_KEY = {key: tag for tag, key in _CFN_SHORT_TAGS.items()}
+
+
+class _CfnLoader(_SafeLoader):
+    """CloudFormation短縮形タグ（!Ref, !Sub など）を読み込めるローダー"""
+
+
+class _CfnDumper(_SafeDumper):
+    """組み込み関数を短縮形タグで書き出すダンパー"""
+
+
+def _make_cfn_constructor(key: str):
+    """短縮形タグを {key: value} 形式に変換するコンストラクタを生成"""
+    def construct(loader, node):
+        if isinstance(node, yaml.ScalarNode):
+            value = loader.construct_scalar(node)
+            if key == 'Fn::GetAtt':
+                value = value.split('.', 1)
+        elif isinstance(node, yaml.SequenceNode):
+            value = loader.construct_sequence(node, deep=True)
+        else:
+            value = loader.construct_mapping(node, deep=True)
+        return {key: value}
+    return construct
+
+
+def _represent_cfn_dict(dumper, data):
+    """単一キーの組み込み関数は短縮形タグとして出力"""
+    if len(data) == 1:
+        key, value = next(iter(data.items()))
+        tag = _CFN_TAGS_BY_KEY.get(key)
+        if tag:
+            if key == 'Fn::GetAtt' and isinstance(value, list) and all(isinstance(v, str) for v in value):
+                value = '.'.join(value)
+            if isinstance(value, list):
+                return dumper.represent_sequence(tag, value)
+            if isinstance(value, dict):
+                return dumper.represent_mapping(tag, value)
+            if isinstance(value, str):
+                return dumper.represent_scalar(tag, value)
+    return dumper.represent_dict(data)
+
+
+for _tag, _key in _CFN_SHORT_TAGS.items():
+    _CfnLoader.add_constructor(_tag, _make_cfn_constructor(_key))
+_CfnDumper.add_representer(dict, _represent_cfn_dict)
+
+
+# スロットリング時の再試行設定（再試行はbotocoreのadaptiveモードのみで行う）
+_CLIENT_MAX_ATTEMPTS = 10
+
+# スタック情報キャッシュの有効期間（秒）
+_STACK_CACHE_TTL = 30
+# 依存先スタックがこの数以上の場合のみ全スタックを一括取得する
+_BULK_LOAD_THRESHOLD = 5
+
+
+@functools.lru_cache(maxsize=None)
+def _get_session(profile: str):
+    """プロファイル単位でboto3セッションをキャッシュ"""
+    # boto3はインポートが重いため、実際にAWSへ接続する時点で読み込む
+    import boto3
+    return boto3.Session(profile_name=profile)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cf_client(profile: str, region: str):
+    """(プロファイル, リージョン)単位でCloudFormationクライアントをキャッシュ"""
+    from botocore.config import Config
+    # adaptiveモードでクライアント側のレート制御とリトライをbotocoreに任せる
+    config = Config(retries={'max_attempts': _CLIENT_MAX_ATTEMPTS, 'mode': 'adaptive'})
+    return _get_session(profile).client('cloudformation', region_name=region, config=config)
+
+
+@dataclass
+class StackOutput:
+    """スタックアウトプット情報"""
+    name: str
+    description: str
+    value: str
+    export_name: str
+    conditions: Optional[List[str]] = None
+
+@dataclass
+class StackDependency:
+    """スタック依存関係情報"""
+    stack_name: str
+    required_outputs: List[str]
+    optional_outputs: List[str] = None
+
+class CrossStackManager:
+    """クロススタック参照管理クラス"""
+    
+    def __init__(self, region: str = 'us-east-1', profile: str = 'mame-local-wani'):
+        self.region = region
+        self.cf_client = _get_cf_client(profile, region)
+        self.stack_outputs = {}
+        self.dependencies = {}
+        self._stacks_loaded_at: Optional[float] = None
+        # スタック名 -> (取得時刻, (ステータス, アウトプットキー集合) または None)
+        self._describe_cache: Dict[str, Tuple[float, Optional[Tuple[str, FrozenSet[str]]]]] = {}
+    
+    def register_stack_outputs(self, stack_name: str, outputs: List[StackOutput]):
+        """スタックのアウトプットを登録"""
+        self.stack_outputs[stack_name] = outputs
+    
+    def register_dependency(self, stack_name: str, dependency: StackDependency):
+        """スタック依存関係を登録"""
+        if stack_name not in self.dependencies:
+            self.dependencies[stack_name] = []
+        self.dependencies[stack_name].append(dependency)
+    
+    @staticmethod
+    def _summarize_stack(stack: dict) -> Tuple[str, FrozenSet[str]]:
+        """スタック情報を (ステータス, アウトプットキー集合) に要約"""
+        return stack['StackStatus'], frozenset(output['OutputKey'] for output in stack.get('Outputs', []))
+    
+    def _load_all_stacks(self, stack_names: Iterable[str] = (), ttl: float = _STACK_CACHE_TTL):
+        """アカウント内の全スタックを一括取得し、個別スタックのキャッシュに反映
+        
+        stack_namesのうち一覧に含まれないスタックは存在しないものとして記録する
+        """
+        if self._stacks_loaded_at is not None and time.monotonic() - self._stacks_loaded_at < ttl:
+            return
+        
+        paginator = self.cf_client.get_paginator('describe_stacks')
+        stacks = [stack for page in paginator.paginate() for stack in page['Stacks']]
+        loaded_at = time.monotonic()
+        for name in stack_names:
+            self._describe_cache[name] = (loaded_at, None)
+        for stack in stacks:
+            self._describe_cache[stack['StackName']] = (loaded_at, self._summarize_stack(stack))
+        self._stacks_loaded_at = loaded_at
+    
+    def _describe_stack(self, stack_name: str, ttl: float = _STACK_CACHE_TTL) -> Optional[Tuple[str, FrozenSet[str]]]:
+        """スタックのステータスとアウトプットキー集合を取得（TTL付きキャッシュ、存在しない場合はNone）"""
+        cached = self._describe_cache.get(stack_name)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+        
+        try:
+            response = self.cf_client.describe_stacks(StackName=stack_name)
+            summary = self._summarize_stack(response['Stacks'][0])
+        except self.cf_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] != 'ValidationError':
+                raise
+            summary = None  # スタックが存在しない
+        
+        self._describe_cache[stack_name] = (time.monotonic(), summary)
+        return summary
+    
+    def topo_sort(self) -> List[str]:
+        """依存先が先に並ぶようにスタックをトポロジカルソート（Kahnのアルゴリズム）"""
+        in_degree = {}
+        dependents = {}
+        for stack_name, deps in self.dependencies.items():
+            in_degree.setdefault(stack_name, 0)
+            for dep in deps:
+                in_degree.setdefault(dep.stack_name, 0)
+                in_degree[stack_name] += 1
+                dependents.setdefault(dep.stack_name, []).append(stack_name)
+        
+        queue = deque(stack for stack, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            stack = queue.popleft()
+            order.append(stack)
+            for dependent in dependents.get(stack, []):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        
+        if len(order) != len(in_degree):
+            cyclic = [stack for stack, degree in in_degree.items() if degree > 0]
+            raise ValueError(f"循環依存が検出されました: {', '.join(cyclic)}")
+        
+        return order
+    
+    def validate_dependencies(self, stack_name: Optional[str] = None) -> Dict[str, Any]:
+        """依存関係の検証（stack_name省略時は全スタックを依存順に検証）"""
+        validation_result = {
+            'valid': True,
+            'errors': [],
+            'warnings': [],
+            'missing_outputs': []
+        }
+        
+        if stack_name is None:
+            # 基盤スタックから順に検証し、下流スタックはキャッシュ済みの結果を再利用する
+            try:
+                targets = [stack for stack in self.topo_sort() if stack in self.dependencies]
+            except ValueError as e:
+                validation_result['errors'].append(str(e))
+                validation_result['valid'] = False
+                return validation_result
+        elif stack_name in self.dependencies:
+            targets = [stack_name]
+        else:
+            targets = []
+        
+        if not targets:
+            return validation_result
+        
+        # 全スタックの検証時や依存先が多い場合のみ一括取得し、失敗した場合は個別取得で続行
+        dependency_names = {dep.stack_name for target in targets for dep in self.dependencies[target]}
+        if stack_name is None or len(dependency_names) >= _BULK_LOAD_THRESHOLD:
+            try:
+                self._load_all_stacks(dependency_names)
+            except self.cf_client.exceptions.ClientError:
+                pass
+        
+        for dependency in (dep for target in targets for dep in self.dependencies[target]):
+            # 依存スタックの存在確認とアウトプットの取得（describe_stacksの結果をキャッシュして共有）
+            summary = self._describe_stack(dependency.stack_name)
+            if summary is None:
+                validation_result['errors'].append(
+                    f"依存スタック '{dependency.stack_name}' が存在しません"
+                )
+                validation_result['valid'] = False
+                continue
+            
+            stack_status, available_outputs = summary
+            
+            if stack_status not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
+                validation_result['errors'].append(
+                    f"依存スタック '{dependency.stack_name}' のステータスが不正: {stack_status}"
+                )
+                validation_result['valid'] = False
+            
+            # アウトプットの存在確認（キャッシュ済みの集合を共有）
+            for required_output in dependency.required_outputs:
+                if required_output not in available_outputs:
+                    validation_result['missing_outputs'].append(
+                        f"必須アウトプット '{required_output}' が依存スタック '{dependency.stack_name}' に存在しません"
+                    )
+                    validation_result['valid'] = False
+            
+            if dependency.optional_outputs:
+                for optional_output in dependency.optional_outputs:
+                    if optional_output not in available_outputs:
+                        validation_result['warnings'].append(
+                            f"オプションアウトプット '{optional_output}' が依存スタック '{dependency.stack_name}' に存在しません"
+                        )
+        
+        return validation_result
+    
+    def generate_import_parameters(self, stack_name: str, project_name: str, environment: str) -> Dict[str, Any]:
+        """インポートパラメータの生成"""
+        import_params = {}
+        
+        if stack_name not in self.dependencies:
+            return import_params
+        
+        for dependency in self.dependencies[stack_name]:
+            for output_name in dependency.required_outputs:
+                export_name = f"{project_name}-{environment}-{output_name}"
+                import_params[f"Import{output_name}"] = {
+                    "Type": "String",
+                    "Description": f"Import {output_name} from {dependency.stack_name}",
+                    "Default": {"Fn::ImportValue": export_name}
+                }
+        
+        return import_params
+    
+    def generate_outputs_section(self, stack_outputs: List[StackOutput], project_name: str, environment: str) -> Dict[str, Any]:
+        """Outputsセクションの生成"""
+        outputs = {}
+        
+        for output in stack_outputs:
+            output_config = {
+                "Description": output.description,
+                "Value": output.value
+            }
+            
+            # Export設定
+            if output.export_name:
+                export_name = output.export_name.format(
+                    ProjectName=project_name,
+                    Environment=environment
+                )
+                output_config["Export"] = {"Name": export_name}
+            
+            # Condition設定
+            if output.conditions:
+                # 複数条件の場合はAndで結合
+                if len(output.conditions) > 1:
+                    output_config["Condition"] = {"Fn::And": [
+                        {"Condition": condition} for condition in output.conditions
+                    ]}
+                else:
+                    output_config["Condition"] = output.conditions[0]
+            
+            outputs[output.name] = output_config
+        
+        return outputs
+    
+    def update_template_with_cross_stack_support(self, template_path: str, stack_name: str, 
+                                                project_name: str = "${ProjectName}", 
+                                                environment: str = "${Environment}"):
+        """テンプレートにクロススタック対応を追加"""
+        with open(template_path, 'r', encoding='utf-8') as f:
+            template = yaml.load(f, Loader=_CfnLoader)
+        
+        # パラメータセクションにインポートパラメータを追加
+        if stack_name in self.dependencies:
+            import_params = self.generate_import_parameters(stack_name, project_name, environment)
+            if 'Parameters' not in template:
+                template['Parameters'] = {}
+            template['Parameters'].update(import_params)
+        
+        # Outputsセクションを更新
+        if stack_name in self.stack_outputs:
+            outputs = self.generate_outputs_section(
+                self.stack_outputs[stack_name], 
+                project_name, 
+                environment
+            )
+            template['Outputs'] = outputs
+        
+        # テンプレートを保存
+        with open(template_path, 'w', encoding='utf-8') as f:
+            yaml.dump(template, f, Dumper=_CfnDumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    
+    def generate_dependency_graph(self) -> Dict[str, Any]:
+        """依存関係グラフの生成"""
+        # ノードとエッジを1回の走査で構築（dictで挿入順を保った集合として扱う）
+        nodes = dict.fromkeys(self.dependencies)
+        edges = []
+        
+        for stack_name, deps in self.dependencies.items():
+            for dep in deps:
+                nodes[dep.stack_name] = None
+                edges.append({
+                    'from': dep.stack_name,
+                    'to': stack_name,
+                    'label': f"exports: {', '.join(dep.required_outputs)}"
+                })
+        
+        return {
+            'nodes': [{'id': stack, 'label': stack, 'type': 'stack'} for stack in nodes],
+            'edges': edges
+        }
+    
+    def export_configuration(self, output_path: str):
+        """設定をJSONファイルにエクスポート"""
+        config = {
+            'stack_outputs': {
+                stack: [asdict(output) for output in outputs]
+                for stack, outputs in self.stack_outputs.items()
+            },
+            'dependencies': {
+                stack: [
+                    {**asdict(dep), 'optional_outputs': dep.optional_outputs or []}
+                    for dep in deps
+                ]
+                for stack, deps in self.dependencies.items()
+            }
+        }
+        
+        if orjson is not None:
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(config, f, indent=2, ensure_ascii=False)
+    
+    def import_configuration(self, config_path: str):
+        """JSONファイルから設定をインポート"""
+        if orjson is not None:
+            with open(config_path, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        
+        # スタックアウトプットの復元
+        for stack_name, outputs_data in config.get('stack_outputs', {}).items():
+            outputs = []
+            for output_data in outputs_data:
+                outputs.append(StackOutput(
+                    name=output_data['name'],
+                    description=output_data['description'],
+                    value=output_data['value'],
+                    export_name=output_data['export_name'],
+                    conditions=output_data.get('conditions')
+                ))
+            self.register_stack_outputs(stack_name, outputs)
+        
+        # 依存関係の復元
+        for stack_name, deps_data in config.get('dependencies', {}).items():
+            for dep_data in deps_data:
+                dependency = StackDependency(
+                    stack_name=dep_data['stack_name'],
+                    required_outputs=dep_data['required_outputs'],
+                    optional_outputs=dep_data.get('optional_outputs')
+                )
+                self.register_dependency(stack_name, dependency)
+
+def main():
+    """メイン関数 - 使用例"""
+    manager = CrossStackManager()
+    
+    # VPCスタックのアウトプット定義
+    vpc_outputs = [
+        StackOutput(
+            name="VPCId",
+            description="VPC ID",
+            value="!Ref VPC",
+            export_name="{ProjectName}-{Environment}-VPC-ID"
+        ),
+        StackOutput(
+            name="PublicSubnets",
+            description="List of Public Subnet IDs",
+            value="!Join [',', [!Ref PublicSubnet1, !Ref PublicSubnet2]]",
+            export_name="{ProjectName}-{Environment}-PublicSubnets"
+        ),
+        StackOutput(
+            name="PrivateSubnets",
+            description="List of Private Subnet IDs",
+            value="!Join [',', [!Ref PrivateSubnet1, !Ref PrivateSubnet2]]",
+            export_name="{ProjectName}-{Environment}-PrivateSubnets"
+        )
+    ]
+    
+    manager.register_stack_outputs("vpc-stack", vpc_outputs)
+    
+    # EC2スタックの依存関係定義
+    ec2_dependency = StackDependency(
+        stack_name="vpc-stack",
+        required_outputs=["VPCId", "PrivateSubnets"],
+        optional_outputs=["PublicSubnets"]
+    )
+    
+    manager.register_dependency("ec2-stack", ec2_dependency)
+    
+    # 設定をエクスポート
+    manager.export_configuration("cross-stack-config.json")
+    
+    print("クロススタック設定が生成されました")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,277 +1,259 @@
-#!/usr/bin/env python3
-"""
-Enhanced Outputs Generator
-CloudFormationテンプレートのOutputsセクションを手動で強化
-"""
-
-import json
-from pathlib import Path
-
-def generate_enhanced_outputs():
-    """強化されたOutputsセクションを生成"""
-    
-    # VPCテンプレート用の追加Outputs
-    vpc_additional_outputs = """
-  # Cross-Stack Integration Outputs
-  VPCDefaultSecurityGroupId:
-    Description: VPC Default Security Group ID
-    Value: !GetAtt VPC.DefaultSecurityGroup
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-VPC-DefaultSG-ID'
-
-  VPCDefaultNetworkAclId:
-    Description: VPC Default Network ACL ID
-    Value: !GetAtt VPC.DefaultNetworkAcl
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-VPC-DefaultACL-ID'
-
-  AvailabilityZones:
-    Description: List of Availability Zones used
-    Value: !If
-      - IsBasicPattern
-      - !Join [',', [!Select [0, !GetAZs ''], !Select [1, !GetAZs '']]]
-      - !Join [',', [!Select [0, !GetAZs ''], !Select [1, !GetAZs ''], !Select [2, !GetAZs '']]]
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-AvailabilityZones'
-
-  PublicRouteTableId:
-    Description: Public Route Table ID
-    Value: !Ref PublicRouteTable
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-PublicRouteTable-ID'
-
-  PrivateRouteTable1Id:
-    Description: Private Route Table 1 ID
-    Value: !Ref PrivateRouteTable1
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-PrivateRouteTable1-ID'
-
-  PrivateRouteTable2Id:
-    Description: Private Route Table 2 ID
-    Value: !Ref PrivateRouteTable2
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-PrivateRouteTable2-ID'
-
-  PrivateRouteTable3Id:
-    Condition: !Or [!Condition IsAdvancedPattern, !Condition IsEnterprisePattern]
-    Description: Private Route Table 3 ID
-    Value: !Ref PrivateRouteTable3
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-PrivateRouteTable3-ID'
-"""
-
-    # IAMテンプレート用の追加Outputs
-    iam_additional_outputs = """
-  # Cross-Stack Integration Outputs
-  ExecutionRoleArn:
-    Description: 現在のパターンに対応する実行ロールARN
-    Value: !If
-      - IsBasicPattern
-      - !GetAtt BasicExecutionRole.Arn
-      - !If
-        - IsAdvancedPattern
-        - !GetAtt AdvancedExecutionRole.Arn
-        - !GetAtt EnterpriseExecutionRole.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-execution-role-arn'
-
-  InstanceProfileArn:
-    Description: 現在のパターンに対応するインスタンスプロファイルARN
-    Value: !If
-      - IsBasicPattern
-      - !GetAtt BasicInstanceProfile.Arn
-      - !If
-        - IsAdvancedPattern
-        - !GetAtt AdvancedInstanceProfile.Arn
-        - !GetAtt EnterpriseInstanceProfile.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-instance-profile-arn'
-
-  CrossAccountAccessRoleArn:
-    Condition: IsCrossAccountEnabled
-    Description: クロスアカウントアクセスロールのARN
-    Value: !GetAtt CrossAccountAccessRole.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-cross-account-access-role-arn'
-"""
-
-    # KMSテンプレート用の追加Outputs
-    kms_additional_outputs = """
-  # Cross-Stack Integration Outputs
-  ApplicationKMSKeyId:
-    Description: アプリケーション用KMSキーID（汎用キー）
-    Value: !Ref GeneralPurposeKey
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-application-kms-key-id'
-
-  ApplicationKMSKeyArn:
-    Description: アプリケーション用KMSキーARN（汎用キー）
-    Value: !GetAtt GeneralPurposeKey.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-application-kms-key-arn'
-
-  DatabaseKMSKeyId:
-    Condition: IsAdvancedPattern
-    Description: データベース用KMSキーID
-    Value: !Ref RDSEncryptionKey
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-database-kms-key-id'
-
-  DatabaseKMSKeyArn:
-    Condition: IsAdvancedPattern
-    Description: データベース用KMSキーARN
-    Value: !GetAtt RDSEncryptionKey.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-database-kms-key-arn'
-
-  StorageKMSKeyId:
-    Condition: IsAdvancedPattern
-    Description: ストレージ用KMSキーID（S3/EBS）
-    Value: !If
-      - IsAdvancedPattern
-      - !Ref S3EncryptionKey
-      - !Ref GeneralPurposeKey
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-storage-kms-key-id'
-
-  StorageKMSKeyArn:
-    Condition: IsAdvancedPattern
-    Description: ストレージ用KMSキーARN（S3/EBS）
-    Value: !If
-      - IsAdvancedPattern
-      - !GetAtt S3EncryptionKey.Arn
-      - !GetAtt GeneralPurposeKey.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-storage-kms-key-arn'
-"""
-
-    # EC2テンプレート用の追加Outputs
-    ec2_additional_outputs = """
-  # Cross-Stack Integration Outputs
-  LaunchTemplateId:
-    Description: Launch Template ID
-    Value: !Ref EC2LaunchTemplate
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-LaunchTemplate-Id'
-
-  LaunchTemplateVersion:
-    Description: Launch Template Latest Version
-    Value: !GetAtt EC2LaunchTemplate.LatestVersionNumber
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-LaunchTemplate-Version'
-
-  IAMRoleArn:
-    Description: EC2 IAM Role ARN
-    Value: !GetAtt EC2Role.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-IAM-Role-Arn'
-
-  InstanceProfileArn:
-    Description: EC2 Instance Profile ARN
-    Value: !GetAtt EC2InstanceProfile.Arn
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-InstanceProfile-Arn'
-
-  EC2LogGroupName:
-    Description: EC2 Log Group Name
-    Value: !Ref EC2LogGroup
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-EC2-LogGroup-Name'
-"""
-
-    # CloudWatchテンプレート用の追加Outputs
-    cloudwatch_additional_outputs = """
-  # Cross-Stack Integration Outputs
-  SlackNotificationFunctionArn:
-    Description: Slack Notification Lambda Function ARN
-    Value: !If [HasSlackWebhook, !GetAtt SlackNotificationFunction.Arn, "N/A"]
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-slack-notification-function-arn'
-
-  MonitoringDashboardUrl:
-    Description: CloudWatch Dashboard URL
-    Value: !If
-      - CreateAdvancedResources
-      - !Sub 'https://${AWS::Region}.console.aws.amazon.com/cloudwatch/home?region=${AWS::Region}#dashboards:name=${ProjectName}-${Environment}-monitoring'
-      - "N/A"
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-dashboard-url'
-
-  EnterpriseDashboardUrl:
-    Description: Enterprise CloudWatch Dashboard URL
-    Value: !If
-      - CreateEnterpriseResources
-      - !Sub 'https://${AWS::Region}.console.aws.amazon.com/cloudwatch/home?region=${AWS::Region}#dashboards:name=${ProjectName}-${Environment}-enterprise'
-      - "N/A"
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-enterprise-dashboard-url'
-
-  ErrorMetricFilterName:
-    Description: Error Metric Filter Name
-    Value: !Ref ErrorMetricFilter
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-error-metric-filter'
-
-  WarningMetricFilterName:
-    Description: Warning Metric Filter Name
-    Value: !Ref WarningMetricFilter
-    Export:
-      Name: !Sub '${ProjectName}-${Environment}-warning-metric-filter'
-"""
-
-    return {
-        'vpc': vpc_additional_outputs,
-        'iam': iam_additional_outputs,
-        'kms': kms_additional_outputs,
-        'ec2': ec2_additional_outputs,
-        'cloudwatch': cloudwatch_additional_outputs
-    }
-
-def append_outputs_to_template(template_path: str, additional_outputs: str):
-    """テンプレートファイルにOutputsを追加"""
-    
-    with open(template_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Outputsセクションの最後を見つけて追加
-    if 'Outputs:' in content:
-        # 既存のOutputsセクションの最後に追加
-        content += additional_outputs
-    else:
-        # Outputsセクションが存在しない場合は新規作成
-        content += f"\nOutputs:{additional_outputs}"
-    
-    with open(template_path, 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"Enhanced outputs added to {template_path}")
-
-def main():
-    """メイン処理"""
-    
-    # 強化されたOutputsを生成
-    enhanced_outputs = generate_enhanced_outputs()
-    
-    # テンプレートファイルのマッピング
-    template_mappings = {
-        'cf-templates/networking/vpc/vpc-template.yaml': 'vpc',
-        'cf-templates/foundation/iam/iam-roles-policies.yaml': 'iam',
-        'cf-templates/foundation/kms/kms-keys.yaml': 'kms',
-        'cf-templates/compute/ec2/ec2-autoscaling.yaml': 'ec2',
-        'cf-templates/integration/cloudwatch/cloudwatch-template.yaml': 'cloudwatch'
-    }
-    
-    # 各テンプレートにOutputsを追加
-    for template_path, output_type in template_mappings.items():
-        template_file = Path(template_path)
-        
-        if template_file.exists() and output_type in enhanced_outputs:
-            print(f"\nProcessing {template_path}")
-            append_outputs_to_template(str(template_file), enhanced_outputs[output_type])
-        else:
-            print(f"Warning: Template not found or no outputs defined: {template_path}")
-    
-    print("\nAll templates have been enhanced with cross-stack outputs!")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Enhanced Outputs Generator
+CloudFormationテンプレートのOutputsセクションを手動で強化
+"""
+
+import json
+import os
+import yaml
+import types
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Any
+
+# LibYAMLが利用可能な場合はCベースのダンパーを使用
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+_OUTPUTS_HEADER = "\n  # Cross-Stack Integration Outputs\n"
+
+# 既存Outputsセクションの有無を確認する末尾の読み取りサイズ
+_TAIL_SCAN_BYTES = 8192
+
+def _ref(logical_id: str) -> Dict[str, Any]:
+    return {'Ref': logical_id}
+
+def _get_att(logical_id: str, attribute: str) -> Dict[str, Any]:
+    return {'Fn::GetAtt': [logical_id, attribute]}
+
+def _if(condition: str, value_if_true: Any, value_if_false: Any) -> Dict[str, Any]:
+    return {'Fn::If': [condition, value_if_true, value_if_false]}
+
+def _condition(name: str) -> Dict[str, Any]:
+    return {'Condition': name}
+
+def _azs_join(count: int) -> Dict[str, Any]:
+    """先頭count個のアベイラビリティゾーンをカンマ区切りで結合"""
+    return {'Fn::Join': [',', [{'Fn::Select': [i, {'Fn::GetAZs': ''}]} for i in range(count)]]}
+
+def _output(description: str, value: Any, export_suffix: str, condition: Any = None) -> Dict[str, Any]:
+    """エクスポート付きOutput定義を生成"""
+    output = {}
+    if condition is not None:
+        output['Condition'] = condition
+    output['Description'] = description
+    output['Value'] = value
+    output['Export'] = {'Name': {'Fn::Sub': f'${{ProjectName}}-${{Environment}}-{export_suffix}'}}
+    return output
+
+@functools.lru_cache(maxsize=1)
+def generate_enhanced_outputs():
+    """強化されたOutputsセクションを生成"""
+    
+    # VPCテンプレート用の追加Outputs
+    vpc_additional_outputs = {
+        'VPCDefaultSecurityGroupId': _output(
+            'VPC Default Security Group ID', _get_att('VPC', 'DefaultSecurityGroup'), 'VPC-DefaultSG-ID'),
+        'VPCDefaultNetworkAclId': _output(
+            'VPC Default Network ACL ID', _get_att('VPC', 'DefaultNetworkAcl'), 'VPC-DefaultACL-ID'),
+        'AvailabilityZones': _output(
+            'List of Availability Zones used',
+            _if('IsBasicPattern', _azs_join(2), _azs_join(3)),
+            'AvailabilityZones'),
+        'PublicRouteTableId': _output(
+            'Public Route Table ID', _ref('PublicRouteTable'), 'PublicRouteTable-ID'),
+        'PrivateRouteTable1Id': _output(
+            'Private Route Table 1 ID', _ref('PrivateRouteTable1'), 'PrivateRouteTable1-ID'),
+        'PrivateRouteTable2Id': _output(
+            'Private Route Table 2 ID', _ref('PrivateRouteTable2'), 'PrivateRouteTable2-ID'),
+        'PrivateRouteTable3Id': _output(
+            'Private Route Table 3 ID', _ref('PrivateRouteTable3'), 'PrivateRouteTable3-ID',
+            condition={'Fn::Or': [_condition('IsAdvancedPattern'), _condition('IsEnterprisePattern')]}),
+    }
+
+    # IAMテンプレート用の追加Outputs
+    iam_additional_outputs = {
+        'ExecutionRoleArn': _output(
+            '現在のパターンに対応する実行ロールARN',
+            _if('IsBasicPattern', _get_att('BasicExecutionRole', 'Arn'),
+                _if('IsAdvancedPattern', _get_att('AdvancedExecutionRole', 'Arn'),
+                    _get_att('EnterpriseExecutionRole', 'Arn'))),
+            'execution-role-arn'),
+        'InstanceProfileArn': _output(
+            '現在のパターンに対応するインスタンスプロファイルARN',
+            _if('IsBasicPattern', _get_att('BasicInstanceProfile', 'Arn'),
+                _if('IsAdvancedPattern', _get_att('AdvancedInstanceProfile', 'Arn'),
+                    _get_att('EnterpriseInstanceProfile', 'Arn'))),
+            'instance-profile-arn'),
+        'CrossAccountAccessRoleArn': _output(
+            'クロスアカウントアクセスロールのARN', _get_att('CrossAccountAccessRole', 'Arn'),
+            'cross-account-access-role-arn', condition='IsCrossAccountEnabled'),
+    }
+
+    # KMSテンプレート用の追加Outputs
+    kms_additional_outputs = {
+        'ApplicationKMSKeyId': _output(
+            'アプリケーション用KMSキーID（汎用キー）', _ref('GeneralPurposeKey'), 'application-kms-key-id'),
+        'ApplicationKMSKeyArn': _output(
+            'アプリケーション用KMSキーARN（汎用キー）', _get_att('GeneralPurposeKey', 'Arn'), 'application-kms-key-arn'),
+        'DatabaseKMSKeyId': _output(
+            'データベース用KMSキーID', _ref('RDSEncryptionKey'), 'database-kms-key-id',
+            condition='IsAdvancedPattern'),
+        'DatabaseKMSKeyArn': _output(
+            'データベース用KMSキーARN', _get_att('RDSEncryptionKey', 'Arn'), 'database-kms-key-arn',
+            condition='IsAdvancedPattern'),
+        'StorageKMSKeyId': _output(
+            'ストレージ用KMSキーID（S3/EBS）',
+            _if('IsAdvancedPattern', _ref('S3EncryptionKey'), _ref('GeneralPurposeKey')),
+            'storage-kms-key-id', condition='IsAdvancedPattern'),
+        'StorageKMSKeyArn': _output(
+            'ストレージ用KMSキーARN（S3/EBS）',
+            _if('IsAdvancedPattern', _get_att('S3EncryptionKey', 'Arn'), _get_att('GeneralPurposeKey', 'Arn')),
+            'storage-kms-key-arn', condition='IsAdvancedPattern'),
+    }
+
+    # EC2テンプレート用の追加Outputs
+    ec2_additional_outputs = {
+        'LaunchTemplateId': _output(
+            'Launch Template ID', _ref('EC2LaunchTemplate'), 'LaunchTemplate-Id'),
+        'LaunchTemplateVersion': _output(
+            'Launch Template Latest Version', _get_att('EC2LaunchTemplate', 'LatestVersionNumber'),
+            'LaunchTemplate-Version'),
+        'IAMRoleArn': _output(
+            'EC2 IAM Role ARN', _get_att('EC2Role', 'Arn'), 'IAM-Role-Arn'),
+        'InstanceProfileArn': _output(
+            'EC2 Instance Profile ARN', _get_att('EC2InstanceProfile', 'Arn'), 'InstanceProfile-Arn'),
+        'EC2LogGroupName': _output(
+            'EC2 Log Group Name', _ref('EC2LogGroup'), 'EC2-LogGroup-Name'),
+    }
+
+    # CloudWatchテンプレート用の追加Outputs
+    dashboard_url = ('https://${AWS::Region}.console.aws.amazon.com/cloudwatch/home'
+                     '?region=${AWS::Region}#dashboards:name=${ProjectName}-${Environment}-')
+    cloudwatch_additional_outputs = {
+        'SlackNotificationFunctionArn': _output(
+            'Slack Notification Lambda Function ARN',
+            _if('HasSlackWebhook', _get_att('SlackNotificationFunction', 'Arn'), 'N/A'),
+            'slack-notification-function-arn'),
+        'MonitoringDashboardUrl': _output(
+            'CloudWatch Dashboard URL',
+            _if('CreateAdvancedResources', {'Fn::Sub': dashboard_url + 'monitoring'}, 'N/A'),
+            'dashboard-url'),
+        'EnterpriseDashboardUrl': _output(
+            'Enterprise CloudWatch Dashboard URL',
+            _if('CreateEnterpriseResources', {'Fn::Sub': dashboard_url + 'enterprise'}, 'N/A'),
+            'enterprise-dashboard-url'),
+        'ErrorMetricFilterName': _output(
+            'Error Metric Filter Name', _ref('ErrorMetricFilter'), 'error-metric-filter'),
+        'WarningMetricFilterName': _output(
+            'Warning Metric Filter Name', _ref('WarningMetricFilter'), 'warning-metric-filter'),
+    }
+
+    return types.MappingProxyType({
+        'vpc': vpc_additional_outputs,
+        'iam': iam_additional_outputs,
+        'kms': kms_additional_outputs,
+        'ec2': ec2_additional_outputs,
+        'cloudwatch': cloudwatch_additional_outputs
+    })
+
+def render_outputs(outputs: Dict[str, Any]) -> str:
+    """Output定義をOutputsセクションに追記できるYAMLテキストへ変換"""
+    document = yaml.dump({'Outputs': outputs}, Dumper=_SafeDumper, default_flow_style=False,
+                         allow_unicode=True, sort_keys=False)
+    # 先頭の "Outputs:" 行を除き、既存セクション配下に連結できる形にする
+    return _OUTPUTS_HEADER + document.split('\n', 1)[1]
+
+# Output定義は固定のため、種別ごとのYAMLをインポート時に一度だけ生成してバイト列で保持
+_ENHANCED_OUTPUTS_BYTES = types.MappingProxyType({
+    output_type: render_outputs(outputs).encode('utf-8')
+    for output_type, outputs in generate_enhanced_outputs().items()
+})
+
+def _has_outputs_section(fd: int, size: int) -> bool:
+    """末尾から既存のOutputsセクションを探す（見つからない場合のみ全体を確認）"""
+    offset = max(0, size - _TAIL_SCAN_BYTES)
+    if b'Outputs:' in os.pread(fd, size - offset, offset):
+        return True
+    # Outputsは慣例上末尾にあるが、途中に置かれたテンプレートも従来通り検出する
+    return offset > 0 and b'Outputs:' in os.pread(fd, offset + len(b'Outputs:'), 0)
+
+def append_outputs_to_template(template_path: str, additional_outputs: bytes):
+    """テンプレートファイルにOutputsを追加"""
+    
+    fd = os.open(template_path, os.O_RDWR)
+    try:
+        size = os.fstat(fd).st_size
+        
+        # Outputsセクションの最後を見つけて追加
+        if _has_outputs_section(fd, size):
+            # 既存のOutputsセクションの最後に追加
+            data = additional_outputs
+        else:
+            # Outputsセクションが存在しない場合は新規作成
+            data = b"\nOutputs:" + additional_outputs
+        
+        # 追記のみのため既存部分は書き換えない
+        os.lseek(fd, 0, os.SEEK_END)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    
+    print(f"Enhanced outputs added to {template_path}")
+
+def _process_one(template_path: str, output_type: str):
+    """テンプレート1件にOutputsを追加（ワーカープロセスで実行）"""
+    print(f"\nProcessing {template_path}")
+    append_outputs_to_template(template_path, _ENHANCED_OUTPUTS_BYTES[output_type])
+
+def main():
+    """メイン処理"""
+    
+    # 強化されたOutputsを生成
+    enhanced_outputs = generate_enhanced_outputs()
+    
+    # テンプレートファイルのマッピング
+    template_mappings = {
+        'cf-templates/networking/vpc/vpc-template.yaml': 'vpc',
+        'cf-templates/foundation/iam/iam-roles-policies.yaml': 'iam',
+        'cf-templates/foundation/kms/kms-keys.yaml': 'kms',
+        'cf-templates/compute/ec2/ec2-autoscaling.yaml': 'ec2',
+        'cf-templates/integration/cloudwatch/cloudwatch-template.yaml': 'cloudwatch'
+    }
+    
+    # ディレクトリ単位でファイル一覧を取得（テンプレートごとのstatを避ける）
+    existing_files = {}
+    for template_path in template_mappings:
+        parent = os.path.dirname(template_path)
+        if parent not in existing_files:
+            try:
+                with os.scandir(parent) as entries:
+                    existing_files[parent] = {entry.name for entry in entries}
+            except FileNotFoundError:
+                existing_files[parent] = set()
+    
+    # 処理対象のテンプレートを抽出
+    template_paths = []
+    output_types = []
+    for template_path, output_type in template_mappings.items():
+        template_file = Path(template_path)
+        
+        if template_file.name in existing_files[os.path.dirname(template_path)] and output_type in enhanced_outputs:
+            template_paths.append(str(template_file))
+            output_types.append(output_type)
+        else:
+            print(f"Warning: Template not found or no outputs defined: {template_path}")
+    
+    # 各テンプレートは独立しているためプロセスプールで並列に処理
+    if template_paths:
+        with ProcessPoolExecutor(max_workers=min(len(template_paths), os.cpu_count() or 1)) as executor:
+            list(executor.map(_process_one, template_paths, output_types))
+    
+    print("\nAll templates have been enhanced with cross-stack outputs!")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,248 +1,456 @@
-#!/usr/bin/env python3
-"""
-Parameter Processor Utility for CloudFormation Templates
-Validates JSON configuration files and converts them to CloudFormation parameters
-"""
-
-import json
-import sys
-import os
-from typing import Dict, List, Any, Optional, Tuple
-from jsonschema import validate, ValidationError
-from pathlib import Path
-
-
-class ParameterProcessor:
-    """Processes JSON configuration files for CloudFormation templates"""
-    
-    def __init__(self, schema_dir: str = None):
-        """Initialize the parameter processor
-        
-        Args:
-            schema_dir: Directory containing JSON schemas
-        """
-        if schema_dir is None:
-            current_dir = Path(__file__).parent
-            schema_dir = current_dir.parent.parent / "configurations" / "schemas"
-        
-        self.schema_dir = Path(schema_dir)
-        self.schemas = self._load_schemas()
-    
-    def _load_schemas(self) -> Dict[str, Dict]:
-        """Load all JSON schemas from the schema directory"""
-        schemas = {}
-        
-        try:
-            # Load project configuration schema
-            project_schema_path = self.schema_dir / "project-config-schema.json"
-            if project_schema_path.exists():
-                with open(project_schema_path, 'r', encoding='utf-8') as f:
-                    schemas['project-config'] = json.load(f)
-            
-            # Load template metadata schema
-            template_schema_path = self.schema_dir / "template-metadata-schema.json"
-            if template_schema_path.exists():
-                with open(template_schema_path, 'r', encoding='utf-8') as f:
-                    schemas['template-metadata'] = json.load(f)
-                    
-        except Exception as e:
-            print(f"Warning: Could not load schemas: {e}")
-        
-        return schemas
-    
-    def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
-        """Validate configuration against schema
-        
-        Args:
-            config: Configuration dictionary to validate
-            
-        Returns:
-            Tuple of (is_valid, error_messages)
-        """
-        errors = []
-        
-        if 'project-config' not in self.schemas:
-            errors.append("Project configuration schema not found")
-            return False, errors
-        
-        try:
-            validate(instance=config, schema=self.schemas['project-config'])
-            return True, []
-        except ValidationError as e:
-            errors.append(f"Validation error: {e.message}")
-            if e.path:
-                errors.append(f"Path: {' -> '.join(str(p) for p in e.path)}")
-            return False, errors
-        except Exception as e:
-            errors.append(f"Unexpected validation error: {str(e)}")
-            return False, errors
-    
-    def convert_to_cf_parameters(self, config: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert JSON configuration to CloudFormation parameters format
-        
-        Args:
-            config: Validated configuration dictionary
-            
-        Returns:
-            CloudFormation parameters dictionary
-        """
-        cf_params = {}
-        
-        # Process project configuration
-        if 'projectConfig' in config:
-            project_config = config['projectConfig']
-            
-            # Basic project parameters
-            cf_params['ProjectName'] = project_config.get('projectName', '')
-            cf_params['Environment'] = project_config.get('environment', 'dev')
-            cf_params['Region'] = project_config.get('region', 'us-east-1')
-            
-            # Availability zones
-            if 'availabilityZones' in project_config:
-                az_list = project_config['availabilityZones']
-                cf_params['AvailabilityZones'] = ','.join(az_list)
-                cf_params['AvailabilityZoneCount'] = str(len(az_list))
-            
-            # Tags
-            if 'tags' in project_config:
-                tags = project_config['tags']
-                # Convert tags to CloudFormation format
-                tag_list = []
-                for key, value in tags.items():
-                    tag_list.append(f"{key}={value}")
-                cf_params['ResourceTags'] = ','.join(tag_list)
-        
-        # Process service configurations
-        if 'serviceConfigs' in config:
-            service_configs = config['serviceConfigs']
-            
-            # VPC configuration
-            if 'vpc' in service_configs:
-                vpc_config = service_configs['vpc']
-                cf_params['VpcPattern'] = vpc_config.get('pattern', 'basic')
-                cf_params['VpcCidrBlock'] = vpc_config.get('cidrBlock', '10.0.0.0/16')
-                cf_params['EnableDnsHostnames'] = str(vpc_config.get('enableDnsHostnames', True)).lower()
-                cf_params['EnableDnsSupport'] = str(vpc_config.get('enableDnsSupport', True)).lower()
-            
-            # EC2 configuration
-            if 'ec2' in service_configs:
-                ec2_config = service_configs['ec2']
-                cf_params['Ec2Pattern'] = ec2_config.get('pattern', 'basic')
-                if 'instanceType' in ec2_config:
-                    cf_params['InstanceType'] = ec2_config['instanceType']
-                if 'amiId' in ec2_config:
-                    cf_params['AmiId'] = ec2_config['amiId']
-                if 'keyPairName' in ec2_config:
-                    cf_params['KeyPairName'] = ec2_config['keyPairName']
-        
-        # Process integration options
-        if 'integrationOptions' in config:
-            integration_options = config['integrationOptions']
-            cf_params['EnableCrossStackReferences'] = str(integration_options.get('crossStackReferences', True)).lower()
-            cf_params['EnableMonitoringIntegration'] = str(integration_options.get('monitoringIntegration', True)).lower()
-            
-            if 'sharedResources' in integration_options:
-                shared_resources = integration_options['sharedResources']
-                cf_params['SharedResources'] = ','.join(shared_resources)
-        
-        return cf_params
-    
-    def generate_cf_parameters_file(self, config: Dict[str, Any], output_path: str) -> bool:
-        """Generate CloudFormation parameters file
-        
-        Args:
-            config: Configuration dictionary
-            output_path: Path to output parameters file
-            
-        Returns:
-            True if successful, False otherwise
-        """
-        try:
-            cf_params = self.convert_to_cf_parameters(config)
-            
-            # Create CloudFormation parameters format
-            cf_parameters = []
-            for key, value in cf_params.items():
-                cf_parameters.append({
-                    "ParameterKey": key,
-                    "ParameterValue": str(value)
-                })
-            
-            # Write to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(cf_parameters, f, indent=2, ensure_ascii=False)
-            
-            return True
-        except Exception as e:
-            print(f"Error generating CloudFormation parameters file: {e}")
-            return False
-    
-    def process_config_file(self, config_path: str, output_path: str = None) -> Tuple[bool, List[str]]:
-        """Process a configuration file
-        
-        Args:
-            config_path: Path to JSON configuration file
-            output_path: Path to output CloudFormation parameters file
-            
-        Returns:
-            Tuple of (success, messages)
-        """
-        messages = []
-        
-        try:
-            # Load configuration file
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            
-            # Validate configuration
-            is_valid, validation_errors = self.validate_config(config)
-            if not is_valid:
-                messages.extend(validation_errors)
-                return False, messages
-            
-            messages.append("Configuration validation successful")
-            
-            # Generate output path if not provided
-            if output_path is None:
-                config_file = Path(config_path)
-                output_path = config_file.parent / f"{config_file.stem}-cf-parameters.json"
-            
-            # Generate CloudFormation parameters file
-            if self.generate_cf_parameters_file(config, output_path):
-                messages.append(f"CloudFormation parameters file generated: {output_path}")
-                return True, messages
-            else:
-                messages.append("Failed to generate CloudFormation parameters file")
-                return False, messages
-                
-        except FileNotFoundError:
-            messages.append(f"Configuration file not found: {config_path}")
-            return False, messages
-        except json.JSONDecodeError as e:
-            messages.append(f"Invalid JSON in configuration file: {e}")
-            return False, messages
-        except Exception as e:
-            messages.append(f"Unexpected error processing configuration: {e}")
-            return False, messages
-
-
-def main():
-    """Command line interface for parameter processor"""
-    if len(sys.argv) < 2:
-        print("Usage: python parameter-processor.py <config-file> [output-file]")
-        sys.exit(1)
-    
-    config_file = sys.argv[1]
-    output_file = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    processor = ParameterProcessor()
-    success, messages = processor.process_config_file(config_file, output_file)
-    
-    for message in messages:
-        print(message)
-    
-    sys.exit(0 if success else 1)
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Parameter Processor Utility for CloudFormation Templates
+Validates JSON configuration files and converts them to CloudFormation parameters
+"""
+
+import json
+import sys
+import os
+import functools
+import hashlib
+import mmap
+from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# fastjsonschema generates a specialized validation function per schema;
+# fall back to the jsonschema interpreter when it is not installed
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Directory of this module and the default schema directory
+_HERE = Path(__file__).parent
+_SCHEMA_DIR = _HERE.parent.parent / "configurations" / "schemas"
+
+
+def _json_loads(data) -> Any:
+    """Parse UTF-8 encoded JSON from bytes or a memoryview, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(str(data, 'utf-8'))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 encoded JSON indented by two spaces, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Schema key and file name of each schema loaded from the schema directory
+_SCHEMA_FILES = (
+    ('project-config', "project-config-schema.json"),
+    ('template-metadata', "template-metadata-schema.json"),
+)
+
+
+def _validator_for(schema_path: str):
+    """Load a schema file and build its validator
+    
+    Args:
+        schema_path: Path to the JSON schema file
+        
+    Returns:
+        Tuple of (schema, validator). The validator is a compiled function when
+        fastjsonschema is available, otherwise a jsonschema validator instance.
+    """
+    with open(schema_path, 'rb') as f:
+        schema = _json_loads(f.read())
+    
+    if fastjsonschema is not None:
+        return schema, fastjsonschema.compile(schema)
+    
+    # jsonschema is slow to import, so load it only when it is actually used
+    from jsonschema.validators import validator_for
+    
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return schema, validator_class(schema)
+
+
+def _canonical_digest(config: Any) -> bytes:
+    """Hash a parsed configuration independently of key order and formatting"""
+    if orjson is not None:
+        canonical = orjson.dumps(config, option=orjson.OPT_SORT_KEYS)
+    else:
+        canonical = json.dumps(config, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return hashlib.blake2b(canonical, digest_size=16).digest()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_schemas_cached(schema_dir: str, mtimes: Tuple[Tuple[str, int], ...]):
+    """Load and compile the schemas of a directory once per process
+    
+    Args:
+        schema_dir: Absolute path of the schema directory
+        mtimes: (file name, mtime_ns) of each schema file present, so edited schemas are reloaded
+        
+    Returns:
+        Tuple of (key, schema, validator) for each schema file present
+    """
+    present = {file_name for file_name, _ in mtimes}
+    return tuple(
+        (key, *_validator_for(os.path.join(schema_dir, file_name)))
+        for key, file_name in _SCHEMA_FILES
+        if file_name in present
+    )
+
+
+# CloudFormation string representation of boolean configuration values
+_BOOL_STR = {True: 'true', False: 'false'}
+
+
+def _cf_bool(value: Any) -> str:
+    """Convert a boolean configuration value to its CloudFormation parameter string"""
+    if value is True or value is False:
+        return _BOOL_STR[value]
+    return str(value).lower()
+
+
+# Maximum number of configuration contents whose processing results are memoized
+_RESULT_CACHE_SIZE = 256
+
+# Configuration files larger than this are memory-mapped instead of read into memory
+_MMAP_THRESHOLD = 64 * 1024
+
+
+class ParameterProcessor:
+    """Processes JSON configuration files for CloudFormation templates"""
+    
+    def __init__(self, schema_dir: str = None):
+        """Initialize the parameter processor
+        
+        Args:
+            schema_dir: Directory containing JSON schemas
+        """
+        if schema_dir is None:
+            schema_dir = _SCHEMA_DIR
+        
+        self.schema_dir = Path(schema_dir)
+        self._validators = {}
+        self.schemas = self._load_schemas()
+        # Raw or canonical content hash -> (is_valid, errors, cf_params) for configurations already processed
+        self._results: Dict[bytes, Tuple[bool, List[str], Optional[Dict[str, Any]]]] = {}
+        # Output path -> (content hash, mtime_ns) of parameter files written by this instance
+        self._written: Dict[str, Tuple[bytes, int]] = {}
+    
+    def _load_schemas(self) -> Dict[str, Dict]:
+        """Load all JSON schemas from the schema directory and compile their validators"""
+        schemas = {}
+        
+        try:
+            mtimes = []
+            for _, file_name in _SCHEMA_FILES:
+                schema_path = self.schema_dir / file_name
+                if schema_path.exists():
+                    mtimes.append((file_name, schema_path.stat().st_mtime_ns))
+            
+            for key, schema, validator in _load_schemas_cached(str(self.schema_dir.resolve()), tuple(mtimes)):
+                schemas[key] = schema
+                self._validators[key] = validator
+                    
+        except Exception as e:
+            print(f"Warning: Could not load schemas: {e}")
+        
+        return schemas
+    
+    def validate_config(self, config: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        """Validate configuration against schema
+        
+        Args:
+            config: Configuration dictionary to validate
+            
+        Returns:
+            Tuple of (is_valid, error_messages)
+        """
+        errors = []
+        
+        if 'project-config' not in self._validators:
+            errors.append("Project configuration schema not found")
+            return False, errors
+        
+        validator = self._validators['project-config']
+        try:
+            if fastjsonschema is not None:
+                try:
+                    validator(config)
+                except fastjsonschema.JsonSchemaValueException as e:
+                    errors.append(f"Validation error: {e.message}")
+                    # Drop the leading 'data' element that names the root instance
+                    if len(e.path) > 1:
+                        errors.append(f"Path: {' -> '.join(str(p) for p in e.path[1:])}")
+            else:
+                for error in validator.iter_errors(config):
+                    errors.append(f"Validation error: {error.message}")
+                    if error.path:
+                        errors.append(f"Path: {' -> '.join(str(p) for p in error.path)}")
+            return not errors, errors
+        except Exception as e:
+            errors.append(f"Unexpected validation error: {str(e)}")
+            return False, errors
+    
+    def convert_to_cf_parameters(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert JSON configuration to CloudFormation parameters format
+        
+        Args:
+            config: Validated configuration dictionary
+            
+        Returns:
+            CloudFormation parameters dictionary
+        """
+        cf_params = {}
+        
+        # Process project configuration
+        if 'projectConfig' in config:
+            project_config = config['projectConfig']
+            
+            # Basic project parameters
+            cf_params['ProjectName'] = project_config.get('projectName', '')
+            cf_params['Environment'] = project_config.get('environment', 'dev')
+            cf_params['Region'] = project_config.get('region', 'us-east-1')
+            
+            # Availability zones
+            if 'availabilityZones' in project_config:
+                az_list = project_config['availabilityZones']
+                cf_params['AvailabilityZones'] = ','.join(az_list)
+                cf_params['AvailabilityZoneCount'] = f"{len(az_list)}"
+            
+            # Tags
+            if 'tags' in project_config:
+                tags = project_config['tags']
+                # Convert tags to CloudFormation format, sorted so that configurations
+                # sharing a canonical hash produce the same output
+                tag_list = []
+                for key, value in sorted(tags.items()):
+                    tag_list.append(f"{key}={value}")
+                cf_params['ResourceTags'] = ','.join(tag_list)
+        
+        # Process service configurations
+        if 'serviceConfigs' in config:
+            service_configs = config['serviceConfigs']
+            
+            # VPC configuration
+            if 'vpc' in service_configs:
+                vpc_config = service_configs['vpc']
+                cf_params['VpcPattern'] = vpc_config.get('pattern', 'basic')
+                cf_params['VpcCidrBlock'] = vpc_config.get('cidrBlock', '10.0.0.0/16')
+                cf_params['EnableDnsHostnames'] = _cf_bool(vpc_config.get('enableDnsHostnames', True))
+                cf_params['EnableDnsSupport'] = _cf_bool(vpc_config.get('enableDnsSupport', True))
+            
+            # EC2 configuration
+            if 'ec2' in service_configs:
+                ec2_config = service_configs['ec2']
+                cf_params['Ec2Pattern'] = ec2_config.get('pattern', 'basic')
+                if 'instanceType' in ec2_config:
+                    cf_params['InstanceType'] = ec2_config['instanceType']
+                if 'amiId' in ec2_config:
+                    cf_params['AmiId'] = ec2_config['amiId']
+                if 'keyPairName' in ec2_config:
+                    cf_params['KeyPairName'] = ec2_config['keyPairName']
+        
+        # Process integration options
+        if 'integrationOptions' in config:
+            integration_options = config['integrationOptions']
+            cf_params['EnableCrossStackReferences'] = _cf_bool(integration_options.get('crossStackReferences', True))
+            cf_params['EnableMonitoringIntegration'] = _cf_bool(integration_options.get('monitoringIntegration', True))
+            
+            if 'sharedResources' in integration_options:
+                shared_resources = integration_options['sharedResources']
+                cf_params['SharedResources'] = ','.join(shared_resources)
+        
+        return cf_params
+    
+    def generate_cf_parameters_file(self, config: Dict[str, Any], output_path: str) -> bool:
+        """Generate CloudFormation parameters file
+        
+        Args:
+            config: Configuration dictionary
+            output_path: Path to output parameters file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            cf_params = self.convert_to_cf_parameters(config)
+        except Exception as e:
+            print(f"Error generating CloudFormation parameters file: {e}")
+            return False
+        
+        return self._write_cf_parameters(cf_params, output_path)
+    
+    def _write_cf_parameters(self, cf_params: Dict[str, Any], output_path: str) -> bool:
+        """Write converted parameters in CloudFormation parameters file format
+        
+        Args:
+            cf_params: CloudFormation parameters dictionary
+            output_path: Path to output parameters file
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Create CloudFormation parameters format
+            # (values are almost always strings already, so str() is only called when needed)
+            cf_parameters = [
+                {"ParameterKey": key, "ParameterValue": value if isinstance(value, str) else str(value)}
+                for key, value in cf_params.items()
+            ]
+            
+            # Write to file
+            with open(output_path, 'wb') as f:
+                f.write(_json_dumps(cf_parameters))
+            
+            return True
+        except Exception as e:
+            print(f"Error generating CloudFormation parameters file: {e}")
+            return False
+    
+    def _process_cached(self, key: bytes, config_bytes: bytes) -> Tuple[bool, List[str], Optional[Dict[str, Any]]]:
+        """Parse, validate and convert configuration contents, reusing earlier results
+        
+        Results are looked up by the hash of the raw contents first, so unchanged files
+        are not even parsed. On a miss, the parsed configuration is looked up by its
+        canonical hash, so files that differ only in formatting or key order skip
+        validation and conversion. Only valid results are stored under the canonical
+        hash, because validation error messages follow the key order of the file.
+        
+        Args:
+            key: Content hash of config_bytes
+            config_bytes: Raw configuration file contents
+            
+        Returns:
+            Tuple of (is_valid, error_messages, cf_params)
+        """
+        result = self._results.get(key)
+        if result is None:
+            config = _json_loads(config_bytes)
+            canonical_key = _canonical_digest(config)
+            result = self._results.get(canonical_key)
+            if result is None:
+                is_valid, errors = self.validate_config(config)
+                cf_params = self.convert_to_cf_parameters(config) if is_valid else None
+                result = (is_valid, errors, cf_params)
+                if is_valid:
+                    self._remember_result(canonical_key, result)
+            self._remember_result(key, result)
+        
+        return result
+    
+    def _remember_result(self, key: bytes, result: Tuple[bool, List[str], Optional[Dict[str, Any]]]):
+        """Store a processing result, evicting the oldest entry when the cache is full"""
+        if len(self._results) >= _RESULT_CACHE_SIZE:
+            del self._results[next(iter(self._results))]
+        self._results[key] = result
+    
+    def _process_file(self, config_path: str) -> Tuple[bytes, bool, List[str], Optional[Dict[str, Any]]]:
+        """Read a configuration file and process it through the content hash cache
+        
+        Files larger than _MMAP_THRESHOLD are memory-mapped, so their contents are
+        hashed and parsed without first being copied into a bytes object.
+        
+        Args:
+            config_path: Path to JSON configuration file
+            
+        Returns:
+            Tuple of (content_hash, is_valid, error_messages, cf_params)
+        """
+        with open(config_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size <= _MMAP_THRESHOLD:
+                config_bytes = f.read()
+                key = hashlib.blake2b(config_bytes).digest()
+                return (key, *self._process_cached(key, config_bytes))
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                key = hashlib.blake2b(view).digest()
+                return (key, *self._process_cached(key, view))
+    
+    def _is_up_to_date(self, output_path: str, key: bytes) -> bool:
+        """Check whether output_path still holds the parameters this instance wrote for key"""
+        written = self._written.get(str(output_path))
+        if written is None or written[0] != key:
+            return False
+        
+        try:
+            return os.stat(output_path).st_mtime_ns == written[1]
+        except OSError:
+            return False
+    
+    def _write_parameters_for(self, cf_params: Dict[str, Any], output_path: str, key: bytes) -> bool:
+        """Write the parameters file and remember which contents it was generated from"""
+        if not self._write_cf_parameters(cf_params, output_path):
+            return False
+        
+        self._written[str(output_path)] = (key, os.stat(output_path).st_mtime_ns)
+        return True
+    
+    def process_config_file(self, config_path: str, output_path: str = None) -> Tuple[bool, List[str]]:
+        """Process a configuration file
+        
+        Args:
+            config_path: Path to JSON configuration file
+            output_path: Path to output CloudFormation parameters file
+            
+        Returns:
+            Tuple of (success, messages)
+        """
+        messages = []
+        
+        try:
+            # Load, validate and convert configuration (memoized by content hash)
+            key, is_valid, validation_errors, cf_params = self._process_file(config_path)
+            if not is_valid:
+                messages.extend(validation_errors)
+                return False, messages
+            
+            messages.append("Configuration validation successful")
+            
+            # Generate output path if not provided
+            if output_path is None:
+                config_file = Path(config_path)
+                output_path = config_file.parent / f"{config_file.stem}-cf-parameters.json"
+            
+            # Generate CloudFormation parameters file (skip if this content was already written there)
+            if self._is_up_to_date(output_path, key) or self._write_parameters_for(cf_params, output_path, key):
+                messages.append(f"CloudFormation parameters file generated: {output_path}")
+                return True, messages
+            else:
+                messages.append("Failed to generate CloudFormation parameters file")
+                return False, messages
+                
+        except FileNotFoundError:
+            messages.append(f"Configuration file not found: {config_path}")
+            return False, messages
+        except json.JSONDecodeError as e:
+            messages.append(f"Invalid JSON in configuration file: {e}")
+            return False, messages
+        except Exception as e:
+            messages.append(f"Unexpected error processing configuration: {e}")
+            return False, messages
+
+
+def main():
+    """Command line interface for parameter processor"""
+    if len(sys.argv) < 2:
+        print("Usage: python parameter-processor.py <config-file> [output-file]")
+        sys.exit(1)
+    
+    config_file = sys.argv[1]
+    output_file = sys.argv[2] if len(sys.argv) > 2 else None
+    
+    processor = ParameterProcessor()
+    success, messages = processor.process_config_file(config_file, output_file)
+    
+    sys.stdout.write("".join(f"{message}\n" for message in messages))
+    
+    sys.exit(0 if success else 1)
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,156 +1,265 @@
-#!/usr/bin/env python3
-"""
-Template Outputs Updater
-既存のCloudFormationテンプレートにクロススタック対応のOutputsを追加
-"""
-
-import yaml
-import json
-import sys
-from pathlib import Path
-
-# Add current directory to path for imports
-sys.path.append(str(Path(__file__).parent))
-
-def update_template_outputs(template_path: str, stack_name: str, config_path: str):
-    """テンプレートのOutputsセクションを更新"""
-    
-    # 設定ファイルを読み込み
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
-    
-    # テンプレートを読み込み
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = yaml.safe_load(f)
-    
-    # 該当スタックのアウトプット設定を取得
-    if stack_name not in config['stack_outputs']:
-        print(f"Warning: {stack_name} の設定が見つかりません")
-        return
-    
-    outputs_config = config['stack_outputs'][stack_name]
-    
-    # Outputsセクションを構築
-    outputs = {}
-    for output_config in outputs_config:
-        output_def = {
-            'Description': output_config['description'],
-            'Value': output_config['value']
-        }
-        
-        # Export設定
-        if output_config['export_name']:
-            export_name = output_config['export_name'].replace('{ProjectName}', '${ProjectName}').replace('{Environment}', '${Environment}')
-            output_def['Export'] = {'Name': export_name}
-        
-        # Condition設定
-        if output_config['conditions']:
-            if len(output_config['conditions']) == 1:
-                output_def['Condition'] = output_config['conditions'][0]
-            else:
-                # 複数条件の場合はOrで結合（設定によってはAndも可能）
-                output_def['Condition'] = {'Fn::Or': [
-                    {'Condition': condition} for condition in output_config['conditions']
-                ]}
-        
-        outputs[output_config['name']] = output_def
-    
-    # テンプレートのOutputsセクションを更新
-    template['Outputs'] = outputs
-    
-    # テンプレートを保存
-    with open(template_path, 'w', encoding='utf-8') as f:
-        yaml.dump(template, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    
-    print(f"Updated outputs for {template_path}")
-
-def add_import_parameters(template_path: str, stack_name: str, config_path: str):
-    """テンプレートにインポートパラメータを追加"""
-    
-    # 設定ファイルを読み込み
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = json.load(f)
-    
-    # テンプレートを読み込み
-    with open(template_path, 'r', encoding='utf-8') as f:
-        template = yaml.safe_load(f)
-    
-    # 該当スタックの依存関係設定を取得
-    if stack_name not in config['dependencies']:
-        print(f"Info: {stack_name} には依存関係がありません")
-        return
-    
-    dependencies = config['dependencies'][stack_name]
-    
-    # Parametersセクションが存在しない場合は作成
-    if 'Parameters' not in template:
-        template['Parameters'] = {}
-    
-    # 各依存関係からインポートパラメータを生成
-    for dep in dependencies:
-        dep_stack_name = dep['stack_name']
-        
-        # 必須アウトプット用のパラメータ
-        for output_name in dep['required_outputs']:
-            param_name = f"Import{output_name.replace('-', '')}"
-            export_name = f"${{ProjectName}}-${{Environment}}-{output_name.lower().replace('_', '-')}"
-            
-            template['Parameters'][param_name] = {
-                'Type': 'String',
-                'Description': f"Import {output_name} from {dep_stack_name} stack",
-                'Default': {'Fn::ImportValue': export_name}
-            }
-        
-        # オプションアウトプット用のパラメータ
-        for output_name in dep.get('optional_outputs', []):
-            param_name = f"Import{output_name.replace('-', '')}Optional"
-            export_name = f"${{ProjectName}}-${{Environment}}-{output_name.lower().replace('_', '-')}"
-            
-            template['Parameters'][param_name] = {
-                'Type': 'String',
-                'Description': f"Optional import {output_name} from {dep_stack_name} stack",
-                'Default': ''
-            }
-    
-    # テンプレートを保存
-    with open(template_path, 'w', encoding='utf-8') as f:
-        yaml.dump(template, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    
-    print(f"Added import parameters for {template_path}")
-
-def main():
-    """メイン処理"""
-    config_path = Path(__file__).parent / 'cross-stack-config.json'
-    templates_base = Path(__file__).parent.parent
-    
-    # テンプレートとスタック名のマッピング
-    template_mappings = {
-        'foundation/iam/iam-roles-policies.yaml': 'foundation-iam',
-        'foundation/kms/kms-template.yaml': 'foundation-kms',
-        'networking/vpc/vpc-template.yaml': 'networking-vpc',
-        'compute/ec2/ec2-autoscaling.yaml': 'compute-ec2',
-        'compute/lambda/lambda-function.yaml': 'compute-lambda',
-        'networking/elb/elb-template.yaml': 'networking-elb',
-        'integration/api-gateway/api-gateway-template.yaml': 'integration-api-gateway',
-        'integration/cloudwatch/cloudwatch-template.yaml': 'integration-cloudwatch'
-    }
-    
-    # 各テンプレートを更新
-    for template_rel_path, stack_name in template_mappings.items():
-        template_path = templates_base / template_rel_path
-        
-        if template_path.exists():
-            print(f"\nProcessing {template_path}")
-            
-            # Outputsセクションを更新
-            update_template_outputs(str(template_path), stack_name, str(config_path))
-            
-            # インポートパラメータを追加
-            add_import_parameters(str(template_path), stack_name, str(config_path))
-        else:
-            print(f"Warning: Template not found: {template_path}")
-    
-    print("\nAll templates have been updated with cross-stack support!")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Template Outputs Updater
+既存のCloudFormationテンプレートにクロススタック対応のOutputsを追加
+"""
+
+import json
+import sys
+import os
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# スクリプトの配置ディレクトリ（utilities）とテンプレートのルートディレクトリ
+_HERE = Path(__file__).parent
+_TEMPLATES_BASE = _HERE.parent
+
+# Add current directory to path for imports
+sys.path.append(str(_HERE))
+
+def _json_loads(data: bytes) -> Any:
+    """JSONを読み込み（orjsonが利用可能な場合は使用）"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+# パラメータ名・エクスポート名生成用の変換テーブル
+_STRIP_DASH = str.maketrans('', '', '-')
+_UNDER_TO_DASH = str.maketrans('_', '-')
+
+@functools.lru_cache(maxsize=None)
+def _names_for(output_name: str) -> Tuple[str, str]:
+    """アウトプット名からパラメータ名とエクスポート名を生成（同じアウトプット名は再計算しない）"""
+    param_name = f"Import{output_name.translate(_STRIP_DASH)}"
+    export_name = f"${{ProjectName}}-${{Environment}}-{output_name.lower().translate(_UNDER_TO_DASH)}"
+    return param_name, export_name
+
+# YAMLライブラリは読み込みに時間がかかるため、テンプレートを実際に処理する時点で読み込む
+@functools.lru_cache(maxsize=None)
+def _round_trip_yaml():
+    """ruamel.yamlのラウンドトリップ用インスタンスを生成（未インストールの場合はNone）
+    
+    変更していないセクションのコメント・順序・短縮形タグを保持する
+    """
+    try:
+        from ruamel.yaml import YAML
+        from ruamel.yaml.constructor import RoundTripConstructor
+    except ImportError:
+        return None
+    
+    class _LastWinsConstructor(RoundTripConstructor):
+        """重複キーは後に現れた値で上書きするコンストラクタ
+        
+        ruamel.yamlのallow_duplicate_keysは最初の値を残すため、PyYAMLと同じ後勝ちの読み込み結果にする
+        """
+        
+        def check_mapping_key(self, node, key_node, mapping, key, value):
+            if key in mapping:
+                mapping[key] = value
+                return False
+            return True
+    
+    yaml_rt = YAML(typ='rt')
+    yaml_rt.Constructor = _LastWinsConstructor
+    yaml_rt.preserve_quotes = True
+    return yaml_rt
+
+@functools.lru_cache(maxsize=None)
+def _safe_yaml():
+    """PyYAMLとローダー/ダンパーを取得（LibYAMLが利用可能な場合はCベース）"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader, CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeLoader as loader, SafeDumper as dumper
+    return yaml, loader, dumper
+
+def _load_template(template_path: str) -> Dict[str, Any]:
+    """テンプレートを読み込み"""
+    yaml_rt = _round_trip_yaml()
+    if yaml_rt is not None:
+        return yaml_rt.load(Path(template_path))
+    
+    yaml, loader, _ = _safe_yaml()
+    with open(template_path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=loader)
+
+def _save_template(template_path: str, template: Dict[str, Any]):
+    """テンプレートを保存"""
+    yaml_rt = _round_trip_yaml()
+    if yaml_rt is not None:
+        yaml_rt.dump(template, Path(template_path))
+        return
+    
+    yaml, _, dumper = _safe_yaml()
+    with open(template_path, 'w', encoding='utf-8') as f:
+        yaml.dump(template, f, Dumper=dumper, default_flow_style=False, allow_unicode=True, sort_keys=False)
+
+def _apply_outputs(template: Dict[str, Any], stack_name: str, config: Dict[str, Any]) -> bool:
+    """読み込み済みテンプレートのOutputsセクションを更新（更新した場合はTrue）"""
+    
+    # 該当スタックのアウトプット設定を取得
+    if stack_name not in config['stack_outputs']:
+        print(f"Warning: {stack_name} の設定が見つかりません")
+        return False
+    
+    outputs_config = config['stack_outputs'][stack_name]
+    
+    # Outputsセクションを構築
+    outputs = {}
+    for output_config in outputs_config:
+        output_def = {
+            'Description': output_config['description'],
+            'Value': output_config['value']
+        }
+        
+        # Export設定
+        if output_config['export_name']:
+            export_name = output_config['export_name'].replace('{ProjectName}', '${ProjectName}').replace('{Environment}', '${Environment}')
+            output_def['Export'] = {'Name': export_name}
+        
+        # Condition設定
+        if output_config['conditions']:
+            if len(output_config['conditions']) == 1:
+                output_def['Condition'] = output_config['conditions'][0]
+            else:
+                # 複数条件の場合はOrで結合（設定によってはAndも可能）
+                output_def['Condition'] = {'Fn::Or': [
+                    {'Condition': condition} for condition in output_config['conditions']
+                ]}
+        
+        outputs[output_config['name']] = output_def
+    
+    # テンプレートのOutputsセクションを更新
+    template['Outputs'] = outputs
+    return True
+
+def _apply_imports(template: Dict[str, Any], stack_name: str, config: Dict[str, Any]) -> bool:
+    """読み込み済みテンプレートにインポートパラメータを追加（追加した場合はTrue）"""
+    
+    # 該当スタックの依存関係設定を取得
+    if stack_name not in config['dependencies']:
+        print(f"Info: {stack_name} には依存関係がありません")
+        return False
+    
+    dependencies = config['dependencies'][stack_name]
+    
+    # Parametersセクションが存在しない場合は作成
+    if 'Parameters' not in template:
+        template['Parameters'] = {}
+    
+    # 各依存関係からインポートパラメータを生成
+    for dep in dependencies:
+        dep_stack_name = dep['stack_name']
+        
+        # 必須アウトプット用のパラメータ
+        for output_name in dep['required_outputs']:
+            param_name, export_name = _names_for(output_name)
+            
+            template['Parameters'][param_name] = {
+                'Type': 'String',
+                'Description': f"Import {output_name} from {dep_stack_name} stack",
+                'Default': {'Fn::ImportValue': export_name}
+            }
+        
+        # オプションアウトプット用のパラメータ
+        for output_name in dep.get('optional_outputs', []):
+            param_name = f"{_names_for(output_name)[0]}Optional"
+            
+            template['Parameters'][param_name] = {
+                'Type': 'String',
+                'Description': f"Optional import {output_name} from {dep_stack_name} stack",
+                'Default': ''
+            }
+    
+    return True
+
+def process_template(template_path: str, stack_name: str, config: Dict[str, Any]):
+    """テンプレートを1回だけ読み込み、Outputsとインポートパラメータをまとめて更新して保存"""
+    
+    template = _load_template(template_path)
+    
+    outputs_updated = _apply_outputs(template, stack_name, config)
+    imports_added = _apply_imports(template, stack_name, config)
+    
+    if outputs_updated or imports_added:
+        _save_template(template_path, template)
+    
+    if outputs_updated:
+        print(f"Updated outputs for {template_path}")
+    if imports_added:
+        print(f"Added import parameters for {template_path}")
+
+def update_template_outputs(template_path: str, stack_name: str, config: Dict[str, Any]):
+    """テンプレートのOutputsセクションを更新"""
+    
+    template = _load_template(template_path)
+    if _apply_outputs(template, stack_name, config):
+        _save_template(template_path, template)
+        print(f"Updated outputs for {template_path}")
+
+def add_import_parameters(template_path: str, stack_name: str, config: Dict[str, Any]):
+    """テンプレートにインポートパラメータを追加"""
+    
+    template = _load_template(template_path)
+    if _apply_imports(template, stack_name, config):
+        _save_template(template_path, template)
+        print(f"Added import parameters for {template_path}")
+
+def _process_one(template_path: str, stack_name: str, config: Dict[str, Any]):
+    """テンプレート1件を更新（ワーカープロセスで実行）"""
+    print(f"\nProcessing {template_path}")
+    
+    # Outputsセクションの更新とインポートパラメータの追加を1回の読み書きで実行
+    process_template(template_path, stack_name, config)
+
+def main():
+    """メイン処理"""
+    config_path = _HERE / 'cross-stack-config.json'
+    templates_base = _TEMPLATES_BASE
+    
+    # 設定ファイルは全テンプレートで共通のため一度だけ読み込む
+    with open(config_path, 'rb') as f:
+        config = _json_loads(f.read())
+    
+    # テンプレートとスタック名のマッピング
+    template_mappings = {
+        'foundation/iam/iam-roles-policies.yaml': 'foundation-iam',
+        'foundation/kms/kms-template.yaml': 'foundation-kms',
+        'networking/vpc/vpc-template.yaml': 'networking-vpc',
+        'compute/ec2/ec2-autoscaling.yaml': 'compute-ec2',
+        'compute/lambda/lambda-function.yaml': 'compute-lambda',
+        'networking/elb/elb-template.yaml': 'networking-elb',
+        'integration/api-gateway/api-gateway-template.yaml': 'integration-api-gateway',
+        'integration/cloudwatch/cloudwatch-template.yaml': 'integration-cloudwatch'
+    }
+    
+    # 処理対象のテンプレートを抽出
+    template_paths = []
+    stack_names = []
+    for template_rel_path, stack_name in template_mappings.items():
+        template_path = templates_base / template_rel_path
+        
+        if template_path.exists():
+            template_paths.append(str(template_path))
+            stack_names.append(stack_name)
+        else:
+            print(f"Warning: Template not found: {template_path}")
+    
+    # 各テンプレートは独立しているためプロセスプールで並列に処理
+    if template_paths:
+        with ProcessPoolExecutor(max_workers=min(len(template_paths), os.cpu_count() or 1)) as executor:
+            list(executor.map(_process_one, template_paths, stack_names, repeat(config)))
+    
+    print("\nAll templates have been updated with cross-stack support!")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,329 +1,698 @@
-#!/usr/bin/env python3
-"""
-Cross-Stack Dependencies Validator
-クロススタック依存関係の検証とエラーハンドリング
-"""
-
-import json
-import yaml
-import boto3
-import sys
-from pathlib import Path
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-import argparse
-
-@dataclass
-class ValidationResult:
-    """検証結果"""
-    stack_name: str
-    is_valid: bool
-    errors: List[str]
-    warnings: List[str]
-    missing_exports: List[str]
-    circular_dependencies: List[str]
-
-class DependencyValidator:
-    """依存関係検証クラス"""
-    
-    def __init__(self, region: str = 'us-east-1', profile: str = 'mame-local-wani'):
-        self.region = region
-        session = boto3.Session(profile_name=profile)
-        self.cf_client = session.client('cloudformation', region_name=region)
-        self.validation_results = {}
-    
-    def load_config(self, config_path: str) -> Dict[str, Any]:
-        """設定ファイルを読み込み"""
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
-    def get_stack_exports(self, stack_name: str) -> Dict[str, str]:
-        """スタックのエクスポート値を取得"""
-        try:
-            response = self.cf_client.describe_stacks(StackName=stack_name)
-            stack = response['Stacks'][0]
-            
-            if stack['StackStatus'] not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
-                return {}
-            
-            exports = {}
-            for output in stack.get('Outputs', []):
-                if 'ExportName' in output:
-                    exports[output['OutputKey']] = output['ExportName']
-            
-            return exports
-            
-        except self.cf_client.exceptions.ClientError as e:
-            if e.response['Error']['Code'] == 'ValidationError':
-                return {}  # スタックが存在しない
-            raise
-    
-    def validate_stack_dependencies(self, stack_name: str, config: Dict[str, Any]) -> ValidationResult:
-        """単一スタックの依存関係を検証"""
-        result = ValidationResult(
-            stack_name=stack_name,
-            is_valid=True,
-            errors=[],
-            warnings=[],
-            missing_exports=[],
-            circular_dependencies=[]
-        )
-        
-        if stack_name not in config['dependencies']:
-            return result
-        
-        dependencies = config['dependencies'][stack_name]
-        
-        for dep in dependencies:
-            dep_stack_name = dep['stack_name']
-            required_outputs = dep['required_outputs']
-            optional_outputs = dep.get('optional_outputs', [])
-            
-            # 依存スタックの存在確認
-            try:
-                response = self.cf_client.describe_stacks(StackName=dep_stack_name)
-                stack_status = response['Stacks'][0]['StackStatus']
-                
-                if stack_status not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
-                    result.errors.append(
-                        f"依存スタック '{dep_stack_name}' のステータスが不正: {stack_status}"
-                    )
-                    result.is_valid = False
-                    continue
-                
-                # エクスポート値の確認
-                stack_outputs = response['Stacks'][0].get('Outputs', [])
-                available_exports = {}
-                for output in stack_outputs:
-                    if 'ExportName' in output:
-                        available_exports[output['OutputKey']] = output['ExportName']
-                
-                # 必須エクスポートの確認
-                for required_output in required_outputs:
-                    if required_output not in available_exports:
-                        result.missing_exports.append(
-                            f"必須エクスポート '{required_output}' が依存スタック '{dep_stack_name}' に存在しません"
-                        )
-                        result.is_valid = False
-                
-                # オプションエクスポートの確認
-                for optional_output in optional_outputs:
-                    if optional_output not in available_exports:
-                        result.warnings.append(
-                            f"オプションエクスポート '{optional_output}' が依存スタック '{dep_stack_name}' に存在しません"
-                        )
-            
-            except self.cf_client.exceptions.ClientError as e:
-                if e.response['Error']['Code'] == 'ValidationError':
-                    result.errors.append(f"依存スタック '{dep_stack_name}' が存在しません")
-                    result.is_valid = False
-                else:
-                    result.errors.append(f"依存スタック '{dep_stack_name}' の確認中にエラー: {str(e)}")
-                    result.is_valid = False
-        
-        return result
-    
-    def detect_circular_dependencies(self, config: Dict[str, Any]) -> List[List[str]]:
-        """循環依存関係を検出"""
-        dependencies = config.get('dependencies', {})
-        circular_deps = []
-        
-        def has_path(start: str, end: str, visited: set) -> bool:
-            """startからendへのパスが存在するかチェック"""
-            if start == end:
-                return True
-            
-            if start in visited:
-                return False
-            
-            visited.add(start)
-            
-            if start in dependencies:
-                for dep in dependencies[start]:
-                    if has_path(dep['stack_name'], end, visited.copy()):
-                        return True
-            
-            return False
-        
-        # 各スタックペアで循環依存をチェック
-        all_stacks = set(dependencies.keys())
-        for deps in dependencies.values():
-            for dep in deps:
-                all_stacks.add(dep['stack_name'])
-        
-        for stack_a in all_stacks:
-            for stack_b in all_stacks:
-                if stack_a != stack_b:
-                    if (has_path(stack_a, stack_b, set()) and 
-                        has_path(stack_b, stack_a, set())):
-                        cycle = [stack_a, stack_b]
-                        if cycle not in circular_deps and cycle[::-1] not in circular_deps:
-                            circular_deps.append(cycle)
-        
-        return circular_deps
-    
-    def validate_export_naming_consistency(self, config: Dict[str, Any]) -> List[str]:
-        """エクスポート名の命名規則一貫性をチェック"""
-        issues = []
-        stack_outputs = config.get('stack_outputs', {})
-        
-        for stack_name, outputs in stack_outputs.items():
-            for output in outputs:
-                export_name = output.get('export_name', '')
-                if not export_name:
-                    continue
-                
-                # 命名規則チェック: {ProjectName}-{Environment}-{ResourceName}
-                if not ('{ProjectName}' in export_name and '{Environment}' in export_name):
-                    issues.append(
-                        f"スタック '{stack_name}' のエクスポート '{output['name']}' の命名規則が不正: {export_name}"
-                    )
-        
-        return issues
-    
-    def validate_all_stacks(self, config: Dict[str, Any]) -> Dict[str, ValidationResult]:
-        """全スタックの依存関係を検証"""
-        results = {}
-        
-        # 循環依存関係の検出
-        circular_deps = self.detect_circular_dependencies(config)
-        
-        # エクスポート命名規則の検証
-        naming_issues = self.validate_export_naming_consistency(config)
-        
-        # 各スタックの検証
-        all_stacks = set(config.get('dependencies', {}).keys())
-        for deps in config.get('dependencies', {}).values():
-            for dep in deps:
-                all_stacks.add(dep['stack_name'])
-        
-        for stack_name in all_stacks:
-            result = self.validate_stack_dependencies(stack_name, config)
-            
-            # 循環依存関係の情報を追加
-            for cycle in circular_deps:
-                if stack_name in cycle:
-                    result.circular_dependencies.extend(cycle)
-                    result.errors.append(f"循環依存関係が検出されました: {' -> '.join(cycle)}")
-                    result.is_valid = False
-            
-            results[stack_name] = result
-        
-        # 命名規則の問題を全体の警告として追加
-        if naming_issues:
-            for stack_name in results:
-                results[stack_name].warnings.extend(naming_issues)
-        
-        return results
-    
-    def generate_validation_report(self, results: Dict[str, ValidationResult]) -> str:
-        """検証レポートを生成"""
-        report = []
-        report.append("=" * 80)
-        report.append("Cross-Stack Dependencies Validation Report")
-        report.append("=" * 80)
-        report.append("")
-        
-        # サマリー
-        total_stacks = len(results)
-        valid_stacks = sum(1 for r in results.values() if r.is_valid)
-        invalid_stacks = total_stacks - valid_stacks
-        
-        report.append(f"Total Stacks: {total_stacks}")
-        report.append(f"Valid Stacks: {valid_stacks}")
-        report.append(f"Invalid Stacks: {invalid_stacks}")
-        report.append("")
-        
-        # 各スタックの詳細
-        for stack_name, result in results.items():
-            report.append(f"Stack: {stack_name}")
-            report.append(f"Status: {'✓ VALID' if result.is_valid else '✗ INVALID'}")
-            
-            if result.errors:
-                report.append("  Errors:")
-                for error in result.errors:
-                    report.append(f"    - {error}")
-            
-            if result.warnings:
-                report.append("  Warnings:")
-                for warning in result.warnings:
-                    report.append(f"    - {warning}")
-            
-            if result.missing_exports:
-                report.append("  Missing Exports:")
-                for missing in result.missing_exports:
-                    report.append(f"    - {missing}")
-            
-            report.append("")
-        
-        return "\n".join(report)
-    
-    def save_validation_report(self, results: Dict[str, ValidationResult], output_path: str):
-        """検証レポートをファイルに保存"""
-        report = self.generate_validation_report(results)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(report)
-        
-        print(f"Validation report saved to: {output_path}")
-
-def main():
-    """メイン処理"""
-    parser = argparse.ArgumentParser(description='Cross-Stack Dependencies Validator')
-    parser.add_argument('--config', '-c', 
-                       default='cross-stack-config.json',
-                       help='Configuration file path')
-    parser.add_argument('--region', '-r', 
-                       default='us-east-1',
-                       help='AWS region')
-    parser.add_argument('--profile', '-p',
-                       default='mame-local-wani',
-                       help='AWS profile name')
-    parser.add_argument('--output', '-o',
-                       default='validation-report.txt',
-                       help='Output report file path')
-    parser.add_argument('--stack', '-s',
-                       help='Validate specific stack only')
-    
-    args = parser.parse_args()
-    
-    # 設定ファイルのパス解決
-    config_path = Path(args.config)
-    if not config_path.is_absolute():
-        if str(config_path).startswith('cf-templates/'):
-            config_path = Path(args.config)
-        else:
-            config_path = Path(__file__).parent / config_path
-    
-    if not config_path.exists():
-        print(f"Error: Configuration file not found: {config_path}")
-        sys.exit(1)
-    
-    # バリデーターを初期化
-    validator = DependencyValidator(region=args.region, profile=args.profile)
-    
-    # 設定を読み込み
-    config = validator.load_config(str(config_path))
-    
-    # 検証実行
-    if args.stack:
-        # 特定スタックのみ検証
-        result = validator.validate_stack_dependencies(args.stack, config)
-        results = {args.stack: result}
-    else:
-        # 全スタック検証
-        results = validator.validate_all_stacks(config)
-    
-    # レポート生成
-    report = validator.generate_validation_report(results)
-    print(report)
-    
-    # レポート保存
-    validator.save_validation_report(results, args.output)
-    
-    # 終了コード設定
-    has_errors = any(not r.is_valid for r in results.values())
-    sys.exit(1 if has_errors else 0)
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Cross-Stack Dependencies Validator
+クロススタック依存関係の検証とエラーハンドリング
+"""
+
+import json
+import os
+import yaml
+import boto3
+import re
+import sys
+from botocore.config import Config
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain, islice
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Iterator, Tuple, Set
+from dataclasses import dataclass, field
+import argparse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Python 3.10以降では__slots__付きのdataclassにしてインスタンスごとの__dict__を持たない
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
+class ValidationResult:
+    """検証結果"""
+    stack_name: str
+    is_valid: bool = True
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    missing_exports: List[str] = field(default_factory=list)
+    circular_dependencies: List[str] = field(default_factory=list)
+
+class DependencyValidator:
+    """依存関係検証クラス"""
+    
+    # 参照するスタック数がこれを超える場合は、スタック名を指定せずページングで一括取得する
+    # （少数の場合はスタック名を指定した取得の方が速い）
+    DESCRIBE_ALL_THRESHOLD = 5
+    # スタックごとの検証を並列実行するスレッド数（API呼び出しの待ち時間を重ねる）
+    MAX_WORKERS = 10
+    # レポート保存時に1回の書き込みにまとめる行数
+    REPORT_WRITE_LINES = 1024
+    # エクスポート名の命名規則: {ProjectName}と{Environment}を両方含む（先頭に固定した先読みで1回照合）
+    _NAMING_RE = re.compile(r'(?=.*\{ProjectName\})(?=.*\{Environment\})', re.DOTALL)
+    
+    def __init__(self, region: str = 'us-east-1', profile: str = 'mame-local-wani', max_retries: int = 10):
+        self.region = region
+        session = boto3.Session(profile_name=profile)
+        # 並列実行時のスロットリングでは失敗せずにクライアント側でバックオフさせる
+        client_config = Config(
+            retries={'max_attempts': max_retries, 'mode': 'adaptive'},
+            user_agent_extra='dep-validator'
+        )
+        self.cf_client = session.client('cloudformation', region_name=region, config=client_config)
+        self.validation_results = {}
+        # 循環依存検出結果のキャッシュ（対象のdependencies, 結果）
+        self._circular_cache = None
+        # 依存関係に現れる全スタック名のキャッシュ（対象のdependencies, スタック名）
+        self._stacks = None
+        # describe_stacksの結果キャッシュ（スタック名 -> スタック情報、存在しない場合はNone）
+        self._stack_cache: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+        self._all_stacks_loaded = False
+        # 依存スタックごとのエクスポート（OutputKey -> ExportName）
+        self._exports_by_stack: Dict[str, Dict[str, str]] = {}
+    
+    def load_config(self, config_path: str) -> Dict[str, Any]:
+        """設定ファイルを読み込み"""
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data.decode('utf-8'))
+    
+    def _load_all_stacks(self):
+        """アカウント内の全スタックをページングで一括取得してキャッシュ"""
+        if self._stack_cache is None:
+            self._stack_cache = {}
+        
+        paginator = self.cf_client.get_paginator('describe_stacks')
+        for page in paginator.paginate():
+            for stack in page['Stacks']:
+                self._stack_cache[stack['StackName']] = stack
+        
+        self._all_stacks_loaded = True
+    
+    def _prefetch_stacks(self, stack_names):
+        """参照するスタック数が多い場合は一括取得に切り替える
+        
+        一括取得がAPIエラー（スロットリング、権限不足など）で失敗した場合は、
+        スタック名を指定した個別取得にフォールバックし、エラーは依存関係ごとに報告する
+        """
+        if not self._all_stacks_loaded and len(stack_names) > self.DESCRIBE_ALL_THRESHOLD:
+            try:
+                self._load_all_stacks()
+            except self.cf_client.exceptions.ClientError:
+                pass
+    
+    def _get_stack(self, stack_name: str) -> Optional[Dict[str, Any]]:
+        """スタック情報を取得（存在しない場合はNone）"""
+        if self._stack_cache is None:
+            self._stack_cache = {}
+        
+        if stack_name in self._stack_cache:
+            return self._stack_cache[stack_name]
+        if self._all_stacks_loaded:
+            return None  # 一括取得済みで見つからない場合は存在しない
+        
+        try:
+            stack = self.cf_client.describe_stacks(StackName=stack_name)['Stacks'][0]
+        except self.cf_client.exceptions.ClientError as e:
+            if e.response['Error']['Code'] != 'ValidationError':
+                raise
+            stack = None  # スタックが存在しない
+        
+        self._stack_cache[stack_name] = stack
+        return stack
+    
+    def get_stack_exports(self, stack_name: str) -> Dict[str, str]:
+        """スタックのエクスポート値を取得"""
+        stack = self._get_stack(stack_name)
+        
+        if stack is None or stack['StackStatus'] not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
+            return {}
+        
+        return dict(self._stack_exports(stack_name, stack))
+    
+    @staticmethod
+    def _extract_exports(stack: Dict[str, Any]) -> Dict[str, str]:
+        """スタック情報からエクスポート（OutputKey -> ExportName）を抽出"""
+        return {
+            output['OutputKey']: output['ExportName']
+            for output in stack.get('Outputs', ()) if 'ExportName' in output
+        }
+    
+    def _stack_exports(self, stack_name: str, stack: Dict[str, Any]) -> Dict[str, str]:
+        """スタックのエクスポートを取得（1回の実行でスタックごとに一度だけ抽出）"""
+        exports = self._exports_by_stack.get(stack_name)
+        if exports is None:
+            exports = self._exports_by_stack[stack_name] = self._extract_exports(stack)
+        return exports
+    
+    def validate_stack_dependencies(self, stack_name: str, config: Dict[str, Any],
+                                    bulk_describe: bool = True) -> ValidationResult:
+        """単一スタックの依存関係を検証
+        
+        bulk_describeがFalseの場合は、依存スタックが多くてもアカウント全体の一括取得を行わず
+        スタック名を指定して取得する
+        """
+        result = ValidationResult(stack_name=stack_name)
+        
+        if stack_name not in config['dependencies']:
+            return result
+        
+        dependencies = config['dependencies'][stack_name]
+        if bulk_describe:
+            self._prefetch_stacks({dep['stack_name'] for dep in dependencies})
+        
+        # 内側のループでは属性参照を避けてローカルのリストに集め、最後にまとめて反映
+        errors = []
+        warnings = []
+        missing_exports = []
+        
+        for dep in dependencies:
+            dep_stack_name = dep['stack_name']
+            
+            # 依存スタックの存在確認
+            try:
+                stack = self._get_stack(dep_stack_name)
+                if stack is None:
+                    errors.append(f"依存スタック '{dep_stack_name}' が存在しません")
+                    continue
+                
+                stack_status = stack['StackStatus']
+                
+                if stack_status not in ['CREATE_COMPLETE', 'UPDATE_COMPLETE']:
+                    errors.append(f"依存スタック '{dep_stack_name}' のステータスが不正: {stack_status}")
+                    continue
+                
+                # エクスポート値の確認（同じ依存スタックが複数の依存関係に現れても一度だけ構築）
+                available_exports = self._stack_exports(dep_stack_name, stack)
+                
+                # 必須エクスポートの確認
+                missing_exports.extend(
+                    f"必須エクスポート '{required_output}' が依存スタック '{dep_stack_name}' に存在しません"
+                    for required_output in dep['required_outputs'] if required_output not in available_exports
+                )
+                
+                # オプションエクスポートの確認
+                warnings.extend(
+                    f"オプションエクスポート '{optional_output}' が依存スタック '{dep_stack_name}' に存在しません"
+                    for optional_output in dep.get('optional_outputs', []) if optional_output not in available_exports
+                )
+            
+            except self.cf_client.exceptions.ClientError as e:
+                errors.append(f"依存スタック '{dep_stack_name}' の確認中にエラー: {str(e)}")
+        
+        result.errors.extend(errors)
+        result.warnings.extend(warnings)
+        result.missing_exports.extend(missing_exports)
+        result.is_valid = not (errors or missing_exports)
+        
+        return result
+    
+    @staticmethod
+    def _cyclic_components(adj: Dict[str, List[str]]) -> List[List[str]]:
+        """Tarjanの強連結成分分解（O(V+E)）で循環を含む成分を抽出
+        
+        要素数2以上の強連結成分と自己ループを持つノードを返す。
+        再帰の深さ制限を避けるため明示的なスタックを使用する
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        scc_stack: List[str] = []
+        components: List[List[str]] = []
+        
+        for root in adj:
+            if root in index:
+                continue
+            
+            index[root] = lowlink[root] = len(index)
+            scc_stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(adj[root]))]
+            
+            while work:
+                node, successors = work[-1]
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = len(index)
+                        scc_stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(adj[succ])))
+                        break
+                    if succ in on_stack and index[succ] < lowlink[node]:
+                        lowlink[node] = index[succ]
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        if lowlink[node] < lowlink[parent]:
+                            lowlink[parent] = lowlink[node]
+                    
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = scc_stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        
+                        if len(component) > 1 or node in adj[node]:
+                            component.reverse()
+                            components.append(component)
+        
+        return components
+    
+    def _stack_universe(self, config: Dict[str, Any]) -> Tuple[str, ...]:
+        """依存関係に現れる全スタック名を取得（依存元・依存先を出現順に重複なく）"""
+        dependencies = config.get('dependencies', {})
+        if self._stacks is not None and self._stacks[0] is dependencies:
+            return self._stacks[1]
+        
+        stacks = tuple(dict.fromkeys(chain(
+            dependencies,
+            (dep['stack_name'] for deps in dependencies.values() for dep in deps)
+        )))
+        self._stacks = (dependencies, stacks)
+        return stacks
+    
+    @staticmethod
+    def _shortest_cycle_through(node: str, adj: Dict[str, List[str]]) -> List[str]:
+        """nodeを通る最短の循環を幅優先探索で取得（nodeから始まる経路、見つからない場合は空リスト）
+        
+        訪問済み集合は探索全体で1つだけ持ち、再帰やコピーを行わない
+        """
+        parents: Dict[str, Optional[str]] = {node: None}
+        queue = deque([node])
+        
+        while queue:
+            current = queue.popleft()
+            for succ in adj[current]:
+                if succ == node:
+                    cycle = []
+                    while current is not None:
+                        cycle.append(current)
+                        current = parents[current]
+                    cycle.reverse()
+                    return cycle
+                if succ not in parents:
+                    parents[succ] = current
+                    queue.append(succ)
+        
+        return []
+    
+    @staticmethod
+    def _kahn_residual(adj: Dict[str, List[str]]) -> set:
+        """Kahnのアルゴリズムでトポロジカルソートし、取り出せずに残ったスタックを返す
+        
+        残ったスタックが空であれば依存グラフは非循環
+        """
+        indegree = dict.fromkeys(adj, 0)
+        for targets in adj.values():
+            for target in targets:
+                indegree[target] += 1
+        
+        queue = deque(node for node, degree in indegree.items() if degree == 0)
+        while queue:
+            node = queue.popleft()
+            for target in adj[node]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+        
+        return {node for node, degree in indegree.items() if degree > 0}
+    
+    def detect_circular_dependencies(self, config: Dict[str, Any]) -> List[List[str]]:
+        """循環依存関係を検出
+        
+        強連結成分分解で循環を含むスタックに絞り込んだ上で、三色DFS（WHITE/GRAY/BLACK）で
+        具体的な循環経路を列挙する。各循環は辞書順最小のスタックが先頭になるよう回転して
+        正規化し、集合で重複を除く。結果は同じ設定に対して再計算しないようキャッシュする
+        """
+        dependencies = config.get('dependencies', {})
+        if self._circular_cache is not None and self._circular_cache[0] is dependencies:
+            return self._circular_cache[1]
+        
+        # 隣接リストを一度だけ構築
+        adj: Dict[str, List[str]] = {
+            stack_name: [dep['stack_name'] for dep in dependencies.get(stack_name, ())]
+            for stack_name in self._stack_universe(config)
+        }
+        
+        # 多くの設定は非循環のため、まずKahnのトポロジカルソート（O(V+E)）で判定し、
+        # 循環がある場合のみ取り残されたスタックに絞って強連結成分分解を行う
+        residual = self._kahn_residual(adj)
+        if not residual:
+            self._circular_cache = (dependencies, [])
+            return []
+        adj = {node: [succ for succ in adj[node] if succ in residual] for node in adj if node in residual}
+        
+        # 重複判定はハッシュで行い、報告順は並行するリストで保持する
+        seen_cycles = set()
+        covered = set()
+        circular_deps: List[List[str]] = []
+        
+        def add_cycle(cycle: List[str]):
+            """循環を正規化して未登録の場合のみ追加"""
+            start = cycle.index(min(cycle))
+            key = tuple(cycle[start:] + cycle[:start])
+            if key not in seen_cycles:
+                seen_cycles.add(key)
+                covered.update(key)
+                circular_deps.append(list(key))
+        
+        WHITE, GRAY, BLACK = 0, 1, 2
+        
+        for component in self._cyclic_components(adj):
+            members = set(component)
+            sub = {node: [succ for succ in adj[node] if succ in members] for node in component}
+            color = dict.fromkeys(component, WHITE)
+            
+            # 三色DFS: GRAYのノードへの辺（後退辺）が見つかった時点の経路が循環
+            for root in component:
+                if color[root] != WHITE:
+                    continue
+                
+                color[root] = GRAY
+                path = [root]
+                position = {root: 0}
+                work = [iter(sub[root])]
+                
+                while work:
+                    for succ in work[-1]:
+                        succ_color = color[succ]
+                        if succ_color == WHITE:
+                            color[succ] = GRAY
+                            position[succ] = len(path)
+                            path.append(succ)
+                            work.append(iter(sub[succ]))
+                            break
+                        if succ_color == GRAY:
+                            add_cycle(path[position[succ]:])
+                    else:
+                        work.pop()
+                        node = path.pop()
+                        del position[node]
+                        color[node] = BLACK
+            
+            # 後退辺の経路に現れなかったスタックも、成分内の最短循環で必ず報告する
+            for node in component:
+                if node in covered:
+                    continue
+                
+                add_cycle(self._shortest_cycle_through(node, sub))
+        
+        self._circular_cache = (dependencies, circular_deps)
+        return circular_deps
+    
+    def validate_export_naming_consistency(self, config: Dict[str, Any],
+                                           stacks: Optional[Set[str]] = None) -> List[str]:
+        """エクスポート名の命名規則一貫性をチェック（stacks指定時はそのスタックのみ）"""
+        issues = []
+        stack_outputs = config.get('stack_outputs', {})
+        naming_match = self._NAMING_RE.match
+        
+        for stack_name, outputs in stack_outputs.items():
+            if stacks is not None and stack_name not in stacks:
+                continue
+            
+            for output in outputs:
+                export_name = output.get('export_name', '')
+                if not export_name:
+                    continue
+                
+                # 命名規則チェック: {ProjectName}-{Environment}-{ResourceName}
+                if not naming_match(export_name):
+                    issues.append(
+                        f"スタック '{stack_name}' のエクスポート '{output['name']}' の命名規則が不正: {export_name}"
+                    )
+        
+        return issues
+    
+    @staticmethod
+    def _index_cycles_by_stack(circular_deps: List[List[str]]) -> Dict[str, List[List[str]]]:
+        """スタック名から、そのスタックを含む循環依存関係への逆引きインデックスを構築"""
+        cycles_by_stack: Dict[str, List[List[str]]] = {}
+        for cycle in circular_deps:
+            for stack_name in cycle:
+                cycles_by_stack.setdefault(stack_name, []).append(cycle)
+        return cycles_by_stack
+    
+    @staticmethod
+    def _apply_circular_dependencies(result: ValidationResult, cycles: List[List[str]]):
+        """対象スタックを含む循環依存関係を検証結果に追加"""
+        for cycle in cycles:
+            result.circular_dependencies.extend(cycle)
+            result.errors.append(f"循環依存関係が検出されました: {' -> '.join(cycle)}")
+            result.is_valid = False
+    
+    def validate_single_stack(self, stack_name: str, config: Dict[str, Any],
+                              check_cycles: bool = False) -> ValidationResult:
+        """単一スタックを検証（対象スタックと直接の依存スタックだけをスタック名指定で取得）
+        
+        check_cyclesがTrueの場合は、対象スタックを含む循環依存関係も検証する
+        """
+        result = self.validate_stack_dependencies(stack_name, config, bulk_describe=False)
+        
+        if check_cycles:
+            cycles_by_stack = self._index_cycles_by_stack(self.detect_circular_dependencies(config))
+            self._apply_circular_dependencies(result, cycles_by_stack.get(stack_name, ()))
+        
+        return result
+    
+    def affected_stacks(self, config: Dict[str, Any], changed: List[str]) -> Set[str]:
+        """変更されたスタックと、それに推移的に依存するスタックを取得"""
+        # 依存先 -> 依存元の逆引き隣接リスト
+        dependents: Dict[str, List[str]] = {}
+        for stack_name, deps in config.get('dependencies', {}).items():
+            for dep in deps:
+                dependents.setdefault(dep['stack_name'], []).append(stack_name)
+        
+        affected = set(changed)
+        worklist = list(changed)
+        while worklist:
+            for dependent in dependents.get(worklist.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    worklist.append(dependent)
+        
+        return affected
+    
+    def validate_all_stacks(self, config: Dict[str, Any],
+                            stacks: Optional[Set[str]] = None) -> Dict[str, ValidationResult]:
+        """全スタックの依存関係を検証（stacks指定時はそのスタックのみ）
+        
+        エクスポート命名規則はスタック単位の結果に含めないため、
+        validate_export_naming_consistencyで別途検証してレポートに渡す
+        """
+        results = {}
+        
+        # 循環依存関係の検出
+        circular_deps = self.detect_circular_dependencies(config)
+        cycles_by_stack = self._index_cycles_by_stack(circular_deps)
+        
+        # 各スタックの検証
+        all_stacks = self._stack_universe(config)
+        if stacks is not None:
+            all_stacks = tuple(stack_name for stack_name in all_stacks if stack_name in stacks)
+        
+        self._prefetch_stacks(all_stacks)
+        
+        # boto3クライアントはスレッドセーフなため、API呼び出しを伴う各スタックの検証を並列に実行
+        validated = {}
+        if all_stacks:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(all_stacks))) as executor:
+                futures = {
+                    executor.submit(self.validate_stack_dependencies, stack_name, config): stack_name
+                    for stack_name in all_stacks
+                }
+                for future in as_completed(futures):
+                    validated[futures[future]] = future.result()
+        
+        for stack_name in all_stacks:
+            result = validated[stack_name]
+            
+            # 循環依存関係の情報を追加
+            self._apply_circular_dependencies(result, cycles_by_stack.get(stack_name, ()))
+            
+            results[stack_name] = result
+        
+        return results
+    
+    def _iter_report_lines(self, results: Dict[str, ValidationResult],
+                           global_warnings: Optional[List[str]] = None) -> Iterator[str]:
+        """検証レポートを1行ずつ生成"""
+        yield "=" * 80
+        yield "Cross-Stack Dependencies Validation Report"
+        yield "=" * 80
+        yield ""
+        
+        # サマリー
+        total_stacks = len(results)
+        valid_stacks = sum(1 for r in results.values() if r.is_valid)
+        invalid_stacks = total_stacks - valid_stacks
+        
+        yield f"Total Stacks: {total_stacks}"
+        yield f"Valid Stacks: {valid_stacks}"
+        yield f"Invalid Stacks: {invalid_stacks}"
+        yield ""
+        
+        # 全スタック共通の警告（エクスポート命名規則など、スタックごとに複製せず1回だけ出力）
+        if global_warnings:
+            yield "Global Warnings:"
+            for warning in global_warnings:
+                yield f"  - {warning}"
+            yield ""
+        
+        # 各スタックの詳細
+        for stack_name, result in results.items():
+            yield f"Stack: {stack_name}"
+            yield f"Status: {'✓ VALID' if result.is_valid else '✗ INVALID'}"
+            
+            if result.errors:
+                yield "  Errors:"
+                for error in result.errors:
+                    yield f"    - {error}"
+            
+            if result.warnings:
+                yield "  Warnings:"
+                for warning in result.warnings:
+                    yield f"    - {warning}"
+            
+            if result.missing_exports:
+                yield "  Missing Exports:"
+                for missing in result.missing_exports:
+                    yield f"    - {missing}"
+            
+            yield ""
+    
+    def generate_validation_report(self, results: Dict[str, ValidationResult],
+                                   global_warnings: Optional[List[str]] = None) -> str:
+        """検証レポートを生成"""
+        return "\n".join(self._iter_report_lines(results, global_warnings))
+    
+    def save_validation_report(self, results: Dict[str, ValidationResult], output_path: str,
+                               global_warnings: Optional[List[str]] = None, echo: bool = False):
+        """検証レポートをファイルに保存（レポート全体の文字列を組み立てずに逐次書き込む）
+        
+        echoがTrueの場合は、同じ行を標準出力にも書き出す（レポートの生成は1回のみ）
+        """
+        lines = self._iter_report_lines(results, global_warnings)
+        
+        # テキストモードの改行変換・書き込みごとのエンコードを避け、一定行数ごとにUTF-8へ
+        # エンコードしたバイト列をファイルディスクリプタへ直接書き込む
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            separator = ""
+            while True:
+                batch = list(islice(lines, self.REPORT_WRITE_LINES))
+                if not batch:
+                    break
+                text = separator + "\n".join(batch)
+                if echo:
+                    sys.stdout.write(text)
+                data = memoryview(text.encode('utf-8'))
+                while data:
+                    data = data[os.write(fd, data):]
+                separator = "\n"
+        finally:
+            os.close(fd)
+        
+        if echo:
+            sys.stdout.write("\n")
+        
+        print(f"Validation report saved to: {output_path}")
+
+def main():
+    """メイン処理"""
+    parser = argparse.ArgumentParser(description='Cross-Stack Dependencies Validator')
+    parser.add_argument('--config', '-c', 
+                       default='cross-stack-config.json',
+                       help='Configuration file path')
+    parser.add_argument('--region', '-r', 
+                       default='us-east-1',
+                       help='AWS region')
+    parser.add_argument('--profile', '-p',
+                       default='mame-local-wani',
+                       help='AWS profile name')
+    parser.add_argument('--output', '-o',
+                       default='validation-report.txt',
+                       help='Output report file path')
+    parser.add_argument('--stack', '-s',
+                       help='Validate specific stack only')
+    parser.add_argument('--diff',
+                       nargs='?',
+                       const=os.environ.get('CHANGED_STACKS', ''),
+                       metavar='STACKS',
+                       help='Validate only the given comma-separated changed stacks and their dependents '
+                            '(reads $CHANGED_STACKS when no value is given; '
+                            'validates all stacks when none of the names is in the configuration)')
+    parser.add_argument('--full',
+                       action='store_true',
+                       help='With --stack, also run circular dependency and export naming checks')
+    parser.add_argument('--max-retries',
+                       type=int,
+                       default=10,
+                       help='Maximum attempts for throttled AWS API calls (adaptive retry mode)')
+    
+    args = parser.parse_args()
+    
+    # 設定ファイルのパス解決
+    config_path = Path(args.config)
+    if not config_path.is_absolute():
+        if str(config_path).startswith('cf-templates/'):
+            config_path = Path(args.config)
+        else:
+            config_path = Path(__file__).parent / config_path
+    
+    if not config_path.exists():
+        print(f"Error: Configuration file not found: {config_path}")
+        sys.exit(1)
+    
+    # バリデーターを初期化
+    validator = DependencyValidator(region=args.region, profile=args.profile, max_retries=args.max_retries)
+    
+    # 設定を読み込み
+    config = validator.load_config(str(config_path))
+    
+    # 検証実行（エクスポート命名規則の問題は全体の警告としてレポートに渡す）
+    global_warnings = []
+    if args.stack:
+        # 特定スタックのみ検証（設定全体を対象とする検証は--full指定時のみ実行）
+        result = validator.validate_single_stack(args.stack, config, check_cycles=args.full)
+        if args.full:
+            global_warnings = validator.validate_export_naming_consistency(config)
+        
+        results = {args.stack: result}
+    elif args.diff is not None:
+        # 変更されたスタックとその依存元のみ検証（設定に存在しないスタック名は警告として報告）
+        changed = [name.strip() for name in args.diff.split(',') if name.strip()]
+        known_stacks = set(validator._stack_universe(config))
+        unknown = [name for name in changed if name not in known_stacks]
+        if unknown:
+            global_warnings.append(f"設定に存在しない変更スタックを無視しました: {', '.join(unknown)}")
+        changed = [name for name in changed if name in known_stacks]
+        
+        if changed:
+            stacks = validator.affected_stacks(config, changed)
+            results = validator.validate_all_stacks(config, stacks)
+            global_warnings.extend(validator.validate_export_naming_consistency(config, stacks))
+        else:
+            # 検証対象が0件のまま成功としないよう、全スタックの検証に切り替える
+            global_warnings.append("--diff に検証対象の変更スタックがないため、全スタックを検証しました")
+            results = validator.validate_all_stacks(config)
+            global_warnings.extend(validator.validate_export_naming_consistency(config))
+    else:
+        # 全スタック検証
+        results = validator.validate_all_stacks(config)
+        global_warnings = validator.validate_export_naming_consistency(config)
+    
+    # レポートを1回だけ生成し、標準出力への表示とファイルへの保存を同時に行う
+    validator.save_validation_report(results, args.output, global_warnings, echo=True)
+    
+    # 終了コード設定
+    has_errors = any(not r.is_valid for r in results.values())
+    sys.exit(1 if has_errors else 0)
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,4 +1,4 @@
-#!/usr/bin/env python3
-"""
-CI/CD Pipeline Configuration for CloudFormation Template Validation
+#!/usr/bin/env python3
+"""
+CI/CD Pipeline Configuration for CloudFormation Template Validation
 CloudFormationテンプレート検証の
\ No newline at end of file
@@ -1,619 +1,871 @@
-#!/usr/bin/env python3
-"""
-CloudFormation Template Syntax Validator
-CloudFormationテンプレートの構文検証とベストプラクティスチェック
-"""
-
-import json
-import yaml
-import sys
-import re
-from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-from dataclasses import dataclass
-import boto3
-from botocore.exceptions import ClientError
-
-
-@dataclass
-class ValidationIssue:
-    """検証問題"""
-    severity: str  # 'error', 'warning', 'info'
-    category: str  # 'syntax', 'best-practice', 'security', 'performance'
-    message: str
-    location: Optional[str] = None
-    suggestion: Optional[str] = None
-
-
-class CloudFormationValidator:
-    """CloudFormationテンプレート検証クラス"""
-    
-    def __init__(self, region: str = 'us-east-1'):
-        self.region = region
-        self.issues: List[ValidationIssue] = []
-        
-        # AWS CloudFormation クライアント（構文検証用）
-        try:
-            self.cf_client = boto3.client('cloudformation', region_name=region)
-        except Exception:
-            self.cf_client = None
-    
-    def load_template(self, template_path: str) -> Tuple[Optional[Dict[str, Any]], List[ValidationIssue]]:
-        """テンプレートファイルを読み込み"""
-        issues = []
-        
-        try:
-            with open(template_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # ファイル拡張子に基づいてパース
-            if template_path.endswith('.json'):
-                template = json.loads(content)
-            elif template_path.endswith(('.yaml', '.yml')):
-                template = yaml.safe_load(content)
-            else:
-                # 内容から推測
-                try:
-                    template = json.loads(content)
-                except json.JSONDecodeError:
-                    try:
-                        template = yaml.safe_load(content)
-                    except yaml.YAMLError as e:
-                        issues.append(ValidationIssue(
-                            severity='error',
-                            category='syntax',
-                            message=f"テンプレートの解析に失敗: {str(e)}"
-                        ))
-                        return None, issues
-            
-            return template, issues
-            
-        except FileNotFoundError:
-            issues.append(ValidationIssue(
-                severity='error',
-                category='syntax',
-                message=f"テンプレートファイルが見つかりません: {template_path}"
-            ))
-            return None, issues
-        except (json.JSONDecodeError, yaml.YAMLError) as e:
-            issues.append(ValidationIssue(
-                severity='error',
-                category='syntax',
-                message=f"テンプレートの構文エラー: {str(e)}"
-            ))
-            return None, issues
-    
-    def validate_template_structure(self, template: Dict[str, Any]) -> List[ValidationIssue]:
-        """テンプレート基本構造の検証"""
-        issues = []
-        
-        # 必須フィールドの確認
-        if 'AWSTemplateFormatVersion' not in template:
-            issues.append(ValidationIssue(
-                severity='warning',
-                category='best-practice',
-                message="AWSTemplateFormatVersionが指定されていません",
-                suggestion="'2010-09-09'を指定することを推奨します"
-            ))
-        
-        if 'Description' not in template:
-            issues.append(ValidationIssue(
-                severity='warning',
-                category='best-practice',
-                message="Descriptionが指定されていません",
-                suggestion="テンプレートの目的を説明するDescriptionを追加してください"
-            ))
-        
-        # リソースセクションの確認
-        if 'Resources' not in template:
-            issues.append(ValidationIssue(
-                severity='error',
-                category='syntax',
-                message="Resourcesセクションが必須です"
-            ))
-        elif not template['Resources']:
-            issues.append(ValidationIssue(
-                severity='error',
-                category='syntax',
-                message="Resourcesセクションが空です"
-            ))
-        
-        # 有効なセクション名の確認
-        valid_sections = {
-            'AWSTemplateFormatVersion', 'Description', 'Metadata', 'Parameters',
-            'Mappings', 'Conditions', 'Transform', 'Resources', 'Outputs'
-        }
-        
-        for section in template.keys():
-            if section not in valid_sections:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"無効なセクション名: {section}",
-                    suggestion=f"有効なセクション名: {', '.join(valid_sections)}"
-                ))
-        
-        return issues
-    
-    def validate_parameters(self, parameters: Dict[str, Any]) -> List[ValidationIssue]:
-        """パラメータセクションの検証"""
-        issues = []
-        
-        for param_name, param_config in parameters.items():
-            # パラメータ名の検証
-            if not re.match(r'^[a-zA-Z][a-zA-Z0-9]*$', param_name):
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"パラメータ名が無効: {param_name}",
-                    location=f"Parameters.{param_name}",
-                    suggestion="パラメータ名は英字で始まり、英数字のみを含む必要があります"
-                ))
-            
-            # 必須フィールドの確認
-            if 'Type' not in param_config:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"パラメータ {param_name} にTypeが指定されていません",
-                    location=f"Parameters.{param_name}"
-                ))
-            
-            # Descriptionの推奨
-            if 'Description' not in param_config:
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='best-practice',
-                    message=f"パラメータ {param_name} にDescriptionがありません",
-                    location=f"Parameters.{param_name}",
-                    suggestion="パラメータの目的を説明するDescriptionを追加してください"
-                ))
-            
-            # デフォルト値の推奨
-            param_type = param_config.get('Type', '')
-            if param_type in ['String', 'Number'] and 'Default' not in param_config:
-                issues.append(ValidationIssue(
-                    severity='info',
-                    category='best-practice',
-                    message=f"パラメータ {param_name} にデフォルト値がありません",
-                    location=f"Parameters.{param_name}",
-                    suggestion="適切なデフォルト値の設定を検討してください"
-                ))
-        
-        return issues
-    
-    def validate_resources(self, resources: Dict[str, Any]) -> List[ValidationIssue]:
-        """リソースセクションの検証"""
-        issues = []
-        
-        for resource_name, resource_config in resources.items():
-            # リソース名の検証
-            if not re.match(r'^[a-zA-Z][a-zA-Z0-9]*$', resource_name):
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"リソース名が無効: {resource_name}",
-                    location=f"Resources.{resource_name}",
-                    suggestion="リソース名は英字で始まり、英数字のみを含む必要があります"
-                ))
-            
-            # 必須フィールドの確認
-            if 'Type' not in resource_config:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"リソース {resource_name} にTypeが指定されていません",
-                    location=f"Resources.{resource_name}"
-                ))
-            
-            # リソースタイプの形式確認
-            resource_type = resource_config.get('Type', '')
-            if resource_type and not re.match(r'^[A-Z][a-zA-Z0-9]*::[A-Z][a-zA-Z0-9]*::[A-Z][a-zA-Z0-9]*$', resource_type):
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='syntax',
-                    message=f"リソースタイプの形式が疑わしい: {resource_type}",
-                    location=f"Resources.{resource_name}.Type",
-                    suggestion="リソースタイプは 'AWS::Service::ResourceType' の形式である必要があります"
-                ))
-            
-            # セキュリティ関連のチェック
-            issues.extend(self._validate_resource_security(resource_name, resource_config))
-            
-            # パフォーマンス関連のチェック
-            issues.extend(self._validate_resource_performance(resource_name, resource_config))
-        
-        return issues
-    
-    def _validate_resource_security(self, resource_name: str, resource_config: Dict[str, Any]) -> List[ValidationIssue]:
-        """リソースのセキュリティ設定検証"""
-        issues = []
-        resource_type = resource_config.get('Type', '')
-        properties = resource_config.get('Properties', {})
-        
-        # S3バケットのセキュリティチェック
-        if resource_type == 'AWS::S3::Bucket':
-            if 'PublicReadPolicy' in properties and properties['PublicReadPolicy'] == 'Allow':
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='security',
-                    message=f"S3バケット {resource_name} でパブリック読み取りが許可されています",
-                    location=f"Resources.{resource_name}.Properties.PublicReadPolicy",
-                    suggestion="セキュリティ要件を確認し、必要に応じて制限してください"
-                ))
-            
-            if 'VersioningConfiguration' not in properties:
-                issues.append(ValidationIssue(
-                    severity='info',
-                    category='best-practice',
-                    message=f"S3バケット {resource_name} でバージョニングが設定されていません",
-                    location=f"Resources.{resource_name}.Properties",
-                    suggestion="データ保護のためバージョニングの有効化を検討してください"
-                ))
-        
-        # IAMロールのセキュリティチェック
-        elif resource_type == 'AWS::IAM::Role':
-            assume_role_policy = properties.get('AssumeRolePolicyDocument', {})
-            if assume_role_policy:
-                statements = assume_role_policy.get('Statement', [])
-                for i, statement in enumerate(statements):
-                    principal = statement.get('Principal', {})
-                    if principal == '*' or (isinstance(principal, dict) and principal.get('AWS') == '*'):
-                        issues.append(ValidationIssue(
-                            severity='error',
-                            category='security',
-                            message=f"IAMロール {resource_name} で全てのプリンシパルが許可されています",
-                            location=f"Resources.{resource_name}.Properties.AssumeRolePolicyDocument.Statement[{i}].Principal",
-                            suggestion="最小権限の原則に従い、特定のプリンシパルのみを許可してください"
-                        ))
-        
-        # セキュリティグループのチェック
-        elif resource_type == 'AWS::EC2::SecurityGroup':
-            ingress_rules = properties.get('SecurityGroupIngress', [])
-            for i, rule in enumerate(ingress_rules):
-                cidr_ip = rule.get('CidrIp', '')
-                if cidr_ip == '0.0.0.0/0':
-                    from_port = rule.get('FromPort', 0)
-                    to_port = rule.get('ToPort', 0)
-                    if from_port == 22 or to_port == 22:
-                        issues.append(ValidationIssue(
-                            severity='error',
-                            category='security',
-                            message=f"セキュリティグループ {resource_name} でSSH(22)が全てのIPに開放されています",
-                            location=f"Resources.{resource_name}.Properties.SecurityGroupIngress[{i}]",
-                            suggestion="SSH接続は特定のIPアドレスからのみ許可してください"
-                        ))
-                    elif from_port == 3389 or to_port == 3389:
-                        issues.append(ValidationIssue(
-                            severity='error',
-                            category='security',
-                            message=f"セキュリティグループ {resource_name} でRDP(3389)が全てのIPに開放されています",
-                            location=f"Resources.{resource_name}.Properties.SecurityGroupIngress[{i}]",
-                            suggestion="RDP接続は特定のIPアドレスからのみ許可してください"
-                        ))
-        
-        return issues
-    
-    def _validate_resource_performance(self, resource_name: str, resource_config: Dict[str, Any]) -> List[ValidationIssue]:
-        """リソースのパフォーマンス設定検証"""
-        issues = []
-        resource_type = resource_config.get('Type', '')
-        properties = resource_config.get('Properties', {})
-        
-        # EC2インスタンスのパフォーマンスチェック
-        if resource_type == 'AWS::EC2::Instance':
-            instance_type = properties.get('InstanceType', '')
-            if instance_type.startswith('t2.') or instance_type.startswith('t3.'):
-                issues.append(ValidationIssue(
-                    severity='info',
-                    category='performance',
-                    message=f"EC2インスタンス {resource_name} でバーストパフォーマンスインスタンスが使用されています",
-                    location=f"Resources.{resource_name}.Properties.InstanceType",
-                    suggestion="継続的な高パフォーマンスが必要な場合は、他のインスタンスタイプを検討してください"
-                ))
-        
-        # RDSインスタンスのパフォーマンスチェック
-        elif resource_type == 'AWS::RDS::DBInstance':
-            if 'MultiAZ' not in properties or not properties['MultiAZ']:
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='performance',
-                    message=f"RDSインスタンス {resource_name} でMulti-AZが無効です",
-                    location=f"Resources.{resource_name}.Properties",
-                    suggestion="高可用性のためMulti-AZの有効化を検討してください"
-                ))
-        
-        return issues
-    
-    def validate_outputs(self, outputs: Dict[str, Any]) -> List[ValidationIssue]:
-        """アウトプットセクションの検証"""
-        issues = []
-        
-        for output_name, output_config in outputs.items():
-            # アウトプット名の検証
-            if not re.match(r'^[a-zA-Z][a-zA-Z0-9]*$', output_name):
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"アウトプット名が無効: {output_name}",
-                    location=f"Outputs.{output_name}",
-                    suggestion="アウトプット名は英字で始まり、英数字のみを含む必要があります"
-                ))
-            
-            # 必須フィールドの確認
-            if 'Value' not in output_config:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"アウトプット {output_name} にValueが指定されていません",
-                    location=f"Outputs.{output_name}"
-                ))
-            
-            # Descriptionの推奨
-            if 'Description' not in output_config:
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='best-practice',
-                    message=f"アウトプット {output_name} にDescriptionがありません",
-                    location=f"Outputs.{output_name}",
-                    suggestion="アウトプットの目的を説明するDescriptionを追加してください"
-                ))
-            
-            # Export名の推奨
-            if 'Export' not in output_config:
-                issues.append(ValidationIssue(
-                    severity='info',
-                    category='best-practice',
-                    message=f"アウトプット {output_name} にExportが設定されていません",
-                    location=f"Outputs.{output_name}",
-                    suggestion="クロススタック参照が必要な場合はExportを設定してください"
-                ))
-        
-        return issues
-    
-    def validate_with_aws_api(self, template: Dict[str, Any]) -> List[ValidationIssue]:
-        """AWS APIを使用したテンプレート検証"""
-        issues = []
-        
-        if not self.cf_client:
-            issues.append(ValidationIssue(
-                severity='warning',
-                category='syntax',
-                message="AWS APIクライアントが利用できません。構文検証をスキップします"
-            ))
-            return issues
-        
-        try:
-            # テンプレートをJSON文字列に変換
-            template_body = json.dumps(template, ensure_ascii=False)
-            
-            # AWS CloudFormation APIで検証
-            response = self.cf_client.validate_template(TemplateBody=template_body)
-            
-            # 成功した場合の情報
-            issues.append(ValidationIssue(
-                severity='info',
-                category='syntax',
-                message="AWS CloudFormation APIによる構文検証が成功しました"
-            ))
-            
-            # パラメータ情報の確認
-            parameters = response.get('Parameters', [])
-            if parameters:
-                param_names = [p['ParameterKey'] for p in parameters]
-                issues.append(ValidationIssue(
-                    severity='info',
-                    category='syntax',
-                    message=f"検出されたパラメータ: {', '.join(param_names)}"
-                ))
-            
-        except ClientError as e:
-            error_code = e.response['Error']['Code']
-            error_message = e.response['Error']['Message']
-            
-            if error_code == 'ValidationError':
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"AWS CloudFormation構文エラー: {error_message}"
-                ))
-            else:
-                issues.append(ValidationIssue(
-                    severity='warning',
-                    category='syntax',
-                    message=f"AWS API検証エラー ({error_code}): {error_message}"
-                ))
-        
-        return issues
-    
-    def validate_parameter_values(self, template: Dict[str, Any], parameter_values: Dict[str, Any]) -> List[ValidationIssue]:
-        """パラメータ値の妥当性検証"""
-        issues = []
-        
-        template_params = template.get('Parameters', {})
-        
-        for param_name, param_value in parameter_values.items():
-            if param_name not in template_params:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"未定義のパラメータ: {param_name}"
-                ))
-                continue
-            
-            param_config = template_params[param_name]
-            param_type = param_config.get('Type', 'String')
-            
-            # 型チェック
-            if param_type == 'Number':
-                try:
-                    float(param_value)
-                except (ValueError, TypeError):
-                    issues.append(ValidationIssue(
-                        severity='error',
-                        category='syntax',
-                        message=f"パラメータ {param_name} の値が数値ではありません: {param_value}"
-                    ))
-            
-            # 許可値チェック
-            allowed_values = param_config.get('AllowedValues', [])
-            if allowed_values and param_value not in allowed_values:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"パラメータ {param_name} の値が許可されていません: {param_value}",
-                    suggestion=f"許可値: {', '.join(map(str, allowed_values))}"
-                ))
-            
-            # パターンチェック
-            allowed_pattern = param_config.get('AllowedPattern')
-            if allowed_pattern and isinstance(param_value, str):
-                if not re.match(allowed_pattern, param_value):
-                    issues.append(ValidationIssue(
-                        severity='error',
-                        category='syntax',
-                        message=f"パラメータ {param_name} の値がパターンに一致しません: {param_value}",
-                        suggestion=f"パターン: {allowed_pattern}"
-                    ))
-            
-            # 長さチェック
-            min_length = param_config.get('MinLength')
-            max_length = param_config.get('MaxLength')
-            if isinstance(param_value, str):
-                if min_length and len(param_value) < min_length:
-                    issues.append(ValidationIssue(
-                        severity='error',
-                        category='syntax',
-                        message=f"パラメータ {param_name} の値が短すぎます: {len(param_value)} < {min_length}"
-                    ))
-                if max_length and len(param_value) > max_length:
-                    issues.append(ValidationIssue(
-                        severity='error',
-                        category='syntax',
-                        message=f"パラメータ {param_name} の値が長すぎます: {len(param_value)} > {max_length}"
-                    ))
-        
-        # 必須パラメータのチェック
-        for param_name, param_config in template_params.items():
-            if 'Default' not in param_config and param_name not in parameter_values:
-                issues.append(ValidationIssue(
-                    severity='error',
-                    category='syntax',
-                    message=f"必須パラメータが指定されていません: {param_name}"
-                ))
-        
-        return issues
-    
-    def validate_template(self, template_path: str, parameter_values: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[ValidationIssue]]:
-        """テンプレートの包括的検証"""
-        all_issues = []
-        
-        # テンプレート読み込み
-        template, load_issues = self.load_template(template_path)
-        all_issues.extend(load_issues)
-        
-        if template is None:
-            return False, all_issues
-        
-        # 構造検証
-        all_issues.extend(self.validate_template_structure(template))
-        
-        # セクション別検証
-        if 'Parameters' in template:
-            all_issues.extend(self.validate_parameters(template['Parameters']))
-        
-        if 'Resources' in template:
-            all_issues.extend(self.validate_resources(template['Resources']))
-        
-        if 'Outputs' in template:
-            all_issues.extend(self.validate_outputs(template['Outputs']))
-        
-        # AWS API検証
-        all_issues.extend(self.validate_with_aws_api(template))
-        
-        # パラメータ値検証
-        if parameter_values:
-            all_issues.extend(self.validate_parameter_values(template, parameter_values))
-        
-        # エラーがあるかチェック
-        has_errors = any(issue.severity == 'error' for issue in all_issues)
-        
-        return not has_errors, all_issues
-    
-    def generate_validation_report(self, issues: List[ValidationIssue], template_path: str) -> str:
-        """検証レポートを生成"""
-        report = []
-        report.append("=" * 80)
-        report.append("CloudFormation Template Validation Report")
-        report.append("=" * 80)
-        report.append(f"Template: {template_path}")
-        report.append("")
-        
-        # サマリー
-        errors = [i for i in issues if i.severity == 'error']
-        warnings = [i for i in issues if i.severity == 'warning']
-        infos = [i for i in issues if i.severity == 'info']
-        
-        report.append(f"Errors: {len(errors)}")
-        report.append(f"Warnings: {len(warnings)}")
-        report.append(f"Info: {len(infos)}")
-        report.append("")
-        
-        # 問題の詳細
-        for severity, icon in [('error', '✗'), ('warning', '⚠'), ('info', 'ℹ')]:
-            severity_issues = [i for i in issues if i.severity == severity]
-            if severity_issues:
-                report.append(f"{severity.upper()}S:")
-                for issue in severity_issues:
-                    report.append(f"  {icon} [{issue.category}] {issue.message}")
-                    if issue.location:
-                        report.append(f"      Location: {issue.location}")
-                    if issue.suggestion:
-                        report.append(f"      Suggestion: {issue.suggestion}")
-                    report.append("")
-        
-        return "\n".join(report)
-
-
-def main():
-    """コマンドラインインターフェース"""
-    if len(sys.argv) < 2:
-        print("Usage: python cloudformation-validator.py <template-file> [parameters-file]")
-        sys.exit(1)
-    
-    template_file = sys.argv[1]
-    parameters_file = sys.argv[2] if len(sys.argv) > 2 else None
-    
-    # パラメータ値の読み込み
-    parameter_values = None
-    if parameters_file:
-        try:
-            with open(parameters_file, 'r', encoding='utf-8') as f:
-                if parameters_file.endswith('.json'):
-                    parameter_values = json.load(f)
-                else:
-                    parameter_values = yaml.safe_load(f)
-        except Exception as e:
-            print(f"パラメータファイルの読み込みエラー: {e}")
-            sys.exit(1)
-    
-    # 検証実行
-    validator = CloudFormationValidator()
-    is_valid, issues = validator.validate_template(template_file, parameter_values)
-    
-    # レポート生成
-    report = validator.generate_validation_report(issues, template_file)
-    print(report)
-    
-    # レポートをファイルに保存
-    output_path = Path(template_file).stem + "-validation-report.txt"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(report)
-    
-    print(f"\n検証レポートを保存しました: {output_path}")
-    
-    sys.exit(0 if is_valid else 1)
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+CloudFormation Template Syntax Validator
+CloudFormationテンプレートの構文検証とベストプラクティスチェック
+"""
+
+import hashlib
+import io
+import json
+import os
+import yaml
+import sys
+import re
+from pathlib import Path
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Any, Tuple, Optional
+from dataclasses import dataclass
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 検証問題の重要度・カテゴリ（インターン済みの文字列を共有し、比較は同一性の確認で即座に一致する）
+SEVERITY_ERROR = sys.intern('error')
+SEVERITY_WARNING = sys.intern('warning')
+SEVERITY_INFO = sys.intern('info')
+CATEGORY_SYNTAX = sys.intern('syntax')
+CATEGORY_BEST_PRACTICE = sys.intern('best-practice')
+CATEGORY_SECURITY = sys.intern('security')
+CATEGORY_PERFORMANCE = sys.intern('performance')
+
+# リソースタイプ: 'AWS::Service::ResourceType' 形式
+_RESOURCE_TYPE_RE = re.compile(r'[A-Z][a-zA-Z0-9]*::[A-Z][a-zA-Z0-9]*::[A-Z][a-zA-Z0-9]*')
+
+# テンプレートの有効なセクション名
+_TEMPLATE_SECTIONS = (
+    'AWSTemplateFormatVersion', 'Description', 'Metadata', 'Parameters',
+    'Mappings', 'Conditions', 'Transform', 'Resources', 'Outputs'
+)
+_VALID_SECTIONS = frozenset(_TEMPLATE_SECTIONS)
+_VALID_SECTIONS_SUGGESTION = f"有効なセクション名: {', '.join(_TEMPLATE_SECTIONS)}"
+
+# LibYAMLが利用可能な場合はCベースのローダーを使用
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# 読み込み済みテンプレート（絶対パス -> ((mtime_ns, size), テンプレート, 内容のハッシュ)）
+# 同一プロセス内の全検証クラスで共有し、ファイルが変更されていなければ読み込みとパースを省略する
+_template_cache: Dict[str, Tuple[Tuple[int, int], Any, str]] = {}
+
+
+def _is_cfn_ident(name: Any) -> bool:
+    """論理ID（パラメータ名・リソース名・アウトプット名）として有効か: 英字で始まり英数字のみ
+    
+    ASCIIに限定すればisalpha/isalnumは[a-zA-Z]/[a-zA-Z0-9]と一致するため、正規表現を使わずに判定する
+    """
+    return (isinstance(name, str) and name.isascii() and name[:1].isalpha()
+            and (len(name) == 1 or name[1:].isalnum()))
+
+
+def _json_loads(data: bytes) -> Any:
+    """JSONを読み込み（orjsonが利用可能な場合は使用）"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaNなど標準ライブラリのみが受理する表記の扱いとエラーメッセージを従来どおりにする
+            pass
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(data: Any) -> str:
+    """JSON文字列に変換（orjsonが利用可能な場合は使用）"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # orjsonで変換できない値（64ビットを超える整数など）は標準ライブラリで変換
+            pass
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _is_resource_type(resource_type: str) -> bool:
+    """リソースタイプの形式確認（区切りの数と先頭文字で明らかな不一致を正規表現の前に除外）"""
+    return (resource_type.count('::') == 2 and resource_type[:1].isupper()
+            and _RESOURCE_TYPE_RE.fullmatch(resource_type) is not None)
+
+
+def _content_digest(content: bytes) -> str:
+    """テンプレート内容のハッシュ（検証結果キャッシュのキー）"""
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+# レポートに出力する重要度とアイコン（出力順）
+_REPORT_SEVERITIES = ((SEVERITY_ERROR, '✗'), (SEVERITY_WARNING, '⚠'), (SEVERITY_INFO, 'ℹ'))
+# レポートの各問題の行テンプレート（直前の行との改行を含む）
+_REPORT_ISSUE_LINE = "\n  {} [{}] {}".format
+_REPORT_LOCATION_LINE = "\n      Location: {}".format
+_REPORT_SUGGESTION_LINE = "\n      Suggestion: {}".format
+
+# AWS APIのエラーコード別の重要度とメッセージテンプレート（未登録のコードは既定の警告）
+_AWS_ERROR_ISSUES = {
+    'ValidationError': (SEVERITY_ERROR, "AWS CloudFormation構文エラー: {message}".format),
+}
+_AWS_ERROR_ISSUE_DEFAULT = (SEVERITY_WARNING, "AWS API検証エラー ({code}): {message}".format)
+
+
+# Python 3.10以降では__slots__付きのdataclassにしてインスタンスごとの__dict__を持たない
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class ValidationIssue:
+    """検証問題（不変。検証結果キャッシュから返すインスタンスを呼び出し元間で共有できる）"""
+    severity: str  # 'error', 'warning', 'info'
+    category: str  # 'syntax', 'best-practice', 'security', 'performance'
+    message: str
+    location: Optional[str] = None
+    suggestion: Optional[str] = None
+
+
+class CloudFormationValidator:
+    """CloudFormationテンプレート検証クラス"""
+    
+    # 検証結果キャッシュの最大件数
+    RESULT_CACHE_SIZE = 256
+    ALLOWED_VALUES_CACHE_SIZE = 1000
+    PATTERN_CACHE_SIZE = 1000
+    
+    def __init__(self, region: str = 'us-east-1', use_aws_api: bool = True):
+        self.region = region
+        # AWS APIによる構文検証を行うか（ローカルの検証のみの場合は不要）
+        self.use_aws_api = use_aws_api
+        self.issues: List[ValidationIssue] = []
+        # AWS API検証をローカル検証と並行して実行するためのスレッドプール（AWS API検証の初回実行時に作成）
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 検証結果のLRUキャッシュ（(内容のハッシュ, パラメータ値) -> (検証結果, 問題一覧)）
+        self._result_cache: "OrderedDict[Tuple[str, Any], Tuple[bool, List[ValidationIssue]]]" = OrderedDict()
+        # AllowedValuesの集合のLRUキャッシュ（id(リスト) -> (リスト, 集合)）
+        # テンプレートはキャッシュされ再検証でも同じリストが渡されるため、集合への変換は1回で済む
+        self._allowed_values_cache: "OrderedDict[int, Tuple[List[Any], Optional[frozenset]]]" = OrderedDict()
+        # コンパイル済みAllowedPatternのLRUキャッシュ（パターン文字列 -> 正規表現）
+        self._pattern_cache: "OrderedDict[str, re.Pattern]" = OrderedDict()
+        
+        # リソースタイプ別のセキュリティ・パフォーマンスチェック（タイプ -> チェック関数の一覧）
+        self._resource_checks: Dict[str, Tuple[Callable[[str, Dict[str, Any]], List[ValidationIssue]], ...]] = {
+            'AWS::S3::Bucket': (self._check_s3_bucket,),
+            'AWS::IAM::Role': (self._check_iam_role,),
+            'AWS::EC2::SecurityGroup': (self._check_security_group,),
+            'AWS::EC2::Instance': (self._check_ec2_instance,),
+            'AWS::RDS::DBInstance': (self._check_rds_instance,),
+        }
+        
+        # AWS CloudFormation クライアント（構文検証用、boto3の読み込みに時間がかかるため初回使用時に作成）
+        self.cf_client = None
+        self._cf_client_initialized = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """AWS API検証用のスレッドプールを終了"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _get_cf_client(self):
+        """CloudFormationクライアントを取得（作成できない場合はNone）"""
+        if not self._cf_client_initialized:
+            self._cf_client_initialized = True
+            try:
+                import boto3
+                self.cf_client = boto3.client('cloudformation', region_name=self.region)
+            except Exception:
+                self.cf_client = None
+        return self.cf_client
+    
+    def load_template(self, template_path: str) -> Tuple[Optional[Dict[str, Any]], List[ValidationIssue]]:
+        """テンプレートファイルを読み込み"""
+        template, issues, _ = self._load_template_with_digest(template_path)
+        return template, issues
+    
+    def _load_template_with_digest(self, template_path: str) -> Tuple[Optional[Dict[str, Any]], List[ValidationIssue], Optional[str]]:
+        """テンプレートファイルを読み込み、テンプレート・読み込み時の問題・内容のハッシュを返す
+        
+        同じファイルを変更されていない状態で再度読み込む場合は、ファイルの読み込みとパースを省略する
+        """
+        try:
+            stat = os.stat(template_path)
+        except OSError:
+            # 読み込み時の問題として報告するため、キャッシュを使わずに読み込む
+            return self._read_template(template_path)
+        
+        key = os.path.abspath(template_path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        cached = _template_cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1], [], cached[2]
+        
+        template, issues, digest = self._read_template(template_path)
+        if digest is not None:
+            _template_cache[key] = (signature, template, digest)
+        return template, issues, digest
+    
+    def _read_template(self, template_path: str) -> Tuple[Optional[Dict[str, Any]], List[ValidationIssue], Optional[str]]:
+        """テンプレートファイルを読み込んでパース"""
+        issues = []
+        
+        try:
+            with open(template_path, 'rb') as f:
+                content = f.read()
+            digest = _content_digest(content)
+                
+            # ファイル拡張子に基づいてパース
+            if template_path.endswith('.json'):
+                template = _json_loads(content)
+            elif template_path.endswith(('.yaml', '.yml')):
+                template = yaml.load(content.decode('utf-8'), Loader=_YamlLoader)
+            else:
+                # 内容から推測
+                try:
+                    template = _json_loads(content)
+                except json.JSONDecodeError:
+                    try:
+                        template = yaml.load(content.decode('utf-8'), Loader=_YamlLoader)
+                    except yaml.YAMLError as e:
+                        issues.append(ValidationIssue(
+                            severity=SEVERITY_ERROR,
+                            category=CATEGORY_SYNTAX,
+                            message=f"テンプレートの解析に失敗: {str(e)}"
+                        ))
+                        return None, issues, None
+            
+            return template, issues, digest
+            
+        except FileNotFoundError:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_ERROR,
+                category=CATEGORY_SYNTAX,
+                message=f"テンプレートファイルが見つかりません: {template_path}"
+            ))
+            return None, issues, None
+        except (json.JSONDecodeError, yaml.YAMLError) as e:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_ERROR,
+                category=CATEGORY_SYNTAX,
+                message=f"テンプレートの構文エラー: {str(e)}"
+            ))
+            return None, issues, None
+    
+    def validate_template_structure(self, template: Dict[str, Any]) -> List[ValidationIssue]:
+        """テンプレート基本構造の検証"""
+        issues = []
+        
+        # 必須フィールドの確認
+        if 'AWSTemplateFormatVersion' not in template:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_WARNING,
+                category=CATEGORY_BEST_PRACTICE,
+                message="AWSTemplateFormatVersionが指定されていません",
+                suggestion="'2010-09-09'を指定することを推奨します"
+            ))
+        
+        if 'Description' not in template:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_WARNING,
+                category=CATEGORY_BEST_PRACTICE,
+                message="Descriptionが指定されていません",
+                suggestion="テンプレートの目的を説明するDescriptionを追加してください"
+            ))
+        
+        # リソースセクションの確認
+        if 'Resources' not in template:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_ERROR,
+                category=CATEGORY_SYNTAX,
+                message="Resourcesセクションが必須です"
+            ))
+        elif not template['Resources']:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_ERROR,
+                category=CATEGORY_SYNTAX,
+                message="Resourcesセクションが空です"
+            ))
+        
+        # 有効なセクション名の確認（無効なセクションがある場合のみテンプレートの順序で報告）
+        invalid_sections = template.keys() - _VALID_SECTIONS
+        if invalid_sections:
+            for section in template:
+                if section in invalid_sections:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"無効なセクション名: {section}",
+                        suggestion=_VALID_SECTIONS_SUGGESTION
+                    ))
+        
+        return issues
+    
+    def validate_parameters(self, parameters: Dict[str, Any]) -> List[ValidationIssue]:
+        """パラメータセクションの検証"""
+        issues = []
+        
+        for param_name, param_config in parameters.items():
+            # パラメータ名の検証
+            if not _is_cfn_ident(param_name):
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"パラメータ名が無効: {param_name}",
+                    location=f"Parameters.{param_name}",
+                    suggestion="パラメータ名は英字で始まり、英数字のみを含む必要があります"
+                ))
+            
+            # 必須フィールドの確認
+            if 'Type' not in param_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"パラメータ {param_name} にTypeが指定されていません",
+                    location=f"Parameters.{param_name}"
+                ))
+            
+            # Descriptionの推奨
+            if 'Description' not in param_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_WARNING,
+                    category=CATEGORY_BEST_PRACTICE,
+                    message=f"パラメータ {param_name} にDescriptionがありません",
+                    location=f"Parameters.{param_name}",
+                    suggestion="パラメータの目的を説明するDescriptionを追加してください"
+                ))
+            
+            # デフォルト値の推奨
+            param_type = param_config.get('Type', '')
+            if param_type in ['String', 'Number'] and 'Default' not in param_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_INFO,
+                    category=CATEGORY_BEST_PRACTICE,
+                    message=f"パラメータ {param_name} にデフォルト値がありません",
+                    location=f"Parameters.{param_name}",
+                    suggestion="適切なデフォルト値の設定を検討してください"
+                ))
+        
+        return issues
+    
+    def validate_resources(self, resources: Dict[str, Any]) -> List[ValidationIssue]:
+        """リソースセクションの検証"""
+        issues = []
+        
+        for resource_name, resource_config in resources.items():
+            # リソース名の検証
+            if not _is_cfn_ident(resource_name):
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"リソース名が無効: {resource_name}",
+                    location=f"Resources.{resource_name}",
+                    suggestion="リソース名は英字で始まり、英数字のみを含む必要があります"
+                ))
+            
+            # 必須フィールドの確認
+            if 'Type' not in resource_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"リソース {resource_name} にTypeが指定されていません",
+                    location=f"Resources.{resource_name}"
+                ))
+            
+            # リソースタイプの形式確認
+            resource_type = resource_config.get('Type', '')
+            if resource_type and not _is_resource_type(resource_type):
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_WARNING,
+                    category=CATEGORY_SYNTAX,
+                    message=f"リソースタイプの形式が疑わしい: {resource_type}",
+                    location=f"Resources.{resource_name}.Type",
+                    suggestion="リソースタイプは 'AWS::Service::ResourceType' の形式である必要があります"
+                ))
+            
+            # セキュリティ・パフォーマンス関連のチェック（Type・Propertiesは上で取得したものを使い回す）
+            properties = resource_config.get('Properties', {})
+            
+            for check in self._resource_checks.get(resource_type, ()):
+                issues.extend(check(resource_name, properties))
+        
+        return issues
+    
+    def _check_s3_bucket(self, resource_name: str, properties: Dict[str, Any]) -> List[ValidationIssue]:
+        """S3バケットのセキュリティ設定検証"""
+        issues = []
+        
+        if 'PublicReadPolicy' in properties and properties['PublicReadPolicy'] == 'Allow':
+            issues.append(ValidationIssue(
+                severity=SEVERITY_WARNING,
+                category=CATEGORY_SECURITY,
+                message=f"S3バケット {resource_name} でパブリック読み取りが許可されています",
+                location=f"Resources.{resource_name}.Properties.PublicReadPolicy",
+                suggestion="セキュリティ要件を確認し、必要に応じて制限してください"
+            ))
+        
+        if 'VersioningConfiguration' not in properties:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_INFO,
+                category=CATEGORY_BEST_PRACTICE,
+                message=f"S3バケット {resource_name} でバージョニングが設定されていません",
+                location=f"Resources.{resource_name}.Properties",
+                suggestion="データ保護のためバージョニングの有効化を検討してください"
+            ))
+        
+        return issues
+    
+    def _check_iam_role(self, resource_name: str, properties: Dict[str, Any]) -> List[ValidationIssue]:
+        """IAMロールのセキュリティ設定検証"""
+        issues = []
+        
+        assume_role_policy = properties.get('AssumeRolePolicyDocument', {})
+        if assume_role_policy:
+            statements = assume_role_policy.get('Statement', [])
+            for i, statement in enumerate(statements):
+                principal = statement.get('Principal', {})
+                if principal == '*' or (isinstance(principal, dict) and principal.get('AWS') == '*'):
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SECURITY,
+                        message=f"IAMロール {resource_name} で全てのプリンシパルが許可されています",
+                        location=f"Resources.{resource_name}.Properties.AssumeRolePolicyDocument.Statement[{i}].Principal",
+                        suggestion="最小権限の原則に従い、特定のプリンシパルのみを許可してください"
+                    ))
+        
+        return issues
+    
+    def _check_security_group(self, resource_name: str, properties: Dict[str, Any]) -> List[ValidationIssue]:
+        """セキュリティグループの設定検証"""
+        issues = []
+        
+        ingress_rules = properties.get('SecurityGroupIngress', [])
+        for i, rule in enumerate(ingress_rules):
+            cidr_ip = rule.get('CidrIp', '')
+            if cidr_ip == '0.0.0.0/0':
+                from_port = rule.get('FromPort', 0)
+                to_port = rule.get('ToPort', 0)
+                if from_port == 22 or to_port == 22:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SECURITY,
+                        message=f"セキュリティグループ {resource_name} でSSH(22)が全てのIPに開放されています",
+                        location=f"Resources.{resource_name}.Properties.SecurityGroupIngress[{i}]",
+                        suggestion="SSH接続は特定のIPアドレスからのみ許可してください"
+                    ))
+                elif from_port == 3389 or to_port == 3389:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SECURITY,
+                        message=f"セキュリティグループ {resource_name} でRDP(3389)が全てのIPに開放されています",
+                        location=f"Resources.{resource_name}.Properties.SecurityGroupIngress[{i}]",
+                        suggestion="RDP接続は特定のIPアドレスからのみ許可してください"
+                    ))
+        
+        return issues
+    
+    def _check_ec2_instance(self, resource_name: str, properties: Dict[str, Any]) -> List[ValidationIssue]:
+        """EC2インスタンスのパフォーマンス設定検証"""
+        issues = []
+        
+        instance_type = properties.get('InstanceType', '')
+        if instance_type.startswith('t2.') or instance_type.startswith('t3.'):
+            issues.append(ValidationIssue(
+                severity=SEVERITY_INFO,
+                category=CATEGORY_PERFORMANCE,
+                message=f"EC2インスタンス {resource_name} でバーストパフォーマンスインスタンスが使用されています",
+                location=f"Resources.{resource_name}.Properties.InstanceType",
+                suggestion="継続的な高パフォーマンスが必要な場合は、他のインスタンスタイプを検討してください"
+            ))
+        
+        return issues
+    
+    def _check_rds_instance(self, resource_name: str, properties: Dict[str, Any]) -> List[ValidationIssue]:
+        """RDSインスタンスのパフォーマンス設定検証"""
+        issues = []
+        
+        if 'MultiAZ' not in properties or not properties['MultiAZ']:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_WARNING,
+                category=CATEGORY_PERFORMANCE,
+                message=f"RDSインスタンス {resource_name} でMulti-AZが無効です",
+                location=f"Resources.{resource_name}.Properties",
+                suggestion="高可用性のためMulti-AZの有効化を検討してください"
+            ))
+        
+        return issues
+    
+    def validate_outputs(self, outputs: Dict[str, Any]) -> List[ValidationIssue]:
+        """アウトプットセクションの検証"""
+        issues = []
+        
+        for output_name, output_config in outputs.items():
+            # アウトプット名の検証
+            if not _is_cfn_ident(output_name):
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"アウトプット名が無効: {output_name}",
+                    location=f"Outputs.{output_name}",
+                    suggestion="アウトプット名は英字で始まり、英数字のみを含む必要があります"
+                ))
+            
+            # 必須フィールドの確認
+            if 'Value' not in output_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"アウトプット {output_name} にValueが指定されていません",
+                    location=f"Outputs.{output_name}"
+                ))
+            
+            # Descriptionの推奨
+            if 'Description' not in output_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_WARNING,
+                    category=CATEGORY_BEST_PRACTICE,
+                    message=f"アウトプット {output_name} にDescriptionがありません",
+                    location=f"Outputs.{output_name}",
+                    suggestion="アウトプットの目的を説明するDescriptionを追加してください"
+                ))
+            
+            # Export名の推奨
+            if 'Export' not in output_config:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_INFO,
+                    category=CATEGORY_BEST_PRACTICE,
+                    message=f"アウトプット {output_name} にExportが設定されていません",
+                    location=f"Outputs.{output_name}",
+                    suggestion="クロススタック参照が必要な場合はExportを設定してください"
+                ))
+        
+        return issues
+    
+    def validate_with_aws_api(self, template: Dict[str, Any]) -> List[ValidationIssue]:
+        """AWS APIを使用したテンプレート検証"""
+        issues = []
+        
+        cf_client = self._get_cf_client()
+        if not cf_client:
+            issues.append(ValidationIssue(
+                severity=SEVERITY_WARNING,
+                category=CATEGORY_SYNTAX,
+                message="AWS APIクライアントが利用できません。構文検証をスキップします"
+            ))
+            return issues
+        
+        from botocore.exceptions import ClientError
+        
+        try:
+            # テンプレートをJSON文字列に変換
+            template_body = _json_dumps(template)
+            
+            # AWS CloudFormation APIで検証
+            response = cf_client.validate_template(TemplateBody=template_body)
+            
+            # 成功した場合の情報
+            issues.append(ValidationIssue(
+                severity=SEVERITY_INFO,
+                category=CATEGORY_SYNTAX,
+                message="AWS CloudFormation APIによる構文検証が成功しました"
+            ))
+            
+            # パラメータ情報の確認
+            parameters = response.get('Parameters', [])
+            if parameters:
+                param_names = [p['ParameterKey'] for p in parameters]
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_INFO,
+                    category=CATEGORY_SYNTAX,
+                    message=f"検出されたパラメータ: {', '.join(param_names)}"
+                ))
+            
+        except ClientError as e:
+            error = e.response['Error']
+            error_code = error['Code']
+            severity, message = _AWS_ERROR_ISSUES.get(error_code, _AWS_ERROR_ISSUE_DEFAULT)
+            issues.append(ValidationIssue(
+                severity=severity,
+                category=CATEGORY_SYNTAX,
+                message=message(code=error_code, message=error['Message'])
+            ))
+        
+        return issues
+    
+    def validate_parameter_values(self, template: Dict[str, Any], parameter_values: Dict[str, Any]) -> List[ValidationIssue]:
+        """パラメータ値の妥当性検証"""
+        issues = []
+        
+        template_params = template.get('Parameters', {})
+        supplied_count = 0
+        
+        for param_name, param_value in parameter_values.items():
+            param_config = template_params.get(param_name)
+            if param_config is None and param_name not in template_params:
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"未定義のパラメータ: {param_name}"
+                ))
+                continue
+            
+            supplied_count += 1
+            param_type = param_config.get('Type', 'String')
+            
+            # 型チェック
+            if param_type == 'Number':
+                try:
+                    float(param_value)
+                except (ValueError, TypeError):
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"パラメータ {param_name} の値が数値ではありません: {param_value}"
+                    ))
+            
+            # 許可値チェック
+            allowed_values = param_config.get('AllowedValues', [])
+            if allowed_values and not self._is_allowed_value(param_value, allowed_values):
+                issues.append(ValidationIssue(
+                    severity=SEVERITY_ERROR,
+                    category=CATEGORY_SYNTAX,
+                    message=f"パラメータ {param_name} の値が許可されていません: {param_value}",
+                    suggestion=f"許可値: {', '.join(map(str, allowed_values))}"
+                ))
+            
+            # パターンチェック
+            is_str = isinstance(param_value, str)
+            allowed_pattern = param_config.get('AllowedPattern')
+            if allowed_pattern and is_str:
+                if not self._compiled_pattern(allowed_pattern).match(param_value):
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"パラメータ {param_name} の値がパターンに一致しません: {param_value}",
+                        suggestion=f"パターン: {allowed_pattern}"
+                    ))
+            
+            # 長さチェック
+            min_length = param_config.get('MinLength')
+            max_length = param_config.get('MaxLength')
+            if is_str:
+                if min_length and len(param_value) < min_length:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"パラメータ {param_name} の値が短すぎます: {len(param_value)} < {min_length}"
+                    ))
+                if max_length and len(param_value) > max_length:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"パラメータ {param_name} の値が長すぎます: {len(param_value)} > {max_length}"
+                    ))
+        
+        # 必須パラメータのチェック（全パラメータが指定済みの場合は走査を省略）
+        if supplied_count < len(template_params):
+            for param_name, param_config in template_params.items():
+                if 'Default' not in param_config and param_name not in parameter_values:
+                    issues.append(ValidationIssue(
+                        severity=SEVERITY_ERROR,
+                        category=CATEGORY_SYNTAX,
+                        message=f"必須パラメータが指定されていません: {param_name}"
+                    ))
+        
+        return issues
+    
+    def _compiled_pattern(self, pattern: str) -> "re.Pattern":
+        """AllowedPatternをコンパイル（同じパターンはキャッシュから返す）"""
+        compiled = self._pattern_cache.get(pattern)
+        if compiled is not None:
+            self._pattern_cache.move_to_end(pattern)
+            return compiled
+        
+        compiled = re.compile(pattern)
+        self._pattern_cache[pattern] = compiled
+        if len(self._pattern_cache) > self.PATTERN_CACHE_SIZE:
+            self._pattern_cache.popitem(last=False)
+        return compiled
+    
+    def _is_allowed_value(self, value: Any, allowed_values: Any) -> bool:
+        """値がAllowedValuesに含まれるか（リストは集合に変換して判定）"""
+        value_set = self._allowed_value_set(allowed_values) if isinstance(allowed_values, list) else None
+        if value_set is not None:
+            try:
+                return value in value_set
+            except TypeError:
+                pass  # ハッシュ化できない値はリストで判定
+        return value in allowed_values
+    
+    def _allowed_value_set(self, allowed_values: List[Any]) -> Optional[frozenset]:
+        """AllowedValuesのリストに対応する集合（ハッシュ化できない値を含む場合はNone）"""
+        key = id(allowed_values)
+        cached = self._allowed_values_cache.get(key)
+        if cached is not None and cached[0] is allowed_values:
+            self._allowed_values_cache.move_to_end(key)
+            return cached[1]
+        
+        try:
+            value_set = frozenset(allowed_values)
+        except TypeError:
+            value_set = None
+        
+        # キャッシュがリストへの参照を保持するため、エントリが残っている間はidが再利用されない
+        self._allowed_values_cache[key] = (allowed_values, value_set)
+        if len(self._allowed_values_cache) > self.ALLOWED_VALUES_CACHE_SIZE:
+            self._allowed_values_cache.popitem(last=False)
+        return value_set
+    
+    def validate_template(self, template_path: str, parameter_values: Optional[Dict[str, Any]] = None) -> Tuple[bool, List[ValidationIssue]]:
+        """テンプレートの包括的検証"""
+        all_issues = []
+        
+        # テンプレート読み込み
+        template, load_issues, digest = self._load_template_with_digest(template_path)
+        all_issues.extend(load_issues)
+        
+        if template is None:
+            return False, all_issues
+        
+        # 同じ内容・同じパラメータ値の検証結果があれば再利用（AWS API検証も省略）
+        cache_key = self._result_cache_key(digest, parameter_values)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached[0], list(cached[1])
+        
+        # AWS API検証はネットワーク待ちのため、ローカルの検証と並行してバックグラウンドで実行
+        aws_future = None
+        if self.use_aws_api:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+            aws_future = self._executor.submit(self.validate_with_aws_api, template)
+        
+        # 構造検証
+        all_issues.extend(self.validate_template_structure(template))
+        
+        # セクション別検証
+        if 'Parameters' in template:
+            all_issues.extend(self.validate_parameters(template['Parameters']))
+        
+        if 'Resources' in template:
+            all_issues.extend(self.validate_resources(template['Resources']))
+        
+        if 'Outputs' in template:
+            all_issues.extend(self.validate_outputs(template['Outputs']))
+        
+        # パラメータ値検証
+        parameter_issues = []
+        if parameter_values:
+            parameter_issues = self.validate_parameter_values(template, parameter_values)
+        
+        # AWS API検証の完了を待って結果を追加
+        if aws_future is not None:
+            all_issues.extend(aws_future.result())
+        all_issues.extend(parameter_issues)
+        
+        # エラーがあるかチェック
+        has_errors = any(issue.severity == SEVERITY_ERROR for issue in all_issues)
+        
+        if cache_key is not None:
+            self._result_cache[cache_key] = (not has_errors, list(all_issues))
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        
+        return not has_errors, all_issues
+    
+    @staticmethod
+    def _result_cache_key(digest: Optional[str], parameter_values: Optional[Dict[str, Any]]) -> Optional[Tuple[str, Any]]:
+        """検証結果キャッシュのキー（パラメータ値がハッシュ化できない場合はNoneでキャッシュしない）"""
+        if digest is None:
+            return None
+        try:
+            return digest, frozenset(parameter_values.items()) if parameter_values else None
+        except TypeError:
+            return None
+    
+    def generate_validation_report(self, issues: List[ValidationIssue], template_path: str) -> str:
+        """検証レポートを生成"""
+        # 重要度ごとに1回の走査で振り分け
+        buckets: Dict[str, List[ValidationIssue]] = {severity: [] for severity, _ in _REPORT_SEVERITIES}
+        for issue in issues:
+            bucket = buckets.get(issue.severity)
+            if bucket is not None:
+                bucket.append(issue)
+        
+        # 各行は直前の行との改行を先頭に付けてバッファへ直接書き込む
+        buffer = io.StringIO()
+        write = buffer.write
+        write("=" * 80)
+        write("\nCloudFormation Template Validation Report\n")
+        write("=" * 80)
+        write(f"\nTemplate: {template_path}\n")
+        
+        # サマリー
+        write(f"\nErrors: {len(buckets[SEVERITY_ERROR])}")
+        write(f"\nWarnings: {len(buckets[SEVERITY_WARNING])}")
+        write(f"\nInfo: {len(buckets[SEVERITY_INFO])}\n")
+        
+        # 問題の詳細
+        for severity, icon in _REPORT_SEVERITIES:
+            severity_issues = buckets[severity]
+            if severity_issues:
+                write(f"\n{severity.upper()}S:")
+                for issue in severity_issues:
+                    write(_REPORT_ISSUE_LINE(icon, issue.category, issue.message))
+                    if issue.location:
+                        write(_REPORT_LOCATION_LINE(issue.location))
+                    if issue.suggestion:
+                        write(_REPORT_SUGGESTION_LINE(issue.suggestion))
+                    write("\n")
+        
+        return buffer.getvalue()
+
+def main():
+    """コマンドラインインターフェース"""
+    if len(sys.argv) < 2:
+        print("Usage: python cloudformation-validator.py <template-file> [parameters-file]")
+        sys.exit(1)
+    
+    template_file = sys.argv[1]
+    parameters_file = sys.argv[2] if len(sys.argv) > 2 else None
+    
+    # パラメータ値の読み込み
+    parameter_values = None
+    if parameters_file:
+        try:
+            with open(parameters_file, 'rb') as f:
+                content = f.read()
+            if parameters_file.endswith('.json'):
+                parameter_values = _json_loads(content)
+            else:
+                parameter_values = yaml.load(content.decode('utf-8'), Loader=_YamlLoader)
+        except Exception as e:
+            print(f"パラメータファイルの読み込みエラー: {e}")
+            sys.exit(1)
+    
+    # 検証実行
+    with CloudFormationValidator(use_aws_api=True) as validator:
+        is_valid, issues = validator.validate_template(template_file, parameter_values)
+    
+    # レポート生成
+    report = validator.generate_validation_report(issues, template_file)
+    print(report)
+    
+    # レポートをファイルに保存
+    output_path = Path(template_file).stem + "-validation-report.txt"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(report)
+    
+    print(f"\n検証レポートを保存しました: {output_path}")
+    
+    sys.exit(0 if is_valid else 1)
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+Test Suite for Cross-Stack Utilities
+クロススタック用ユーティリティ（cf-templates/utilities）のテスト
+"""
+
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+# テスト対象のユーティリティはファイル名にハイフンを含むため、パスを指定して読み込む
+_UTILITIES_DIR = Path(__file__).parent.parent
+
+# テンプレート検証のテスト用の最小限のテンプレート
+_MINIMAL_TEMPLATE = """AWSTemplateFormatVersion: '2010-09-09'
+Description: Minimal template
+Resources:
+  Topic:
+    Type: AWS::SNS::Topic
+"""
+
+
+def _load_utility(filename: str, module_name: str):
+    """ユーティリティスクリプトをモジュールとして読み込み"""
+    spec = importlib.util.spec_from_file_location(module_name, _UTILITIES_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+validate_config = _load_utility('validate-config.py', 'validate_config')
+update_outputs = _load_utility('update-outputs.py', 'update_outputs')
+parameter_processor = _load_utility('parameter-processor/parameter-processor.py', 'parameter_processor')
+cloudformation_validator = _load_utility('validation/cloudformation-validator.py', 'cloudformation_validator')
+
+try:
+    validate_dependencies = _load_utility('validate-dependencies.py', 'validate_dependencies')
+except ImportError:
+    # boto3がインストールされていない環境では依存関係検証のテストをスキップ
+    validate_dependencies = None
+
+try:
+    parameter_validator = _load_utility('validation/parameter-validator.py', 'parameter_validator')
+except ImportError:
+    # jsonschemaがインストールされていない環境ではパラメータ検証のテストをスキップ
+    parameter_validator = None
+
+
+def _dependencies(edges):
+    """(依存元, 依存先) の組から依存関係の設定を作成"""
+    dependencies = {}
+    for stack_name, dep_stack in edges:
+        dependencies.setdefault(stack_name, []).append({'stack_name': dep_stack, 'required_outputs': []})
+    return dependencies
+
+
+class TestConfigValidatorCircularDependencies(unittest.TestCase):
+    """設定ファイル検証の循環依存検出のテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.validator = validate_config.ConfigValidator()
+
+    def assert_real_cycles(self, cycles, edges):
+        """各循環が先頭に戻る経路で、実在する依存関係だけをたどっていることを確認"""
+        edge_set = set(edges)
+        for cycle in cycles:
+            self.assertEqual(cycle[0], cycle[-1], f"循環の先頭に戻っていません: {cycle}")
+            for stack_name, dep_stack in zip(cycle, cycle[1:]):
+                self.assertIn((stack_name, dep_stack), edge_set, f"存在しない依存関係を含む循環: {cycle}")
+
+    def test_no_cycle(self):
+        """循環のない依存関係のテスト"""
+        edges = [('A', 'B'), ('B', 'C'), ('A', 'C')]
+        self.assertEqual(self.validator.detect_circular_dependencies(_dependencies(edges)), [])
+
+    def test_self_reference(self):
+        """自己参照のテスト"""
+        cycles = self.validator.detect_circular_dependencies(_dependencies([('A', 'A')]))
+        self.assertEqual(cycles, [['A', 'A']])
+
+    def test_two_cycles_sharing_a_stack(self):
+        """1つのスタックを共有する2つの循環のテスト（A -> B -> A と A -> C -> A）"""
+        edges = [('A', 'B'), ('A', 'C'), ('B', 'A'), ('C', 'A')]
+        cycles = self.validator.detect_circular_dependencies(_dependencies(edges))
+
+        self.assert_real_cycles(cycles, edges)
+        self.assertEqual({stack for cycle in cycles for stack in cycle}, {'A', 'B', 'C'})
+        self.assertEqual(cycles, [['A', 'B', 'A'], ['C', 'A', 'C']])
+
+    def test_cycle_report(self):
+        """循環依存のエラーメッセージが実在する経路を表示することのテスト"""
+        config = {
+            'stack_outputs': {},
+            'dependencies': _dependencies([('A', 'B'), ('A', 'C'), ('B', 'A'), ('C', 'A')])
+        }
+
+        self.assertFalse(self.validator.validate_all(config))
+        cycle_errors = [error for error in self.validator.errors if '循環依存関係' in error]
+        self.assertEqual(cycle_errors, [
+            "循環依存関係が検出されました: A -> B -> A",
+            "循環依存関係が検出されました: C -> A -> C",
+        ])
+
+
+class _FakeCloudFormationClient:
+    """describe_stacksだけを持つCloudFormationクライアントの代替"""
+
+    def __init__(self, stacks):
+        from botocore.exceptions import ClientError
+        self.exceptions = mock.Mock(ClientError=ClientError)
+        self.stacks = stacks
+
+    def describe_stacks(self, StackName):
+        if StackName not in self.stacks:
+            raise self.exceptions.ClientError(
+                {'Error': {'Code': 'ValidationError', 'Message': f"Stack with id {StackName} does not exist"}},
+                'DescribeStacks'
+            )
+        return {'Stacks': [self.stacks[StackName]]}
+
+    def get_paginator(self, operation_name):
+        paginator = mock.Mock()
+        paginator.paginate.return_value = [{'Stacks': list(self.stacks.values())}]
+        return paginator
+
+
+def _deployed_stacks(stack_names):
+    """デプロイ済みスタックのdescribe_stacksの結果を作成"""
+    return {
+        stack_name: {'StackName': stack_name, 'StackStatus': 'CREATE_COMPLETE', 'Outputs': []}
+        for stack_name in stack_names
+    }
+
+
+@unittest.skipIf(validate_dependencies is None, "boto3がインストールされていません")
+class TestDependencyValidatorCircularDependencies(unittest.TestCase):
+    """依存関係検証の循環依存検出のテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        with mock.patch.object(validate_dependencies.boto3, 'Session'):
+            self.validator = validate_dependencies.DependencyValidator()
+        self.validator.cf_client = _FakeCloudFormationClient(_deployed_stacks('ABCD'))
+
+    def assert_real_cycles(self, cycles, edges):
+        """各循環が実在する依存関係だけをたどって先頭に戻ることを確認"""
+        edge_set = set(edges)
+        for cycle in cycles:
+            for stack_name, dep_stack in zip(cycle, cycle[1:] + cycle[:1]):
+                self.assertIn((stack_name, dep_stack), edge_set, f"存在しない依存関係を含む循環: {cycle}")
+
+    def test_no_cycle(self):
+        """循環のない依存関係のテスト"""
+        config = {'dependencies': _dependencies([('A', 'B'), ('B', 'C'), ('A', 'C')])}
+        self.assertEqual(self.validator.detect_circular_dependencies(config), [])
+
+    def test_two_cycles_sharing_a_stack(self):
+        """1つのスタックを共有する2つの循環のテスト（A -> B -> A と A -> C -> A）"""
+        edges = [('A', 'B'), ('A', 'C'), ('B', 'A'), ('C', 'A'), ('D', 'A')]
+        cycles = self.validator.detect_circular_dependencies({'dependencies': _dependencies(edges)})
+
+        self.assert_real_cycles(cycles, edges)
+        self.assertEqual(cycles, [['A', 'B'], ['A', 'C']])
+
+    def test_every_stack_in_a_cycle_is_reported(self):
+        """強連結成分内の全スタックが、いずれかの循環として報告されることのテスト"""
+        edges = [('A', 'B'), ('B', 'C'), ('C', 'A'), ('B', 'D'), ('D', 'B'), ('C', 'D')]
+        cycles = self.validator.detect_circular_dependencies({'dependencies': _dependencies(edges)})
+
+        self.assert_real_cycles(cycles, edges)
+        self.assertEqual({stack for cycle in cycles for stack in cycle}, {'A', 'B', 'C', 'D'})
+        self.assertEqual(len(cycles), len({tuple(cycle) for cycle in cycles}))
+
+    def test_cycle_errors_per_stack(self):
+        """循環に含まれるスタックにだけ循環依存のエラーが報告されることのテスト"""
+        config = {
+            'stack_outputs': {},
+            'dependencies': _dependencies([('A', 'B'), ('A', 'C'), ('B', 'A'), ('C', 'A'), ('D', 'A')])
+        }
+
+        results = self.validator.validate_all_stacks(config)
+
+        self.assertEqual(results['A'].errors, [
+            "循環依存関係が検出されました: A -> B",
+            "循環依存関係が検出されました: A -> C",
+        ])
+        self.assertEqual(results['B'].errors, ["循環依存関係が検出されました: A -> B"])
+        self.assertTrue(results['D'].is_valid)
+
+
+@unittest.skipIf(validate_dependencies is None, "boto3がインストールされていません")
+class TestDependencyValidatorDiffMode(unittest.TestCase):
+    """依存関係検証の--diff指定時のテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.config_path = os.path.join(self.temp_dir, "cross-stack-config.json")
+        self.report_path = os.path.join(self.temp_dir, "validation-report.txt")
+        config = {
+            'stack_outputs': {},
+            'dependencies': _dependencies([('app', 'network'), ('monitoring', 'app'), ('storage', 'security')])
+        }
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def run_main(self, *args, changed_stacks=None):
+        """コマンドラインから実行した場合と同様にmainを実行し、(終了コード, 出力) を返す"""
+        session = mock.Mock()
+        session.client.return_value = _FakeCloudFormationClient(
+            _deployed_stacks(['network', 'app', 'monitoring', 'security', 'storage'])
+        )
+        environ = {} if changed_stacks is None else {'CHANGED_STACKS': changed_stacks}
+        argv = ['validate-dependencies.py', '--config', self.config_path, '--output', self.report_path, *args]
+        output = StringIO()
+
+        with mock.patch.object(validate_dependencies.boto3, 'Session', return_value=session), \
+                mock.patch.dict(os.environ, environ), mock.patch.object(sys, 'argv', argv), \
+                redirect_stdout(output):
+            if changed_stacks is None:
+                os.environ.pop('CHANGED_STACKS', None)
+            with self.assertRaises(SystemExit) as cm:
+                validate_dependencies.main()
+
+        return cm.exception.code, output.getvalue()
+
+    def test_changed_stack_and_dependents(self):
+        """変更されたスタックとその依存元だけが検証されることのテスト"""
+        code, output = self.run_main('--diff', 'app')
+
+        self.assertEqual(code, 0)
+        self.assertIn("Total Stacks: 2", output)
+        self.assertIn("Stack: app", output)
+        self.assertIn("Stack: monitoring", output)
+        self.assertNotIn("Stack: storage", output)
+
+    def test_changed_stacks_from_environment(self):
+        """値を省略した場合は$CHANGED_STACKSのスタックが検証されることのテスト"""
+        code, output = self.run_main('--diff', changed_stacks='monitoring')
+
+        self.assertEqual(code, 0)
+        self.assertIn("Total Stacks: 1", output)
+        self.assertIn("Stack: monitoring", output)
+
+    def test_unknown_stacks_are_reported(self):
+        """設定に存在しないスタック名が警告として報告されることのテスト"""
+        code, output = self.run_main('--diff', 'app,typo')
+
+        self.assertEqual(code, 0)
+        self.assertIn("設定に存在しない変更スタックを無視しました: typo", output)
+        self.assertIn("Total Stacks: 2", output)
+
+    def test_empty_changed_stacks_fall_back_to_full_run(self):
+        """$CHANGED_STACKSが空・未設定の場合は全スタックを検証することのテスト"""
+        for changed_stacks in ('', None):
+            with self.subTest(changed_stacks=changed_stacks):
+                code, output = self.run_main('--diff', changed_stacks=changed_stacks)
+
+                self.assertEqual(code, 0)
+                self.assertIn("--diff に検証対象の変更スタックがないため、全スタックを検証しました", output)
+                self.assertIn("Total Stacks: 5", output)
+
+    def test_only_unknown_stacks_fall_back_to_full_run(self):
+        """全てのスタック名が設定に存在しない場合は全スタックを検証することのテスト"""
+        code, output = self.run_main('--diff', 'typo')
+
+        self.assertEqual(code, 0)
+        self.assertIn("設定に存在しない変更スタックを無視しました: typo", output)
+        self.assertIn("Total Stacks: 5", output)
+
+
+@unittest.skipIf(parameter_validator is None, "jsonschemaがインストールされていません")
+class TestParameterValidatorSchema(unittest.TestCase):
+    """パラメータ検証のJSONスキーマ検証のテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.schema_path = os.path.join(self.temp_dir, "config-schema.json")
+        self.write_schema({
+            "type": "object",
+            "required": ["projectName", "environment"],
+            "properties": {"projectName": {"type": "string"}, "environment": {"enum": ["dev", "prod"]}}
+        })
+        self.validator = parameter_validator.ParameterValidator()
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_schema(self, schema):
+        """スキーマファイルを書き出し"""
+        with open(self.schema_path, 'w', encoding='utf-8') as f:
+            json.dump(schema, f)
+
+    def test_all_errors_are_reported(self):
+        """最初のエラーで止まらず全てのスキーマエラーが報告されることのテスト"""
+        errors = self.validator.validate_json_config_schema({'projectName': 1, 'environment': 'stg'}, self.schema_path)
+
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all(error.startswith("スキーマ検証エラー: ") for error in errors))
+
+    def test_valid_config(self):
+        """スキーマに適合する設定ではエラーがないことのテスト"""
+        errors = self.validator.validate_json_config_schema({'projectName': 'app', 'environment': 'dev'}, self.schema_path)
+        self.assertEqual(errors, [])
+
+    def test_updated_schema_is_reloaded(self):
+        """スキーマファイルが更新された場合は新しいスキーマで検証されることのテスト"""
+        config = {'projectName': 'app'}
+        self.assertEqual(len(self.validator.validate_json_config_schema(config, self.schema_path)), 1)
+
+        self.write_schema({"type": "object", "required": ["projectName"]})
+        self.assertEqual(self.validator.validate_json_config_schema(config, self.schema_path), [])
+
+    def test_missing_schema(self):
+        """スキーマファイルが存在しない場合のテスト"""
+        missing_path = os.path.join(self.temp_dir, "missing.json")
+        errors = self.validator.validate_json_config_schema({}, missing_path)
+        self.assertEqual(errors, [f"スキーマファイルが見つかりません: {missing_path}"])
+
+
+class TestParameterProcessorResultCache(unittest.TestCase):
+    """パラメータ処理結果のキャッシュのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.temp_dir, 'project-config-schema.json'), 'w', encoding='utf-8') as f:
+            json.dump({"type": "object"}, f)
+        self.processor = parameter_processor.ParameterProcessor(self.temp_dir)
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def process(self, name, config):
+        """設定ファイルを書き出して処理し、生成されたパラメータを返す"""
+        config_path = os.path.join(self.temp_dir, f"{name}.json")
+        output_path = os.path.join(self.temp_dir, f"{name}-cf-parameters.json")
+        with open(config_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+
+        success, messages = self.processor.process_config_file(config_path, output_path)
+        self.assertTrue(success, messages)
+        with open(output_path, encoding='utf-8') as f:
+            return {param['ParameterKey']: param['ParameterValue'] for param in json.load(f)}
+
+    def test_tag_order_does_not_leak_between_files(self):
+        """タグの順序だけが異なる設定ファイルで同じパラメータが生成されることのテスト"""
+        first = self.process('first', {'projectConfig': {'tags': {'Owner': 'team', 'Environment': 'dev'}}})
+        second = self.process('second', {'projectConfig': {'tags': {'Environment': 'dev', 'Owner': 'team'}}})
+
+        self.assertEqual(first['ResourceTags'], 'Environment=dev,Owner=team')
+        self.assertEqual(second, first)
+
+    def test_invalid_results_are_not_shared(self):
+        """検証エラーはキーの順序が異なる設定ファイル間で共有されないことのテスト"""
+        with open(os.path.join(self.temp_dir, 'project-config-schema.json'), 'w', encoding='utf-8') as f:
+            json.dump({"type": "object", "additionalProperties": False}, f)
+        self.processor = parameter_processor.ParameterProcessor(self.temp_dir)
+
+        config = {'a': 1, 'b': 2}
+        canonical_key = parameter_processor._canonical_digest(config)
+        self.processor._process_cached(b'raw', json.dumps(config).encode('utf-8'))
+        self.assertNotIn(canonical_key, self.processor._results)
+
+
+class TestCloudFormationValidatorAwsApiSwitch(unittest.TestCase):
+    """テンプレート検証のAWS API検証の切り替えのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.template_path = os.path.join(self.temp_dir, "template.yaml")
+        with open(self.template_path, 'w', encoding='utf-8') as f:
+            f.write(_MINIMAL_TEMPLATE)
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def validate(self, use_aws_api):
+        """AWS API検証の呼び出しを記録しながらテンプレートを検証"""
+        aws_calls = []
+        with cloudformation_validator.CloudFormationValidator(use_aws_api=use_aws_api) as validator:
+            validator.validate_with_aws_api = lambda template: aws_calls.append(template) or []
+            is_valid, _ = validator.validate_template(self.template_path)
+            executor_created = validator._executor is not None
+        return is_valid, aws_calls, executor_created, validator
+
+    def test_aws_api_disabled(self):
+        """use_aws_api=FalseではAWS API検証を行わないことのテスト"""
+        is_valid, aws_calls, executor_created, validator = self.validate(use_aws_api=False)
+
+        self.assertTrue(is_valid)
+        self.assertEqual(aws_calls, [])
+        self.assertFalse(executor_created)
+        self.assertFalse(validator._cf_client_initialized)
+
+    def test_aws_api_enabled(self):
+        """use_aws_api=True（既定値）ではAWS API検証を行うことのテスト"""
+        is_valid, aws_calls, executor_created, _ = self.validate(use_aws_api=True)
+
+        self.assertTrue(is_valid)
+        self.assertEqual(len(aws_calls), 1)
+        self.assertTrue(executor_created)
+
+
+class TestCloudFormationValidatorParameterValues(unittest.TestCase):
+    """テンプレート検証のパラメータ値検証のテスト"""
+
+    def test_allowed_values_suggestion(self):
+        """許可されていない値の問題に許可値の改善案が含まれることのテスト"""
+        template = {'Parameters': {'Environment': {'Type': 'String', 'AllowedValues': ['dev', 'prod']}}}
+        validator = cloudformation_validator.CloudFormationValidator(use_aws_api=False)
+
+        issues = validator.validate_parameter_values(template, {'Environment': 'stg'})
+
+        self.assertEqual([issue.suggestion for issue in issues], ["許可値: dev, prod"])
+
+
+class TestUpdateOutputsTemplateLoading(unittest.TestCase):
+    """テンプレート更新スクリプトのYAML読み込みのテスト"""
+
+    def setUp(self):
+        """テストセットアップ"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.template_path = os.path.join(self.temp_dir, "template.yaml")
+
+    def tearDown(self):
+        """テストクリーンアップ"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @unittest.skipIf(update_outputs._round_trip_yaml() is None, "ruamel.yamlがインストールされていません")
+    def test_duplicate_keys_last_wins(self):
+        """重複キーがPyYAMLと同じく後勝ちで読み込まれることのテスト"""
+        content = "Description: first\nOutputs:\n  A: 1\n  A: 2\nDescription: second\n"
+        with open(self.template_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+        template = update_outputs._load_template(self.template_path)
+
+        yaml, loader, _ = update_outputs._safe_yaml()
+        self.assertEqual(template, yaml.load(content, Loader=loader))
+        self.assertEqual(list(template), ['Description', 'Outputs'])
+        self.assertEqual(template['Outputs']['A'], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()